@@ -19,3 +19,14 @@ timeout = 25
 
 # Load app pre-fork to save memory and worker startup time
 preload_app = True
+
+
+def post_worker_init(worker):
+    # Start building the search autocomplete index (in the background) when each worker starts,
+    # rather than on its first request
+    from ons_alpha.search.autocomplete import get_prefix_index  # pylint: disable=import-outside-toplevel
+
+    try:
+        get_prefix_index()
+    except Exception:  # pylint: disable=broad-except
+        worker.log.exception("Failed to start building the search autocomplete index")
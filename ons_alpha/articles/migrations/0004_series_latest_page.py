@@ -0,0 +1,41 @@
+# Generated by Django 4.2.16 on 2026-10-18 01:06
+
+import django.db.models.deletion
+
+from django.db import migrations, models
+
+
+def populate_latest_page(apps, schema_editor):
+    SeriesPage = apps.get_model("articles", "ArticleSeriesPage")
+    ReleasePage = apps.get_model("articles", "ArticlePage")
+
+    for series in SeriesPage.objects.all():
+        series.latest_page = (
+            ReleasePage.objects.filter(live=True, path__startswith=series.path, depth=series.depth + 1)
+            .order_by("-release_date", "-pk")
+            .first()
+        )
+        series.save(update_fields=["latest_page"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0003_stream_toc_items"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="articleseriespage",
+            name="latest_page",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="articles.articlepage",
+            ),
+        ),
+        migrations.RunPython(populate_latest_page, migrations.RunPython.noop),
+    ]
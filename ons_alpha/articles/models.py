@@ -22,10 +22,11 @@ from ons_alpha.bundles.models import BundledPageMixin
 from ons_alpha.core.blocks.stream_blocks import CoreStoryBlock, CorrectionsNoticesStoryBlock
 from ons_alpha.core.forms import PageWithUpdatesAdminForm
 from ons_alpha.core.models.base import BasePage
+from ons_alpha.core.models.mixins import SeriesPageMixin, TableOfContentsMixin
 from ons_alpha.utils.fields import StreamField
 
 
-class ArticlePage(BundledPageMixin, RoutablePageMixin, BasePage):
+class ArticlePage(BundledPageMixin, RoutablePageMixin, TableOfContentsMixin, BasePage):
     base_form_class = PageWithUpdatesAdminForm
     template = "templates/pages/article_page.html"
     parent_page_types = ["ArticleSeriesPage"]
@@ -111,19 +112,17 @@ class ArticlePage(BundledPageMixin, RoutablePageMixin, BasePage):
     def document_type(self):
         return _("Article")
 
-    @property
+    @cached_property
     def is_latest(self):
-        latest_id = (
-            ArticlePage.objects.sibling_of(self).live().order_by("-release_date").values_list("id", flat=True).first()
+        return (
+            self.pk is not None
+            and ArticleSeriesPage.objects.filter(path=self.path[: -self.steplen], latest_page=self.pk).exists()
         )
-        return self.pk == latest_id
 
     @cached_property
     def toc(self):
         items = [{"url": "#summary", "text": "Summary"}]
-        for block in self.body:  # pylint: disable=not-an-iterable,useless-suppression
-            if hasattr(block.block, "to_table_of_contents_items"):
-                items += block.block.to_table_of_contents_items(block.value)
+        items += self.get_stream_toc_items()
         if self.contact_details_id:
             items += [{"url": "#contact-details", "text": "Contact details"}]
         return items
@@ -157,11 +156,23 @@ class ArticlePage(BundledPageMixin, RoutablePageMixin, BasePage):
         )
 
 
-class ArticleSeriesPage(RoutablePageMixin, Page):
+class ArticleSeriesPage(SeriesPageMixin, RoutablePageMixin, Page):
     parent_page_types = ["topics.TopicPage"]
     subpage_types = ["ArticlePage"]
     preview_modes = []  # Disabling the preview mode due to it being a container page.
     page_description = "A container for Article series"
+    release_model = ArticlePage
+    # the copy's pointer is recomputed from its own children, see SeriesPageMixin.copy()
+    exclude_fields_in_copy = ["latest_page"]
+
+    latest_page = models.ForeignKey(
+        ArticlePage,
+        null=True,
+        blank=True,
+        editable=False,
+        on_delete=models.SET_NULL,
+        related_name="+",
+    )
 
     content_panels = Page.content_panels + [
         HelpPanel(
@@ -173,9 +184,6 @@ class ArticleSeriesPage(RoutablePageMixin, Page):
         )
     ]
 
-    def get_latest(self):
-        return ArticlePage.objects.live().child_of(self).order_by("-release_date").first()
-
     @path("")
     def index(self, request):
         # Redirect to /latest as this is a container page without its own content
@@ -186,13 +194,14 @@ class ArticleSeriesPage(RoutablePageMixin, Page):
         latest = self.get_latest()
         if not latest:
             raise Http404
+        # no need to look this up again when rendering
+        latest.is_latest = True
         return latest.serve(request)
 
     @path("previous-releases/")
     def previous_releases(self, request):
-        previous = ArticlePage.objects.live().child_of(self).order_by("-release_date")
         return self.render(
             request,
-            context_overrides={"pages": previous},
+            context_overrides={"pages": self.get_releases_page(request)},
             template="templates/pages/previous_releases.html",
         )
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.16 on 2026-10-18 01:06
+
+import django.db.models.deletion
+
+from django.db import migrations, models
+
+
+def populate_latest_page(apps, schema_editor):
+    SeriesPage = apps.get_model("bulletins", "BulletinSeriesPage")
+    ReleasePage = apps.get_model("bulletins", "BulletinPage")
+
+    for series in SeriesPage.objects.all():
+        series.latest_page = (
+            ReleasePage.objects.filter(live=True, path__startswith=series.path, depth=series.depth + 1)
+            .order_by("-release_date", "-pk")
+            .first()
+        )
+        series.save(update_fields=["latest_page"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bulletins", "0007_stream_toc_items"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="bulletinseriespage",
+            name="latest_page",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="bulletins.bulletinpage",
+            ),
+        ),
+        migrations.RunPython(populate_latest_page, migrations.RunPython.noop),
+    ]
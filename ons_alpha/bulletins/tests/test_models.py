@@ -0,0 +1,122 @@
+from datetime import date
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.db.models import QuerySet
+from django.test import TestCase
+from wagtail.models import Locale, Page
+
+from ons_alpha.bulletins.models import BulletinPage, BulletinSeriesPage
+from ons_alpha.utils.side_effects import collect_publish_side_effects
+
+
+class BulletinSeriesLatestPageTestCase(TestCase):
+    def setUp(self):
+        root = Page.get_first_root_node()
+        self.series = root.add_child(instance=BulletinSeriesPage(title="Series"))
+        self.first = self.add_bulletin(self.series, "First", date(2024, 1, 1))
+        self.second = self.add_bulletin(self.series, "Second", date(2024, 2, 1))
+
+    def add_bulletin(self, series, title, release_date, live=True):
+        bulletin = series.add_child(
+            instance=BulletinPage(
+                title=title,
+                summary="Summary",
+                release_date=release_date,
+                next_release_date=release_date,
+                body=[],
+                live=False,
+            )
+        )
+        if live:
+            bulletin.save_revision().publish()
+        return bulletin
+
+    def get_series(self):
+        return BulletinSeriesPage.objects.get(pk=self.series.pk)
+
+    def test_latest_page_is_updated_on_publish(self):
+        self.assertEqual(self.get_series().latest_page_id, self.second.pk)
+
+        third = self.add_bulletin(self.series, "Third", date(2024, 3, 1))
+        self.assertEqual(self.get_series().latest_page_id, third.pk)
+
+    def test_update_latest_page_locks_the_series(self):
+        with mock.patch.object(QuerySet, "select_for_update", autospec=True, side_effect=lambda qs: qs) as lock:
+            self.get_series().update_latest_page()
+
+        lock.assert_called_once()
+        self.assertEqual(lock.call_args.args[0].model, BulletinSeriesPage)
+        self.assertEqual(self.get_series().latest_page_id, self.second.pk)
+
+    def test_latest_page_is_updated_once_publishes_together_are_committed(self):
+        with (
+            mock.patch.object(
+                BulletinSeriesPage,
+                "update_latest_page",
+                autospec=True,
+                side_effect=BulletinSeriesPage.update_latest_page,
+            ) as update_latest_page,
+            self.captureOnCommitCallbacks(execute=True),
+            collect_publish_side_effects(),
+        ):
+            self.add_bulletin(self.series, "Third", date(2024, 3, 1))
+            fourth = self.add_bulletin(self.series, "Fourth", date(2024, 4, 1))
+            # the series isn't locked by the publishing transaction
+            update_latest_page.assert_not_called()
+
+        update_latest_page.assert_called_once()
+        self.assertEqual(self.get_series().latest_page_id, fourth.pk)
+
+    def test_latest_page_is_updated_on_unpublish(self):
+        self.second.refresh_from_db()
+        self.second.unpublish()
+
+        self.assertEqual(self.get_series().latest_page_id, self.first.pk)
+
+    def test_latest_page_is_updated_on_delete(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.second.delete()
+
+        self.assertEqual(self.get_series().latest_page_id, self.first.pk)
+
+    def test_latest_page_is_updated_on_move(self):
+        other_series = Page.get_first_root_node().add_child(instance=BulletinSeriesPage(title="Other series"))
+
+        BulletinPage.objects.get(pk=self.second.pk).move(other_series, pos="last-child")
+
+        self.assertEqual(self.get_series().latest_page_id, self.first.pk)
+        self.assertEqual(BulletinSeriesPage.objects.get(pk=other_series.pk).latest_page_id, self.second.pk)
+
+    def test_copies_point_to_their_own_latest_page(self):
+        copy = self.get_series().copy(recursive=False, update_attrs={"slug": "copy"})
+        self.assertIsNone(BulletinSeriesPage.objects.get(pk=copy.pk).latest_page_id)
+
+        copy = self.get_series().copy(recursive=True, update_attrs={"slug": "recursive-copy"})
+        latest_page = BulletinSeriesPage.objects.get(pk=copy.pk).latest_page
+        self.assertEqual(latest_page.get_parent(), copy.page_ptr)
+        self.assertEqual(latest_page.title, "Second")
+
+    def test_translations_point_to_their_own_latest_page(self):
+        translation = self.get_series().copy_for_translation(Locale.objects.get_or_create(language_code="cy")[0])
+
+        self.assertIsNone(BulletinSeriesPage.objects.get(pk=translation.pk).latest_page_id)
+
+    def test_is_latest(self):
+        self.assertTrue(BulletinPage.objects.get(pk=self.second.pk).is_latest)
+        self.assertFalse(BulletinPage.objects.get(pk=self.first.pk).is_latest)
+
+    def test_get_latest_does_not_sort_releases(self):
+        series = self.get_series()
+
+        # a single primary key lookup
+        with self.assertNumQueries(1):
+            self.assertEqual(series.get_latest(), self.second)
+
+    def test_rebuild_command(self):
+        BulletinSeriesPage.objects.update(latest_page=None)
+
+        call_command("rebuild_series_latest_pages", stdout=StringIO())
+
+        self.assertEqual(self.get_series().latest_page_id, self.second.pk)
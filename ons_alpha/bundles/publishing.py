@@ -0,0 +1,192 @@
+import logging
+import time
+import uuid
+
+from collections import defaultdict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from django.db import close_old_connections, connections, transaction
+from django.urls import reverse
+from wagtail.log_actions import log
+from wagtail.models import Revision
+
+from ons_alpha.bundles.enums import BundleStatus
+from ons_alpha.bundles.models import Bundle, BundlePage
+from ons_alpha.bundles.notifications import notify_slack_of_publication_start, notify_slack_of_publish_end
+from ons_alpha.release_calendar.enums import ReleaseStatus
+from ons_alpha.utils.side_effects import collect_publish_side_effects
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PagePublicationTiming:
+    page_id: int
+    revision_id: int
+    duration: float
+
+
+@dataclass
+class BundlePublicationResult:
+    bundle_id: int
+    name: str
+    success: bool = False
+    duration: float = 0.0
+    pages: list[PagePublicationTiming] = field(default_factory=list)
+
+
+class BundlePublisher:
+    """
+    Publishes a set of due bundles.
+
+    Scheduled revisions for every bundled page are fetched up front in a couple of
+    bulk queries. Bundles are independent of each other, so they are published
+    concurrently on a bounded pool of worker threads. Each worker uses its own
+    database connection, and each bundle is still published all-or-nothing inside
+    its own transaction.
+    """
+
+    def __init__(self, bundles: Iterable[Bundle], *, max_workers: int = 1, base_url: str = ""):
+        self.bundles = list(bundles)
+        self.max_workers = max(1, max_workers)
+        self.base_url = base_url
+
+    def get_scheduled_revisions(self) -> dict[int, list[Revision]]:
+        """
+        Returns a mapping of bundle pk to the scheduled revisions of its pages, in
+        bundle page order.
+        """
+        page_ids_by_bundle = defaultdict(list)
+        for bundle_id, page_id in (
+            BundlePage.objects.filter(parent__in=self.bundles, page__isnull=False)
+            .order_by("parent_id", "sort_order", "pk")
+            .values_list("parent_id", "page_id")
+        ):
+            page_ids_by_bundle[bundle_id].append(page_id)
+
+        all_page_ids = {page_id for page_ids in page_ids_by_bundle.values() for page_id in page_ids}
+        revisions_by_page = {}
+        # match Page.scheduled_revision, which returns the first matching revision
+        for revision in (
+            Revision.page_revisions.filter(
+                object_id__in=[str(page_id) for page_id in all_page_ids], approved_go_live_at__isnull=False
+            )
+            .order_by("pk")
+            .prefetch_related("content_object")
+        ):
+            revisions_by_page.setdefault(int(revision.object_id), revision)
+
+        return {
+            bundle.pk: [
+                revisions_by_page[page_id] for page_id in page_ids_by_bundle[bundle.pk] if page_id in revisions_by_page
+            ]
+            for bundle in self.bundles
+        }
+
+    def update_related_release_calendar_page(self, bundle: Bundle) -> None:
+        content = []
+        pages = []
+        for page in bundle.get_bundled_pages():
+            pages.append(
+                {
+                    "id": uuid.uuid4(),
+                    "type": "item",
+                    "value": {"page": page.pk, "title": "", "description": "", "external_url": ""},
+                }
+            )
+        if pages:
+            content.append({"type": "release_content", "value": {"title": "Publications", "links": pages}})
+
+        datasets = [{**dataset, "id": uuid.uuid4()} for dataset in bundle.datasets.raw_data]
+
+        page = bundle.release_calendar_page
+        page.content = content
+        page.datasets = datasets
+        page.status = ReleaseStatus.PUBLISHED
+        revision = page.save_revision(log_action=True)
+        revision.publish()
+
+    def publish_bundle(self, bundle: Bundle, revisions: list[Revision]) -> BundlePublicationResult:
+        result = BundlePublicationResult(bundle_id=bundle.pk, name=bundle.name)
+
+        # only provide a URL if we can generate a full one
+        inspect_url = self.base_url + reverse("bundle:inspect", args=(bundle.pk,)) if self.base_url else None
+
+        logger.info("Publishing bundle=%d pages=%d", bundle.pk, len(revisions))
+        start_time = time.time()
+        notify_slack_of_publication_start(bundle, url=inspect_url)
+
+        try:
+            # media privacy changes, cache purges and search index updates are
+            # merged across the bundle's pages and run once the publish is committed
+            with collect_publish_side_effects(), transaction.atomic():
+                for revision in revisions:
+                    page_start_time = time.time()
+                    # just run publish for the revision -- since the approved go
+                    # live datetime is before now it will make the object live
+                    revision.publish(log_action="wagtail.publish.scheduled")
+                    result.pages.append(
+                        PagePublicationTiming(
+                            page_id=int(revision.object_id),
+                            revision_id=revision.pk,
+                            duration=time.time() - page_start_time,
+                        )
+                    )
+
+                # update the related release calendar and publish
+                if bundle.release_calendar_page_id:
+                    self.update_related_release_calendar_page(bundle)
+
+                bundle.status = BundleStatus.RELEASED
+                bundle.save(update_fields=["status"])
+
+                log(action="wagtail.publish.scheduled", instance=bundle)
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Publish failed bundle=%d", bundle.pk)
+            return result
+
+        result.success = True
+        result.duration = time.time() - start_time
+        for timing in result.pages:
+            logger.info(
+                "Published page=%d revision=%d bundle=%d duration=%.3fms",
+                timing.page_id,
+                timing.revision_id,
+                bundle.pk,
+                timing.duration * 1000,
+            )
+        logger.info("Published bundle=%d duration=%.3fms", bundle.pk, result.duration * 1000)
+
+        notify_slack_of_publish_end(bundle, result.duration, url=inspect_url)
+
+        return result
+
+    def _publish_bundle_in_worker(self, bundle: Bundle, revisions: list[Revision]) -> BundlePublicationResult:
+        close_old_connections()
+        try:
+            return self.publish_bundle(bundle, revisions)
+        finally:
+            # Connections are per-thread, so release this worker's connection
+            connections.close_all()
+
+    def publish(self) -> list[BundlePublicationResult]:
+        if not self.bundles:
+            return []
+
+        revisions_by_bundle = self.get_scheduled_revisions()
+
+        if self.max_workers == 1 or len(self.bundles) == 1:
+            return [self.publish_bundle(bundle, revisions_by_bundle[bundle.pk]) for bundle in self.bundles]
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(self.bundles)), thread_name_prefix="bundle-publish"
+        ) as executor:
+            return list(
+                executor.map(
+                    lambda bundle: self._publish_bundle_in_worker(bundle, revisions_by_bundle[bundle.pk]),
+                    self.bundles,
+                )
+            )
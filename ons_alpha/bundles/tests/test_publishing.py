@@ -0,0 +1,136 @@
+from datetime import timedelta
+from unittest import mock, skipIf
+
+from django.db import connection, connections
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+from wagtail.models import Page
+
+from ons_alpha.bundles.enums import BundleStatus
+from ons_alpha.bundles.models import Bundle, BundlePage
+from ons_alpha.bundles.publishing import BundlePublisher
+from ons_alpha.standardpages.factories import InformationPageFactory
+
+
+class BundlePublisherTestCase(TestCase):
+    def setUp(self):
+        self.past = timezone.now() - timedelta(minutes=1)
+        self.bundle = Bundle.objects.create(name="Bundle", status=BundleStatus.APPROVED, publication_date=self.past)
+        self.pages = [self.schedule_page(InformationPageFactory(live=False)) for _ in range(2)]
+        for page in self.pages:
+            BundlePage.objects.create(parent=self.bundle, page=page)
+
+    def schedule_page(self, page):
+        revision = page.save_revision()
+        revision.approved_go_live_at = self.past
+        revision.save(update_fields=["approved_go_live_at"])
+        return page
+
+    def get_bundles(self):
+        return Bundle.objects.filter(pk=self.bundle.pk)
+
+    def test_get_scheduled_revisions_uses_bulk_queries(self):
+        publisher = BundlePublisher(self.get_bundles())
+        # bundled pages, scheduled revisions, revision objects
+        with self.assertNumQueries(3):
+            revisions_by_bundle = publisher.get_scheduled_revisions()
+
+        self.assertEqual(
+            [int(revision.object_id) for revision in revisions_by_bundle[self.bundle.pk]],
+            [page.pk for page in self.pages],
+        )
+
+    def test_publish(self):
+        results = BundlePublisher(self.get_bundles()).publish()
+
+        self.assertEqual(len(results), 1)
+        self.assertTrue(results[0].success)
+        self.assertEqual([timing.page_id for timing in results[0].pages], [page.pk for page in self.pages])
+
+        self.bundle.refresh_from_db()
+        self.assertEqual(self.bundle.status, BundleStatus.RELEASED)
+        for page in self.pages:
+            page.refresh_from_db()
+            self.assertTrue(page.live)
+
+    def test_publish_is_all_or_nothing(self):
+        with mock.patch.object(Bundle, "save", side_effect=ValueError):
+            results = BundlePublisher(self.get_bundles()).publish()
+
+        self.assertFalse(results[0].success)
+
+        self.bundle.refresh_from_db()
+        self.assertEqual(self.bundle.status, BundleStatus.APPROVED)
+        for page in self.pages:
+            page.refresh_from_db()
+            self.assertFalse(page.live)
+
+    @mock.patch("ons_alpha.private_media.signal_handlers.make_media_public")
+    def test_publish_merges_media_side_effects_after_commit(self, make_media_public):
+        with self.captureOnCommitCallbacks(execute=True):
+            BundlePublisher(self.get_bundles()).publish()
+            make_media_public.assert_not_called()
+
+        # one merged call, covering the media for every page in the bundle
+        make_media_public.assert_called_once()
+        self.assertEqual(len(make_media_public.call_args.args[0]), len(self.pages))
+
+    @mock.patch("ons_alpha.private_media.signal_handlers.make_media_public")
+    def test_failed_publish_discards_side_effects(self, make_media_public):
+        with mock.patch.object(Bundle, "save", side_effect=ValueError), self.captureOnCommitCallbacks(execute=True):
+            BundlePublisher(self.get_bundles()).publish()
+
+        make_media_public.assert_not_called()
+
+
+@skipIf(connection.vendor == "sqlite", "SQLite doesn't support concurrent write transactions")
+class ConcurrentBundlePublisherTestCase(TransactionTestCase):
+    # the bundles are published in other threads, with their own connections, so
+    # their changes have to be committed
+    serialized_rollback = True
+
+    def setUp(self):
+        past = timezone.now() - timedelta(minutes=1)
+        self.bundles = []
+        self.pages = {}
+        for i in range(3):
+            bundle = Bundle.objects.create(name=f"Bundle {i}", status=BundleStatus.APPROVED, publication_date=past)
+            page = InformationPageFactory(live=False)
+            revision = page.save_revision()
+            revision.approved_go_live_at = past
+            revision.save(update_fields=["approved_go_live_at"])
+            BundlePage.objects.create(parent=bundle, page=page)
+            self.bundles.append(bundle)
+            self.pages[bundle.pk] = page
+        self.failing_bundle = self.bundles[1]
+
+    @mock.patch("ons_alpha.bundles.publishing.connections", wraps=connections)
+    @mock.patch("ons_alpha.private_media.signal_handlers.make_media_public")
+    def test_bundles_are_published_independently(self, make_media_public, worker_connections):
+        bundle_save = Bundle.save
+
+        def save(bundle, *args, **kwargs):
+            if bundle.pk == self.failing_bundle.pk:
+                raise ValueError
+            return bundle_save(bundle, *args, **kwargs)
+
+        with (
+            mock.patch.object(Bundle, "save", autospec=True, side_effect=save),
+            self.assertLogs("ons_alpha.bundles.publishing", "ERROR"),
+        ):
+            results = BundlePublisher(Bundle.objects.order_by("pk"), max_workers=3).publish()
+
+        self.assertEqual(
+            [(result.bundle_id, result.success) for result in results],
+            [(bundle.pk, bundle != self.failing_bundle) for bundle in self.bundles],
+        )
+        for bundle in self.bundles:
+            succeeded = bundle != self.failing_bundle
+            bundle.refresh_from_db()
+            self.assertEqual(bundle.status, BundleStatus.RELEASED if succeeded else BundleStatus.APPROVED)
+            self.assertEqual(Page.objects.get(pk=self.pages[bundle.pk].pk).live, succeeded)
+
+        # each worker flushed its own bundle's side effects, once committed
+        self.assertEqual(make_media_public.call_count, 2)
+        # and released its connection
+        self.assertEqual(worker_connections.close_all.call_count, 3)
@@ -5,3 +5,10 @@ class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.AutoField"
     name = "ons_alpha.core"
     label = "core"
+
+    def ready(self):
+        from ons_alpha.core.signal_handlers import (  # pylint: disable=import-outside-toplevel
+            register_signal_handlers,
+        )
+
+        register_signal_handlers()
@@ -8,6 +8,8 @@ from wagtail.contrib.table_block.blocks import DEFAULT_TABLE_OPTIONS
 from wagtail.contrib.table_block.blocks import TableBlock as WagtailTableBlock
 from wagtail.contrib.typed_table_block.blocks import TypedTableBlock as WagtailTypedTableBlock
 
+from ons_alpha.core.tables import COMPACT_RENDER_MIN_CELLS, CompactTable
+
 
 class HeadingBlock(blocks.CharBlock):
     class Meta:
@@ -120,8 +122,7 @@ class TableBlock(WagtailTableBlock):
 
         return super().clean(value)
 
-    def get_context(self, value, parent_context=None):
-        context = super().get_context(value, parent_context=parent_context)
+    def _get_cell_metadata(self, value):
         classnames = {}
         hidden = {}
         spans = {}
@@ -141,6 +142,16 @@ class TableBlock(WagtailTableBlock):
                 if span:
                     # mark_safe is needed to preserve the quotes when rendered in the template
                     spans[(merge["row"], merge["col"])] = mark_safe(span)  # noqa: S308
+        return classnames, hidden, spans
+
+    def get_context(self, value, parent_context=None):
+        context = super().get_context(value, parent_context=parent_context)
+        if sum(map(len, value.get("data") or [])) >= COMPACT_RENDER_MIN_CELLS:
+            # Large tables are streamed straight to HTML, rather than via the onsTable macro
+            table = CompactTable.from_table_block_value(value, self._to_ons_classname)
+            return {"table_html": table.render(), **context}
+
+        classnames, hidden, spans = self._get_cell_metadata(value)
         return {
             "options": {
                 "caption": value.get("table_caption"),
@@ -191,6 +202,11 @@ class TypedTableBlock(blocks.StructBlock):
     def get_context(self, value, parent_context=None):
         context = super().get_context(value, parent_context=parent_context)
         table = value["table"]
+        if len(table.columns) * len(table.row_data) >= COMPACT_RENDER_MIN_CELLS:
+            # Large tables are streamed straight to HTML, rather than via the onsTable macro
+            context["table_html"] = CompactTable.from_typed_table(table, caption=value.get("caption")).render()
+            return context
+
         config = {}
         if caption := value.get("caption"):
             config["caption"] = caption
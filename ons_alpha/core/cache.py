@@ -0,0 +1,107 @@
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.translation import get_language
+from wagtail.blocks import StreamValue
+from wagtail.models import Page
+
+from ons_alpha.utils.cache import bump_cache_generation, get_cache_generation
+
+
+BLOCK_RENDER_CACHE_GENERATION = "block_render"
+PAGE_LISTING_CACHE_GENERATION = "page_listing"
+TRANSLATION_URLS_CACHE_GENERATION = "translation_urls"
+RELATED_PAGES_CACHE_GENERATION = "related_pages"
+
+
+def get_block_render_cache_key(page: Page | None, block: StreamValue.StreamChild, request=None) -> str | None:
+    """
+    Returns the cache key for the rendered HTML of a StreamField `block` on `page`, or
+    `None` if the block shouldn't be cached.
+
+    Live pages are keyed by their live revision, so publishing a page invalidates its
+    blocks. Previews may contain unsaved changes, so they are keyed by the block content.
+    """
+    if page is None or page.pk is None or not getattr(block, "id", None):
+        return None
+
+    if getattr(request, "is_preview", False):
+        content = json.dumps(block.block.get_prep_value(block.value), cls=DjangoJSONEncoder, sort_keys=True)
+        revision = f"preview-{hashlib.sha1(content.encode(), usedforsecurity=False).hexdigest()}"
+    elif page.live_revision_id:
+        revision = page.live_revision_id
+    else:
+        return None
+
+    generation = get_cache_generation(BLOCK_RENDER_CACHE_GENERATION)
+    return f"block:{generation}:{page.pk}:{revision}:{block.id}:{get_language()}"
+
+
+def render_block_cached(block: StreamValue.StreamChild, context: dict) -> str:
+    """
+    Render a StreamField `block` as `{% include_block %}` would, reusing the
+    cached HTML where possible.
+    """
+    timeout = getattr(settings, "BLOCK_RENDER_CACHE_TIMEOUT", 0)
+    cache_key = get_block_render_cache_key(context.get("page"), block, context.get("request")) if timeout else None
+    if cache_key is None:
+        return block.render_as_block(context=context)
+
+    html = cache.get(cache_key)
+    if html is None:
+        html = str(block.render_as_block(context=context))
+        cache.set(cache_key, html, timeout)
+    return html
+
+
+def invalidate_block_render_cache() -> None:
+    bump_cache_generation(BLOCK_RENDER_CACHE_GENERATION)
+
+
+def get_page_listing_count_cache_key(name: str) -> str:
+    """
+    Returns the cache key for the count of a page listing, which changes whenever a page
+    is published or unpublished.
+    """
+    return f"page_listing:{get_cache_generation(PAGE_LISTING_CACHE_GENERATION)}:{name}:count"
+
+
+def invalidate_page_listing_cache() -> None:
+    bump_cache_generation(PAGE_LISTING_CACHE_GENERATION)
+
+
+def get_translation_urls_cache_key(translation_key) -> str:
+    """
+    Returns the cache key for the URLs of a page's locale variants, for all sites. Publishing
+    or unpublishing a variant clears it. Moves and locale changes clear all of them.
+    """
+    return f"translation_urls:{get_cache_generation(TRANSLATION_URLS_CACHE_GENERATION)}:{translation_key}"
+
+
+def invalidate_translation_urls_cache(translation_key=None) -> None:
+    if translation_key is None:
+        bump_cache_generation(TRANSLATION_URLS_CACHE_GENERATION)
+    else:
+        cache.delete(get_translation_urls_cache_key(translation_key))
+
+
+def get_related_pages_cache_key(page: Page, request=None) -> str | None:
+    """
+    Returns the cache key for the resolved related page cards of `page`, or `None` if
+    they shouldn't be cached (e.g. in previews, which may have unsaved related pages).
+
+    Cards are keyed by the page's live revision, so publishing the page invalidates them.
+    Changes to the related pages themselves invalidate all of them.
+    """
+    if page.pk is None or not page.live_revision_id or getattr(request, "is_preview", False):
+        return None
+
+    generation = get_cache_generation(RELATED_PAGES_CACHE_GENERATION)
+    return f"related_pages:{generation}:{page.pk}:{page.live_revision_id}:{get_language()}"
+
+
+def invalidate_related_pages_cache() -> None:
+    bump_cache_generation(RELATED_PAGES_CACHE_GENERATION)
@@ -0,0 +1,75 @@
+import timeit
+
+from django.core.management.base import BaseCommand
+from django.template import engines
+from jinja2 import TemplateNotFound
+
+from ons_alpha.core.blocks import TableBlock
+from ons_alpha.core.tables import CompactTable
+
+
+LEGACY_TEMPLATE = '{% from "component_overrides/table/_macro.njk" import onsTable %}{{ onsTable(options) }}'
+
+
+def make_table_value(cell_count: int, column_count: int = 10) -> dict:
+    row_count = max(1, cell_count // column_count)
+    return {
+        "data": [[f"Row {row} col {col}" for col in range(column_count)] for row in range(row_count)],
+        "first_row_is_table_header": True,
+        "table_caption": "Benchmark table",
+        "cell": [{"row": row, "col": 1, "className": "htRight"} for row in range(1, row_count, 5)],
+        "mergeCells": [{"row": 1, "col": 0, "rowspan": 2, "colspan": 1}] if row_count > 2 else [],
+    }
+
+
+class Command(BaseCommand):
+    help = "Compares the per-cell dict table rendering path with the compact table renderer."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=[100, 10_000, 100_000],
+            help="Table sizes to benchmark, in cells.",
+        )
+        parser.add_argument("--repeat", type=int, default=3, help="Take the best of this many runs.")
+
+    def handle(self, *args, **options):
+        block = TableBlock()
+        legacy_template = engines["jinja2"].env.from_string(LEGACY_TEMPLATE)
+
+        def legacy_context(value):
+            classnames, hidden, spans = block._get_cell_metadata(value)  # pylint: disable=protected-access
+            return {
+                "caption": value.get("table_caption"),
+                "ths": block._get_header(value, hidden, spans),  # pylint: disable=protected-access
+                "trs": block._get_rows(value, classnames, hidden, spans),  # pylint: disable=protected-access
+            }
+
+        def compact(value):
+            to_ons_classname = block._to_ons_classname  # pylint: disable=protected-access
+            return CompactTable.from_table_block_value(value, to_ons_classname).render()
+
+        self.stdout.write(f"{'cells':>10} {'legacy context':>16} {'legacy render':>15} {'compact':>12} {'speedup':>8}")
+        for size in options["sizes"]:
+            value = make_table_value(size)
+            number = max(1, 10_000 // size)
+
+            def best_of(func, value=value, number=number):
+                return min(timeit.repeat(lambda: func(value), number=number, repeat=options["repeat"])) / number
+
+            legacy_context_time = best_of(legacy_context)
+            try:
+                legacy_render_time = best_of(lambda v: legacy_template.render(options=legacy_context(v)))
+            except TemplateNotFound:
+                # the design system templates haven't been installed
+                legacy_render_time = None
+            compact_time = best_of(compact)
+
+            legacy_time = legacy_render_time or legacy_context_time
+            self.stdout.write(
+                f"{size:>10} {legacy_context_time * 1000:>14.2f}ms "
+                + (f"{legacy_render_time * 1000:>13.2f}ms " if legacy_render_time else f"{'n/a':>15} ")
+                + f"{compact_time * 1000:>10.2f}ms {legacy_time / compact_time:>7.1f}x"
+            )
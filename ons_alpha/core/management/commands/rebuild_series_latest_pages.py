@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from ons_alpha.core.models.mixins import SeriesPageMixin
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the latest release pointers of all series pages."
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            for series_model in SeriesPageMixin.__subclasses__():
+                updated = series_model.rebuild_latest_pages()
+                self.stdout.write(f"Updated {updated} {series_model._meta.verbose_name_plural}")
@@ -1,10 +1,13 @@
+from django.conf import settings
+from django.core.cache import cache
 from django.utils.decorators import method_decorator
 from django.utils.functional import cached_property
 from wagtail.models import Page
-from wagtail.query import PageQuerySet
 
+from ons_alpha.core.cache import get_related_pages_cache_key
+from ons_alpha.images.utils import get_rendition_urls
 from ons_alpha.utils.cache import get_default_cache_control_decorator
-from ons_alpha.utils.query import order_by_pk_position
+from ons_alpha.utils.query import sort_by_pk_position
 
 from .mixins import ListingFieldsMixin, SocialFieldsMixin
 
@@ -19,15 +22,18 @@ __all__ = [
 class BasePage(ListingFieldsMixin, SocialFieldsMixin, Page):
     show_in_menus_default = True
 
+    # The rendition used for the listing image of related page cards
+    related_page_image_filter_spec = "fill-450x300"
+
     class Meta:
         abstract = True
 
     promote_panels = Page.promote_panels + ListingFieldsMixin.promote_panels + SocialFieldsMixin.promote_panels
 
     @cached_property
-    def related_pages(self) -> PageQuerySet:
+    def related_pages(self) -> list[Page]:
         """
-        Return a `PageQuerySet` of items related to this page via the
+        Return a list of the (specific) pages related to this page via the
         `PageRelatedPage` through model, and are suitable for display.
         The result is ordered to match that specified by editors using
         the 'page_related_pages' `InlinePanel`.
@@ -36,12 +42,51 @@ class BasePage(ListingFieldsMixin, SocialFieldsMixin, Page):
         # NOTE: avoiding values_list() here for compatibility with preview
         # See: https://github.com/wagtail/django-modelcluster/issues/30
         ordered_page_pks = tuple(item.page_id for item in self.page_related_pages.all())
-        return order_by_pk_position(
-            Page.objects.live().public().specific(),
+        if not ordered_page_pks:
+            return []
+        return sort_by_pk_position(
+            Page.objects.live().public().filter(pk__in=ordered_page_pks).specific(),
             pks=ordered_page_pks,
-            exclude_non_matches=True,
         )
 
+    def build_related_page_cards(self, request=None) -> list[dict]:
+        """
+        Return the listing cards for `related_pages` as plain data, with the
+        listing image rendition URLs resolved in bulk.
+        """
+        pages = self.related_pages
+        image_urls = get_rendition_urls(
+            [page.listing_image_id for page in pages if getattr(page, "listing_image_id", None)],
+            self.related_page_image_filter_spec,
+        )
+
+        cards = []
+        for page in pages:
+            cards.append(
+                {
+                    "text": getattr(page, "listing_title", "") or page.title,
+                    "url": page.get_full_url(request),
+                    "summary": getattr(page, "listing_summary", "") or page.search_description,
+                    "image": image_urls.get(getattr(page, "listing_image_id", None)),
+                }
+            )
+        return cards
+
+    def get_related_page_cards(self, request=None) -> list[dict]:
+        """
+        Return the listing cards for `related_pages`, from the cache if possible.
+        """
+        timeout = getattr(settings, "RELATED_PAGES_CACHE_TIMEOUT", 0)
+        cache_key = get_related_pages_cache_key(self, request) if timeout else None
+        if cache_key is None:
+            return self.build_related_page_cards(request)
+
+        cards = cache.get(cache_key)
+        if cards is None:
+            cards = self.build_related_page_cards(request)
+            cache.set(cache_key, cards, timeout)
+        return cards
+
 
 BasePage._meta.get_field("seo_title").verbose_name = "Title tag"
 BasePage._meta.get_field("search_description").verbose_name = "Meta description"
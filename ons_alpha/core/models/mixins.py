@@ -1,15 +1,30 @@
-from django.core.paginator import EmptyPage, Paginator
-from django.db import models
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import F, Window
+from django.db.models.functions import Length, RowNumber, Substr
 from django.http import Http404
 from wagtail.admin.panels import FieldPanel, MultiFieldPanel
 
+from ons_alpha.utils.pagination import InvalidCursor, KeysetPaginator
+
 
 __all__ = [
     "ListingFieldsMixin",
+    "SeriesPageMixin",
     "SocialFieldsMixin",
+    "TableOfContentsMixin",
+    "get_table_of_contents_items",
 ]
 
 
+def get_table_of_contents_items(stream_value) -> list[dict[str, str]]:
+    items = []
+    for block in stream_value:
+        if hasattr(block.block, "to_table_of_contents_items"):
+            items.extend(block.block.to_table_of_contents_items(block.value))
+    return items
+
+
 class ListingFieldsMixin(models.Model):
     """
     Generic listing fields abstract class to add listing image/text to any new content type easily.
@@ -80,17 +95,121 @@ class SocialFieldsMixin(models.Model):
     ]
 
 
+class TableOfContentsMixin(models.Model):
+    """
+    Stores the table of contents items for the `toc_stream_field_name` StreamField when
+    the page is cleaned (i.e. when a revision is saved or previewed) or saved, so that
+    rendering the page doesn't need to walk the StreamField.
+    """
+
+    toc_stream_field_name = "body"
+
+    stream_toc_items = models.JSONField(null=True, blank=True, editable=False)
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None:
+            self.update_stream_toc_items()
+        elif self.toc_stream_field_name in update_fields:
+            self.update_stream_toc_items()
+            kwargs["update_fields"] = {*update_fields, "stream_toc_items"}
+        return super().save(*args, **kwargs)
+
+    def update_stream_toc_items(self) -> None:
+        self.stream_toc_items = get_table_of_contents_items(getattr(self, self.toc_stream_field_name))
+
+    def get_stream_toc_items(self) -> list[dict[str, str]]:
+        if self.stream_toc_items is None:
+            # not stored yet, e.g. for revisions saved before this field was added
+            self.update_stream_toc_items()
+        return self.stream_toc_items
+
+    def clean(self):
+        super().clean()
+        self.update_stream_toc_items()
+
+
 class SubpageMixin:
     PAGE_SIZE = 24
 
     def get_paginator_page(self, request):
-        paginator = Paginator(self.get_children().live().public().specific(), per_page=self.PAGE_SIZE)
+        # children are ordered by their (unique) tree path
+        paginator = KeysetPaginator(self.get_children().live().public().specific(), self.PAGE_SIZE, ordering=["path"])
         try:
-            return paginator.page(int(request.GET.get("p", 1)))
-        except (EmptyPage, ValueError) as e:
+            return paginator.page(request.GET.get("cursor"))
+        except InvalidCursor as e:
             raise Http404 from e
 
     def get_context(self, request, *args, **kwargs):
         context = super().get_context(request, *args, **kwargs)
         context["subpages"] = self.get_paginator_page(request)
         return context
+
+
+class SeriesPageMixin:
+    """
+    For series pages, which keep a pointer (`latest_page`, a foreign key to `release_model`)
+    to their latest live child page by release date, so that it can be looked up by primary key.
+    The pointer is kept up to date by signal handlers in `ons_alpha.core.signal_handlers`.
+    """
+
+    release_model: type[models.Model]
+
+    def get_releases(self):
+        return self.release_model.objects.live().child_of(self).order_by("-release_date", "-pk")
+
+    def get_releases_page(self, request):
+        return KeysetPaginator(self.get_releases(), settings.DEFAULT_PER_PAGE).get_page(request.GET.get("cursor"))
+
+    def get_latest(self):
+        return self.latest_page
+
+    def copy(self, *args, **kwargs):
+        # Also used by copy_for_translation(). No publish signals are sent for the copy's
+        # children (if any), so its latest page has to be recomputed here.
+        page_copy = super().copy(*args, **kwargs)
+        page_copy.update_latest_page()
+        return page_copy
+
+    def update_latest_page(self) -> None:
+        with transaction.atomic():
+            # Lock the series first, so that concurrent publishes into the same series (e.g. by
+            # bundles published in parallel) update it one at a time, each seeing the releases
+            # committed by the others. The lock is held until the outermost transaction commits,
+            # which is why bundles only update their series once they've been committed.
+            list(type(self).objects.select_for_update().filter(pk=self.pk).values_list("pk", flat=True))
+            self.latest_page = self.get_releases().first()
+            type(self).objects.filter(pk=self.pk).update(latest_page=self.latest_page)
+
+    @classmethod
+    def rebuild_latest_pages(cls) -> int:
+        """
+        Recompute the `latest_page` of all series pages, in bulk. Returns the number of pages updated.
+        """
+        steplen = cls.steplen
+        latest_pages = (
+            cls.release_model.objects.live()
+            .annotate(
+                series_rank=Window(
+                    RowNumber(),
+                    partition_by=Substr("path", 1, Length("path") - steplen),
+                    order_by=[F("release_date").desc(), F("pk").desc()],
+                )
+            )
+            .filter(series_rank=1)
+            .values_list("path", "pk")
+        )
+        latest_by_series_path = {path[:-steplen]: pk for path, pk in latest_pages}
+
+        to_update = []
+        for series in cls.objects.only("pk", "path", "latest_page_id"):
+            latest_page_id = latest_by_series_path.get(series.path)
+            if series.latest_page_id != latest_page_id:
+                series.latest_page_id = latest_page_id
+                to_update.append(series)
+
+        cls.objects.bulk_update(to_update, ["latest_page"], batch_size=500)
+        return len(to_update)
@@ -4,6 +4,7 @@ from wagtail.contrib.settings.models import BaseSiteSetting, register_setting
 from wagtail.fields import RichTextField
 
 from ons_alpha.images.models import CustomImage
+from ons_alpha.utils.cache import CachedSiteSettingMixin
 
 
 __all__ = [
@@ -14,7 +15,7 @@ __all__ = [
 
 
 @register_setting
-class SocialMediaSettings(BaseSiteSetting):
+class SocialMediaSettings(CachedSiteSettingMixin, BaseSiteSetting):
     twitter_handle = models.CharField(
         max_length=255,
         blank=True,
@@ -43,7 +44,7 @@ class SocialMediaSettings(BaseSiteSetting):
 
 
 @register_setting
-class SystemMessagesSettings(BaseSiteSetting):
+class SystemMessagesSettings(CachedSiteSettingMixin, BaseSiteSetting):
     class Meta:
         verbose_name = "system messages"
 
@@ -57,7 +58,7 @@ class SystemMessagesSettings(BaseSiteSetting):
 
 
 @register_setting(icon="view")
-class Tracking(BaseSiteSetting):
+class Tracking(CachedSiteSettingMixin, BaseSiteSetting):
     google_tag_manager_id = models.CharField(
         max_length=255,
         blank="True",
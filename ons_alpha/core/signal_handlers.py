@@ -0,0 +1,133 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from wagtail.models import Locale, Page, PageViewRestriction
+from wagtail.signals import page_published, page_slug_changed, page_unpublished, post_page_move
+
+from ons_alpha.core.cache import (
+    invalidate_block_render_cache,
+    invalidate_page_listing_cache,
+    invalidate_related_pages_cache,
+    invalidate_translation_urls_cache,
+)
+from ons_alpha.core.models.mixins import SeriesPageMixin
+from ons_alpha.core.models.snippets import Chart
+from ons_alpha.utils.side_effects import defer_or_run
+
+
+def invalidate_block_render_cache_on_change(**kwargs):  # pylint: disable=unused-argument
+    """
+    Blocks can render content from other pages and snippets (e.g. related links and
+    charts), so clear all cached blocks when these change, once the change is committed.
+    Changes to the page itself are handled by keying blocks by the page's live revision.
+    """
+    transaction.on_commit(invalidate_block_render_cache)
+
+
+def invalidate_page_listing_cache_on_change(**kwargs):  # pylint: disable=unused-argument
+    transaction.on_commit(invalidate_page_listing_cache)
+
+
+def invalidate_related_pages_cache_on_change(**kwargs):  # pylint: disable=unused-argument
+    # the title, URL or visibility of a page that others link to may have changed
+    transaction.on_commit(invalidate_related_pages_cache)
+
+
+def invalidate_translation_urls_cache_on_page_change(instance, **kwargs):  # pylint: disable=unused-argument
+    translation_key = instance.translation_key
+    transaction.on_commit(lambda: invalidate_translation_urls_cache(translation_key))
+
+
+def invalidate_translation_urls_cache_on_change(**kwargs):  # pylint: disable=unused-argument
+    # e.g. a move, which changes the URLs of all the pages below the moved page
+    transaction.on_commit(invalidate_translation_urls_cache)
+
+
+def update_series_latest_pages(series_paths) -> None:
+    for series_model in SeriesPageMixin.__subclasses__():
+        # in a consistent order, so that concurrent updates can't deadlock
+        for series in series_model.objects.filter(path__in=set(series_paths)).order_by("path"):
+            series.update_latest_page()
+
+
+def update_series_latest_page(series_path: str) -> None:
+    # Coalesced when many pages are published together, e.g. in a bundle, and run once
+    # they've been committed, so the bundle's transaction doesn't hold the series' locks.
+    # Otherwise, bundles publishing into the same series in a different order could deadlock.
+    defer_or_run(update_series_latest_pages, series_path, key=series_path)
+
+
+def get_parent_path(page: Page) -> str:
+    return page.path[: -page.steplen]
+
+
+def update_series_latest_page_on_status_change(instance, **kwargs):  # pylint: disable=unused-argument
+    update_series_latest_page(get_parent_path(instance))
+
+
+def update_series_latest_page_on_move(
+    instance, parent_page_before, parent_page_after, **kwargs
+):  # pylint: disable=unused-argument
+    update_series_latest_pages([parent_page_before.path, parent_page_after.path])
+
+
+def update_series_latest_page_on_delete(instance, **kwargs):  # pylint: disable=unused-argument
+    # The series may be being deleted too, and its other children may not have been
+    # deleted yet, so wait until the deletion is committed.
+    series_path = get_parent_path(instance)
+    transaction.on_commit(lambda: update_series_latest_pages([series_path]))
+
+
+def register_signal_handlers():
+    page_published.connect(invalidate_block_render_cache_on_change, dispatch_uid="block_render_cache_publish")
+    page_unpublished.connect(invalidate_block_render_cache_on_change, dispatch_uid="block_render_cache_unpublish")
+    page_published.connect(invalidate_page_listing_cache_on_change, dispatch_uid="page_listing_cache_publish")
+    page_unpublished.connect(invalidate_page_listing_cache_on_change, dispatch_uid="page_listing_cache_unpublish")
+    page_published.connect(
+        invalidate_translation_urls_cache_on_page_change, dispatch_uid="translation_urls_cache_publish"
+    )
+    page_unpublished.connect(
+        invalidate_translation_urls_cache_on_page_change, dispatch_uid="translation_urls_cache_unpublish"
+    )
+    post_delete.connect(
+        invalidate_translation_urls_cache_on_page_change, sender=Page, dispatch_uid="translation_urls_cache_delete"
+    )
+    post_page_move.connect(invalidate_translation_urls_cache_on_change, dispatch_uid="translation_urls_cache_move")
+    page_slug_changed.connect(
+        invalidate_translation_urls_cache_on_change, dispatch_uid="translation_urls_cache_slug_changed"
+    )
+    post_save.connect(
+        invalidate_translation_urls_cache_on_change, sender=Locale, dispatch_uid="translation_urls_cache_locale"
+    )
+    post_delete.connect(
+        invalidate_translation_urls_cache_on_change, sender=Locale, dispatch_uid="translation_urls_cache_locale_delete"
+    )
+    page_published.connect(invalidate_related_pages_cache_on_change, dispatch_uid="related_pages_cache_publish")
+    page_unpublished.connect(invalidate_related_pages_cache_on_change, dispatch_uid="related_pages_cache_unpublish")
+    post_page_move.connect(invalidate_related_pages_cache_on_change, dispatch_uid="related_pages_cache_move")
+    page_slug_changed.connect(invalidate_related_pages_cache_on_change, dispatch_uid="related_pages_cache_slug_changed")
+    post_save.connect(
+        invalidate_related_pages_cache_on_change,
+        sender=PageViewRestriction,
+        dispatch_uid="related_pages_cache_view_restriction",
+    )
+    post_delete.connect(
+        invalidate_related_pages_cache_on_change,
+        sender=PageViewRestriction,
+        dispatch_uid="related_pages_cache_view_restriction_delete",
+    )
+    post_save.connect(invalidate_block_render_cache_on_change, sender=Chart, dispatch_uid="block_render_cache_chart")
+    post_delete.connect(
+        invalidate_block_render_cache_on_change, sender=Chart, dispatch_uid="block_render_cache_chart_delete"
+    )
+
+    for series_model in SeriesPageMixin.__subclasses__():
+        release_model = series_model.release_model
+        uid = f"series_latest_page_{release_model._meta.label_lower}"
+        page_published.connect(
+            update_series_latest_page_on_status_change, sender=release_model, dispatch_uid=f"{uid}_publish"
+        )
+        page_unpublished.connect(
+            update_series_latest_page_on_status_change, sender=release_model, dispatch_uid=f"{uid}_unpublish"
+        )
+        post_page_move.connect(update_series_latest_page_on_move, sender=release_model, dispatch_uid=f"{uid}_move")
+        post_delete.connect(update_series_latest_page_on_delete, sender=release_model, dispatch_uid=f"{uid}_delete")
@@ -0,0 +1,137 @@
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from itertools import zip_longest
+
+from markupsafe import Markup, escape
+
+
+# Tables with at least this many cells are rendered with `CompactTable`, rather
+# than by building a dict per cell for the `onsTable` macro.
+COMPACT_RENDER_MIN_CELLS = 1000
+
+# Placeholder for the cells missing from ragged rows
+_MISSING = object()
+
+
+@dataclass(slots=True)
+class CompactTable:
+    """
+    A compact representation of a table: the body is stored column by column,
+    and cell metadata (hidden cells, class names and spans) is stored sparsely,
+    keyed by the flat cell index (`row * column_count + column`).
+
+    `iter_html()` streams the same markup as the `onsTable` macro (without
+    variants), one row at a time.
+    """
+
+    columns: list[list]
+    header: list | None = None
+    caption: str | None = None
+    column_count: int = 0
+    first_body_row: int = 0
+    hidden: set[int] = field(default_factory=set)
+    classnames: dict[int, str] = field(default_factory=dict)
+    spans: dict[int, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_table_block_value(cls, value: dict, to_classname: Callable[[str], str]) -> "CompactTable":
+        data = value.get("data") or []
+        has_header = bool(data) and value.get("first_row_is_table_header", False)
+        column_count = max(map(len, data), default=0)
+        body = data[1:] if has_header else data
+
+        table = cls(
+            columns=[list(column) for column in zip_longest(*body, fillvalue=_MISSING)],
+            header=data[0] if has_header else None,
+            caption=value.get("table_caption"),
+            column_count=column_count,
+            first_body_row=1 if has_header else 0,
+        )
+
+        for meta in value.get("cell") or []:
+            index = meta["row"] * column_count + meta["col"]
+            if "className" in meta and (classname := to_classname(meta["className"])):
+                table.classnames[index] = classname
+            if meta.get("hidden"):
+                table.hidden.add(index)
+
+        for merge in value.get("mergeCells") or []:
+            span = ""
+            if merge["rowspan"] > 1:
+                span += f'rowspan="{merge["rowspan"]}" '
+            if merge["colspan"] > 1:
+                span += f'colspan="{merge["colspan"]}" '
+            if span:
+                table.spans[merge["row"] * column_count + merge["col"]] = span
+
+        return table
+
+    @classmethod
+    def from_typed_table(cls, table, caption: str | None = None) -> "CompactTable":
+        """
+        Build from a Wagtail `TypedTable`. Cells are rendered column by column with
+        their column's block, without binding a block per cell.
+        """
+        columns = []
+        for column_idx, column in enumerate(table.columns):
+            render = column["block"].render
+            columns.append([render(row["values"][column_idx]) for row in table.row_data])
+
+        return cls(
+            columns=columns,
+            header=[column["heading"] for column in table.columns],
+            caption=caption,
+            column_count=len(columns),
+        )
+
+    def iter_html(self) -> Iterator[str]:
+        yield '<table class="ons-table">'
+        if self.caption:
+            yield f'<caption class="ons-table__caption">{escape(self.caption)}</caption>'
+
+        yield '<thead class="ons-table__head"><tr class="ons-table__row">'
+        for column_idx, cell in enumerate(self.header or []):
+            if column_idx in self.hidden:
+                continue
+            span = self.spans.get(column_idx, "")
+            yield (
+                f'<th scope="col" class="ons-table__header" {span}>'
+                f'<span class="ons-table__header-text">{escape(cell or "")}</span></th>'
+            )
+        yield '</tr></thead><tbody class="ons-table__body">'
+
+        # only rows containing hidden, classed or spanned cells need per-cell lookups
+        column_count = self.column_count or 1
+        metadata_rows = {index // column_count for index in (*self.hidden, *self.classnames, *self.spans)}
+        for row_idx, row in enumerate(zip(*self.columns), self.first_body_row):
+            if row_idx in metadata_rows:
+                yield self._render_row_with_metadata(row, row_idx * self.column_count)
+            else:
+                yield (
+                    '<tr class="ons-table__row">'
+                    + "".join(
+                        f'<td class="ons-table__cell">{cell}</td>' if cell else '<td class="ons-table__cell"></td>'
+                        for cell in row
+                        if cell is not _MISSING
+                    )
+                    + "</tr>"
+                )
+
+        yield "</tbody></table>"
+
+    def _render_row_with_metadata(self, row, row_start: int) -> str:
+        tds = []
+        for column_idx, cell in enumerate(row):
+            index = row_start + column_idx
+            if cell is _MISSING or index in self.hidden:
+                continue
+            classname = self.classnames.get(index)
+            span = self.spans.get(index, "")
+            tds.append(
+                f'<td class="ons-table__cell{" " + classname if classname else ""}" {span}>{cell if cell else ""}</td>'
+            )
+        return '<tr class="ons-table__row">' + "".join(tds) + "</tr>"
+
+    def render(self) -> Markup:
+        # cell values are output as-is, matching the `onsTable` macro's `td.value | safe`
+        return Markup("".join(self.iter_html()))
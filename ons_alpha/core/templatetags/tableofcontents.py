@@ -2,6 +2,8 @@ import jinja2
 
 from django_jinja import library
 
+from ons_alpha.core.models.mixins import get_table_of_contents_items
+
 
 @library.global_function
 @library.render_with("templates/components/navigation/table-of-contents.html")
@@ -10,9 +12,10 @@ def table_of_contents(context, page, attr_name, options=None):  # pylint: disabl
     if options is None:
         options = {}
 
-    toc_items = []
-    for block in getattr(page, attr_name):
-        if hasattr(block.block, "to_table_of_contents_items"):
-            toc_items.extend(block.block.to_table_of_contents_items(block.value))
+    if getattr(page, "toc_stream_field_name", None) == attr_name:
+        # use the items stored when the page was saved
+        toc_items = page.get_stream_toc_items()
+    else:
+        toc_items = get_table_of_contents_items(getattr(page, attr_name))
 
     return {"options": {"lists": [{"itemsList": toc_items}], **options}}
@@ -0,0 +1,101 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils import translation
+from wagtail.blocks import RichTextBlock
+from wagtail.models import Locale, Site
+
+from ons_alpha.core.cache import get_block_render_cache_key, invalidate_block_render_cache, render_block_cached
+from ons_alpha.standardpages.factories import InformationPageFactory
+from ons_alpha.utils.jinja2tags import get_translation_urls
+
+
+@override_settings(BLOCK_RENDER_CACHE_TIMEOUT=60)
+class BlockRenderCacheTestCase(TestCase):
+    def setUp(self):
+        self.page = InformationPageFactory()
+        self.page.body = [("paragraph", "<p>Hello</p>")]
+        self.page.save_revision().publish()
+        self.page.refresh_from_db()
+        self.request = RequestFactory().get("/")
+
+    def get_context(self):
+        return {"page": self.page, "request": self.request}
+
+    def test_rendered_html_is_cached(self):
+        block = self.page.body[0]
+        with mock.patch.object(RichTextBlock, "render", wraps=block.block.render) as render:
+            first = render_block_cached(block, self.get_context())
+            second = render_block_cached(block, self.get_context())
+
+        self.assertEqual(render.call_count, 1)
+        self.assertEqual(first, second)
+        self.assertIn("Hello", second)
+
+    def test_key_changes_on_publish(self):
+        key = get_block_render_cache_key(self.page, self.page.body[0], self.request)
+
+        self.page.save_revision().publish()
+        self.page.refresh_from_db()
+
+        self.assertNotEqual(get_block_render_cache_key(self.page, self.page.body[0], self.request), key)
+
+    def test_key_changes_on_invalidation(self):
+        key = get_block_render_cache_key(self.page, self.page.body[0], self.request)
+        invalidate_block_render_cache()
+        self.assertNotEqual(get_block_render_cache_key(self.page, self.page.body[0], self.request), key)
+
+    def test_previews_are_keyed_by_content(self):
+        self.request.is_preview = True
+        key = get_block_render_cache_key(self.page, self.page.body[0], self.request)
+
+        self.page.body = [("paragraph", "<p>Changed</p>")]
+
+        self.assertNotEqual(get_block_render_cache_key(self.page, self.page.body[0], self.request), key)
+
+    @override_settings(BLOCK_RENDER_CACHE_TIMEOUT=0)
+    def test_cache_can_be_disabled(self):
+        block = self.page.body[0]
+        with mock.patch.object(RichTextBlock, "render", wraps=block.block.render) as render:
+            render_block_cached(block, self.get_context())
+            render_block_cached(block, self.get_context())
+
+        self.assertEqual(render.call_count, 2)
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class TranslationUrlsCacheTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        Locale.objects.get_or_create(language_code="cy")
+        site = Site.objects.get(is_default_site=True)
+        self.page = InformationPageFactory(parent=site.root_page)
+        self.page.save_revision().publish()
+        self.request = RequestFactory().get("/")
+        self.request._wagtail_site = site  # pylint: disable=protected-access
+
+    def get_urls(self):
+        return {url["isoCode"]: url for url in get_translation_urls({"page": self.page, "request": self.request})}
+
+    def test_urls_are_cached(self):
+        urls = self.get_urls()
+        self.assertEqual(urls["en"]["url"], self.page.get_url())
+        self.assertEqual(urls["cy"]["url"], f"/cy{self.page.get_url()}")
+        self.assertTrue(urls["en"]["current"])
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get_urls(), urls)
+
+        with translation.override("cy"):
+            self.assertTrue(self.get_urls()["cy"]["current"])
+
+    def test_cache_is_invalidated_when_a_translation_is_published(self):
+        self.assertEqual(self.get_urls()["cy"]["url"], f"/cy{self.page.get_url()}")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            translated = self.page.copy_for_translation(Locale.objects.get(language_code="cy"), copy_parents=True)
+            translated.save_revision().publish()
+
+        translated.refresh_from_db()
+        self.assertEqual(self.get_urls()["cy"]["url"], translated.get_url(request=self.request))
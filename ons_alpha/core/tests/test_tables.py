@@ -0,0 +1,48 @@
+from django.test import SimpleTestCase
+
+from ons_alpha.core.blocks import TableBlock
+from ons_alpha.core.tables import COMPACT_RENDER_MIN_CELLS, CompactTable
+
+
+class CompactTableTestCase(SimpleTestCase):
+    def setUp(self):
+        self.block = TableBlock()
+
+    def render(self, value):
+        to_ons_classname = self.block._to_ons_classname  # pylint: disable=protected-access
+        return CompactTable.from_table_block_value(value, to_ons_classname).render()
+
+    def test_renders_header_and_body(self):
+        html = self.render(
+            {
+                "data": [["<Year>", "Value"], ["2023", "<b>1</b>"], ["2024", None]],
+                "first_row_is_table_header": True,
+                "table_caption": "Figures",
+            }
+        )
+
+        self.assertIn('<caption class="ons-table__caption">Figures</caption>', html)
+        self.assertIn('<span class="ons-table__header-text">&lt;Year&gt;</span>', html)
+        self.assertIn('<td class="ons-table__cell"><b>1</b></td>', html)
+        self.assertIn('<td class="ons-table__cell"></td>', html)
+        self.assertEqual(html.count('<tr class="ons-table__row">'), 3)
+
+    def test_applies_cell_metadata(self):
+        html = self.render(
+            {
+                "data": [["a", "b"], ["c", "d"]],
+                "cell": [{"row": 1, "col": 0, "className": "htRight"}, {"row": 1, "col": 1, "hidden": True}],
+                "mergeCells": [{"row": 0, "col": 0, "rowspan": 1, "colspan": 2}],
+            }
+        )
+
+        self.assertIn('<td class="ons-table__cell" colspan="2" >a</td>', html)
+        self.assertIn('<td class="ons-table__cell ons-u-ta-right" >c</td>', html)
+        self.assertNotIn(">d<", html)
+
+    def test_block_uses_compact_renderer_for_large_tables(self):
+        small = {"data": [["a", "b"]]}
+        large = {"data": [["cell"] * 10] * (COMPACT_RENDER_MIN_CELLS // 10)}
+
+        self.assertNotIn("table_html", self.block.get_context(small))
+        self.assertIn("table_html", self.block.get_context(large))
@@ -0,0 +1,45 @@
+from unittest import mock
+
+from django.test import TestCase
+from wagtail.models import Page
+
+from ons_alpha.core.blocks import HeadingBlock
+from ons_alpha.methodologies.models import MethodologyPage
+
+
+class TableOfContentsMixinTestCase(TestCase):
+    def setUp(self):
+        self.page = Page.get_first_root_node().add_child(
+            instance=MethodologyPage(
+                title="Methodology",
+                summary="Summary",
+                body=[("heading", "First section"), ("rich_text", "<p>Text</p>")],
+            )
+        )
+
+    def test_items_are_stored_on_save(self):
+        self.page.refresh_from_db()
+        self.assertEqual(self.page.stream_toc_items, [{"url": "#first-section", "text": "First section"}])
+
+    def test_toc_uses_stored_items(self):
+        page = MethodologyPage.objects.get(pk=self.page.pk)
+
+        with mock.patch.object(HeadingBlock, "to_table_of_contents_items") as to_table_of_contents_items:
+            toc = page.toc
+
+        to_table_of_contents_items.assert_not_called()
+        self.assertEqual(
+            toc, [{"url": "#summary", "text": "Summary"}, {"url": "#first-section", "text": "First section"}]
+        )
+
+    def test_revisions_store_updated_items(self):
+        self.page.body = [("heading", "Second section")]
+        revision = self.page.save_revision()
+
+        self.assertEqual(revision.as_object().stream_toc_items, [{"url": "#second-section", "text": "Second section"}])
+
+    def test_items_are_computed_when_missing(self):
+        MethodologyPage.objects.filter(pk=self.page.pk).update(stream_toc_items=None)
+        page = MethodologyPage.objects.get(pk=self.page.pk)
+
+        self.assertEqual(page.get_stream_toc_items(), [{"url": "#first-section", "text": "First section"}])
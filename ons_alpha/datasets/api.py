@@ -0,0 +1,85 @@
+import threading
+
+from dataclasses import asdict, dataclass
+
+import requests
+
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+@dataclass
+class ApiMetricsSnapshot:
+    requests: int
+    errors: int
+    total_latency: float
+
+    @property
+    def average_latency(self) -> float:
+        return self.total_latency / self.requests if self.requests else 0.0
+
+
+class ApiMetrics:
+    """
+    Thread-safe counters for ONS API usage in this process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._requests = 0
+            self._errors = 0
+            self._total_latency = 0.0
+
+    def record_request(self, latency: float, *, error: bool = False) -> None:
+        with self._lock:
+            self._requests += 1
+            self._total_latency += latency
+            if error:
+                self._errors += 1
+
+    def snapshot(self) -> ApiMetricsSnapshot:
+        with self._lock:
+            return ApiMetricsSnapshot(
+                requests=self._requests,
+                errors=self._errors,
+                total_latency=self._total_latency,
+            )
+
+    def as_dict(self) -> dict:
+        snapshot = self.snapshot()
+        return {**asdict(snapshot), "average_latency": snapshot.average_latency}
+
+
+api_metrics = ApiMetrics()
+
+_local = threading.local()
+
+
+def get_api_session() -> requests.Session:
+    """
+    Returns a keep-alive `requests.Session` for the current thread, with a
+    connection pool and retries for idempotent requests that fail on transient errors.
+    """
+    session = getattr(_local, "session", None)
+    if session is None:
+        adapter = HTTPAdapter(
+            pool_maxsize=getattr(settings, "ONS_API_POOL_MAXSIZE", 10),
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504], allowed_methods=["GET"]),
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _local.session = session
+    return session
+
+
+def get_api_timeout() -> tuple[float, float]:
+    return (
+        getattr(settings, "ONS_API_CONNECT_TIMEOUT", 3.05),
+        getattr(settings, "ONS_API_READ_TIMEOUT", 10),
+    )
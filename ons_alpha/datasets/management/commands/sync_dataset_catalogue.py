@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand, CommandError
+from requests import RequestException
+
+from ons_alpha.datasets.sync import sync_dataset_catalogue
+
+
+class Command(BaseCommand):
+    help = "Mirrors the ONS dataset API catalogue locally, for use by the dataset chooser."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--page-size",
+            type=int,
+            default=1000,
+            help="The number of datasets to request from the API at a time.",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            default=False,
+            help="Fetch the full catalogue, even if the API reports that it hasn't changed.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            result = sync_dataset_catalogue(page_size=options["page_size"], force=options["force"])
+        except RequestException as e:
+            raise CommandError(f"Failed to fetch the dataset catalogue: {e}") from e
+
+        if result.not_modified:
+            self.stdout.write("Dataset catalogue not modified")
+            return
+
+        self.stdout.write(
+            f"Dataset catalogue synced: {result.created} created, {result.updated} updated, {result.deleted} deleted"
+        )
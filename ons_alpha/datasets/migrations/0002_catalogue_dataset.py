@@ -0,0 +1,32 @@
+# Generated by Django 4.2.16 on 2026-10-18 00:53
+
+import wagtail.search.index
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datasets", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CatalogueDataset",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False)),
+                ("dataset_id", models.CharField(max_length=255, unique=True)),
+                ("title", models.CharField(db_index=True, max_length=255)),
+                ("description", models.TextField(blank=True)),
+                ("version", models.CharField(max_length=255)),
+                ("url", models.URLField(max_length=500)),
+                ("edition", models.CharField(max_length=255)),
+                ("last_synced", models.DateTimeField()),
+            ],
+            options={
+                "ordering": ["title"],
+            },
+            bases=(wagtail.search.index.Indexed, models.Model),
+        ),
+    ]
@@ -5,6 +5,7 @@ from django.conf import settings
 from django.db import models
 from django.db.models import UniqueConstraint
 from queryish.rest import APIModel, APIQuerySet
+from wagtail.search import index
 
 
 logger = logging.getLogger(__name__)
@@ -12,7 +13,6 @@ logger = logging.getLogger(__name__)
 EDITIONS_PATTERN = re.compile(r"/editions/([^/]+)/")
 
 
-# This needs a revisit. Consider caching + fewer requests
 class ONSApiQuerySet(APIQuerySet):
     def get_results_from_response(self, response):
         logger.info("Fetching results from response")
@@ -72,6 +72,39 @@ class ONSDataset(APIModel):
         return self.title
 
 
+class CatalogueDataset(index.Indexed, models.Model):
+    """
+    A local mirror of a dataset in the ONS dataset API catalogue, so that the dataset
+    chooser can search and paginate without calling the API. Kept up to date by the
+    `sync_dataset_catalogue` management command.
+    """
+
+    dataset_id = models.CharField(max_length=255, unique=True)
+    title = models.CharField(max_length=255, db_index=True)
+    description = models.TextField(blank=True)
+    version = models.CharField(max_length=255)
+    url = models.URLField(max_length=500)
+    edition = models.CharField(max_length=255)
+    last_synced = models.DateTimeField()
+
+    search_fields = [
+        index.SearchField("title"),
+        index.AutocompleteField("title"),
+        index.SearchField("edition"),
+        index.SearchField("version"),
+    ]
+
+    class Meta:
+        ordering = ["title"]
+
+    def __str__(self):
+        return self.title
+
+    @property
+    def formatted_edition(self):
+        return self.edition.replace("-", " ").title()
+
+
 class Dataset(models.Model):
     namespace = models.CharField(max_length=255)
     title = models.CharField(max_length=255)
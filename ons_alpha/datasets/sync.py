@@ -0,0 +1,144 @@
+import logging
+import time
+
+from dataclasses import dataclass
+
+import requests
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from wagtail.search import index
+
+from ons_alpha.datasets.api import api_metrics, get_api_session, get_api_timeout
+from ons_alpha.datasets.models import CatalogueDataset, ONSDataset
+
+
+logger = logging.getLogger(__name__)
+
+# Validators from the last successful sync, used to make conditional requests
+VALIDATORS_CACHE_KEY = "datasets:catalogue:validators"
+
+
+@dataclass
+class CatalogueSyncResult:
+    not_modified: bool = False
+    created: int = 0
+    updated: int = 0
+    deleted: int = 0
+
+
+def fetch_catalogue_page(offset: int, limit: int, headers=None) -> requests.Response:
+    start_time = time.monotonic()
+    try:
+        response = get_api_session().get(
+            settings.ONS_API_DATASET_BASE_URL,
+            params={"offset": offset, "limit": limit},
+            headers=headers,
+            timeout=get_api_timeout(),
+        )
+        response.raise_for_status()
+    except requests.RequestException:
+        api_metrics.record_request(time.monotonic() - start_time, error=True)
+        logger.exception("Dataset catalogue request failed offset=%d", offset)
+        raise
+
+    duration = time.monotonic() - start_time
+    api_metrics.record_request(duration)
+    logger.info(
+        "Dataset catalogue request offset=%d status=%d duration=%.3fms", offset, response.status_code, duration * 1000
+    )
+    return response
+
+
+def sync_dataset_catalogue(page_size: int = 1000, force: bool = False) -> CatalogueSyncResult:
+    """
+    Mirror the ONS dataset API catalogue into `CatalogueDataset`.
+
+    The first page is requested conditionally (using the `ETag` / `Last-Modified`
+    validators from the previous sync), and if the API reports that the catalogue
+    is unchanged, nothing else is fetched. Otherwise, the full catalogue is fetched
+    page by page, changed entries are updated and re-indexed, and entries that are
+    no longer in the catalogue are removed.
+    """
+    validators = {} if force else cache.get(VALIDATORS_CACHE_KEY, {})
+    headers = {}
+    if etag := validators.get("etag"):
+        headers["If-None-Match"] = etag
+    if last_modified := validators.get("last_modified"):
+        headers["If-Modified-Since"] = last_modified
+
+    response = fetch_catalogue_page(0, page_size, headers=headers)
+    if response.status_code == 304:
+        logger.info("Dataset catalogue not modified")
+        return CatalogueSyncResult(not_modified=True)
+
+    new_validators = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+
+    items = []
+    while True:
+        data = response.json()
+        items.extend(data["items"])
+        if not data["items"] or len(items) >= data.get("total_count", 0):
+            break
+        response = fetch_catalogue_page(len(items), page_size)
+
+    result = apply_catalogue_items(items)
+    cache.set(VALIDATORS_CACHE_KEY, {k: v for k, v in new_validators.items() if v}, None)
+    logger.info(
+        "Synced dataset catalogue created=%d updated=%d deleted=%d",
+        result.created,
+        result.updated,
+        result.deleted,
+    )
+    return result
+
+
+def apply_catalogue_items(items: list[dict]) -> CatalogueSyncResult:
+    result = CatalogueSyncResult()
+    now = timezone.now()
+    fields = ["title", "description", "version", "url", "edition"]
+
+    incoming = {}
+    for item in items:
+        try:
+            dataset = ONSDataset.from_query_data(item)
+        except (KeyError, AttributeError, TypeError):
+            logger.warning("Skipping malformed dataset catalogue item id=%s", item.get("id"))
+            continue
+        incoming[dataset.id] = {field: getattr(dataset, field) or "" for field in fields}
+
+    with transaction.atomic():
+        existing = {obj.dataset_id: obj for obj in CatalogueDataset.objects.all()}
+
+        to_create = []
+        to_update = []
+        for dataset_id, values in incoming.items():
+            if (obj := existing.get(dataset_id)) is None:
+                to_create.append(CatalogueDataset(dataset_id=dataset_id, last_synced=now, **values))
+            elif any(getattr(obj, field) != value for field, value in values.items()):
+                for field, value in values.items():
+                    setattr(obj, field, value)
+                obj.last_synced = now
+                to_update.append(obj)
+
+        to_delete = [obj for dataset_id, obj in existing.items() if dataset_id not in incoming]
+
+        CatalogueDataset.objects.bulk_create(to_create, batch_size=500)
+        CatalogueDataset.objects.bulk_update(to_update, [*fields, "last_synced"], batch_size=500)
+        CatalogueDataset.objects.filter(pk__in=[obj.pk for obj in to_delete]).delete()
+
+    # bulk operations don't trigger search index updates, so handle them here
+    for obj in CatalogueDataset.objects.filter(dataset_id__in=[obj.dataset_id for obj in to_create + to_update]):
+        index.insert_or_update_object(obj)
+    for obj in to_delete:
+        index.remove_object(obj)
+
+    result.created = len(to_create)
+    result.updated = len(to_update)
+    result.deleted = len(to_delete)
+    return result
@@ -0,0 +1,42 @@
+from unittest import mock
+
+import requests
+
+from django.test import SimpleTestCase
+
+from ons_alpha.datasets.api import api_metrics, get_api_session
+from ons_alpha.datasets.sync import fetch_catalogue_page
+
+
+class FetchCataloguePageTestCase(SimpleTestCase):
+    def setUp(self):
+        api_metrics.reset()
+        session_patcher = mock.patch("ons_alpha.datasets.sync.get_api_session")
+        self.session = session_patcher.start().return_value
+        self.addCleanup(session_patcher.stop)
+
+    def test_records_requests(self):
+        self.session.get.return_value = mock.Mock(status_code=200)
+
+        with self.assertLogs("ons_alpha.datasets.sync", "INFO"):
+            fetch_catalogue_page(0, 10)
+            fetch_catalogue_page(10, 10)
+
+        self.assertEqual(self.session.get.call_count, 2)
+        self.assertEqual(self.session.get.call_args.kwargs["params"], {"offset": 10, "limit": 10})
+        metrics = api_metrics.snapshot()
+        self.assertEqual((metrics.requests, metrics.errors), (2, 0))
+
+    def test_records_errors(self):
+        self.session.get.side_effect = requests.ConnectionError
+
+        with self.assertLogs("ons_alpha.datasets.sync", "ERROR"), self.assertRaises(requests.ConnectionError):
+            fetch_catalogue_page(0, 10)
+
+        metrics = api_metrics.snapshot()
+        self.assertEqual((metrics.requests, metrics.errors), (1, 1))
+
+
+class ApiSessionTestCase(SimpleTestCase):
+    def test_session_is_reused(self):
+        self.assertIs(get_api_session(), get_api_session())
@@ -0,0 +1,125 @@
+import json
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from ons_alpha.datasets.models import CatalogueDataset
+from ons_alpha.datasets.sync import sync_dataset_catalogue
+
+
+def make_item(dataset_id, title, version=1):
+    return {
+        "id": dataset_id,
+        "title": title,
+        "description": f"{title} description",
+        "links": {
+            "latest_version": {
+                "id": str(version),
+                "href": f"https://api.example.com/v1/datasets/{dataset_id}/editions/time-series/versions/{version}",
+            }
+        },
+    }
+
+
+class StubCatalogueHandler(BaseHTTPRequestHandler):
+    items: list[dict] = []
+    etag = '"v1"'
+    requests: list[dict] = []
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        params = parse_qs(urlparse(self.path).query)
+        self.requests.append({"params": params, "if_none_match": self.headers.get("If-None-Match")})
+
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        offset, limit = int(params["offset"][0]), int(params["limit"][0])
+        page = self.items[offset : offset + limit]
+        body = json.dumps(
+            {"items": page, "count": len(page), "offset": offset, "limit": limit, "total_count": len(self.items)}
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", self.etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class DatasetCatalogueTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubCatalogueHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.settings_override = override_settings(
+            ONS_API_DATASET_BASE_URL=f"http://127.0.0.1:{cls.server.server_port}/v1/datasets"
+        )
+        cls.settings_override.enable()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.settings_override.disable()
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        cache.clear()
+        StubCatalogueHandler.items = [make_item(f"dataset-{i}", f"Dataset {i}") for i in range(5)]
+        StubCatalogueHandler.etag = '"v1"'
+        StubCatalogueHandler.requests = []
+
+    def test_sync_fetches_all_pages(self):
+        result = sync_dataset_catalogue(page_size=2)
+
+        self.assertEqual(result.created, 5)
+        self.assertEqual(len(StubCatalogueHandler.requests), 3)
+        self.assertEqual(CatalogueDataset.objects.count(), 5)
+        dataset = CatalogueDataset.objects.get(dataset_id="dataset-0")
+        self.assertEqual(dataset.edition, "time-series")
+        self.assertEqual(dataset.version, "1")
+
+    def test_sync_uses_conditional_requests(self):
+        sync_dataset_catalogue()
+        StubCatalogueHandler.requests = []
+
+        result = sync_dataset_catalogue()
+
+        self.assertTrue(result.not_modified)
+        self.assertEqual(StubCatalogueHandler.requests[0]["if_none_match"], '"v1"')
+        self.assertEqual(len(StubCatalogueHandler.requests), 1)
+
+    def test_sync_applies_changes(self):
+        sync_dataset_catalogue()
+        StubCatalogueHandler.etag = '"v2"'
+        StubCatalogueHandler.items = [make_item("dataset-0", "Dataset 0", version=2), make_item("new", "New")]
+
+        result = sync_dataset_catalogue()
+
+        self.assertEqual((result.created, result.updated, result.deleted), (1, 1, 4))
+        self.assertEqual(
+            list(CatalogueDataset.objects.values_list("dataset_id", "version")), [("dataset-0", "2"), ("new", "1")]
+        )
+
+    def test_chooser_searches_local_catalogue(self):
+        sync_dataset_catalogue()
+        StubCatalogueHandler.requests = []
+        self.client.force_login(get_user_model().objects.create_superuser("admin", "admin@example.com", "password"))
+
+        response = self.client.get(reverse("dataset_chooser:choose_results"), {"q": "Dataset 3"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Dataset 3")
+        self.assertNotContains(response, "Dataset 2")
+        self.assertEqual(StubCatalogueHandler.requests, [])
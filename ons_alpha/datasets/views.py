@@ -1,6 +1,7 @@
 from django import forms
+from django.shortcuts import get_object_or_404
 from django.views import View
-from wagtail.admin.forms.choosers import BaseFilterForm
+from wagtail.admin.forms.choosers import BaseFilterForm, SearchFilterMixin
 from wagtail.admin.ui.tables import Column
 from wagtail.admin.views.generic.chooser import (
     BaseChooseView,
@@ -12,7 +13,7 @@ from wagtail.admin.views.generic.chooser import (
 )
 from wagtail.admin.viewsets.chooser import ChooserViewSet
 
-from ons_alpha.datasets.models import Dataset, ONSDataset
+from ons_alpha.datasets.models import CatalogueDataset, Dataset
 
 
 class DatasetBaseChooseViewMixin:
@@ -24,42 +25,27 @@ class DatasetBaseChooseViewMixin:
         ]
 
 
-class CustomSearchFilterMixin(forms.Form):
+class CustomSearchFilterMixin(SearchFilterMixin):
     q = forms.CharField(
         label="Search datasets",
         widget=forms.TextInput(attrs={"placeholder": "Dataset title"}),
         required=False,
     )
 
-    def filter(self, objects):
-        objects = super().filter(objects)
-        search_query = self.cleaned_data.get("q")
-        if search_query:
-            search_query_lower = search_query.strip().lower()
-            # This is brittle, as it doesn't use dynamically set search fields
-            objects = [
-                obj
-                for obj in objects
-                if search_query_lower in obj.title.lower()
-                or search_query_lower in obj.formatted_edition.lower()
-                or search_query_lower in obj.version.lower()
-            ]
-            self.is_searching = True
-            self.search_query = search_query
-        return objects
-
 
 class CustomFilterForm(CustomSearchFilterMixin, BaseFilterForm): ...
 
 
 class ONSDatasetBaseChooseView(BaseChooseView):
-    model_class = ONSDataset
-    filter_form_class = CustomFilterForm
+    """
+    Lists datasets from the local mirror of the ONS dataset API catalogue (see
+    `ons_alpha.datasets.sync`), so that searching and pagination happen in the
+    database rather than against the API.
+    """
 
-    def get_object_list(self):
-        # Due to pagination this is required for search to check entire list
-        # The hardcoded limit will need changing.
-        return self.model_class.objects.filter(limit=1000)
+    model_class = CatalogueDataset
+    filter_form_class = CustomFilterForm
+    ordering = ["title", "pk"]
 
     def render_to_response(self):
         raise NotImplementedError()
@@ -80,11 +66,11 @@ class DatasetChooseResultsView(DatasetBaseChooseViewMixin, CustomChooseResultVie
 class DatasetChosenView(ChosenViewMixin, ChosenResponseMixin, View):
     def get_object(self, pk):
         # get_object is called before get_chosen_response_data
-        # and self.model_class is Dataset, so we get or create the Dataset from ONSDatasets here
-        # create the dataset object from the API response
-        item = ONSDataset.objects.get(pk=pk)
+        # and self.model_class is Dataset, so we get or create the Dataset from the
+        # local catalogue entry here
+        item = get_object_or_404(CatalogueDataset, pk=pk)
         dataset, _ = Dataset.objects.get_or_create(
-            namespace=item.id,
+            namespace=item.dataset_id,
             edition=item.edition,
             version=item.version,
             defaults={
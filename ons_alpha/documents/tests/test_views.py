@@ -0,0 +1,71 @@
+from django.contrib.auth import get_user_model
+from django.http import Http404
+from django.test import RequestFactory, TestCase, override_settings
+from wagtail.documents import get_document_model
+from wagtail.models import Collection
+from wagtail_factories import DocumentFactory
+
+from ons_alpha.documents.views import serve
+
+
+@override_settings(PRIVATE_MEDIA_SERVE_METHOD="stream")
+class DocumentServeViewTestCase(TestCase):
+    def setUp(self):
+        self.document = DocumentFactory(
+            collection=Collection.objects.get(name="Private"), file__data=b"0123456789", file__filename="data.csv"
+        )
+        # the private collection is restricted to logged in users
+        self.client.force_login(get_user_model().objects.create_user(username="user"))
+
+    def test_private_documents_are_streamed(self):
+        response = self.client.get(self.document.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), b"0123456789")
+        self.assertEqual(response["Content-Length"], "10")
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertEqual(response["Content-Disposition"], self.document.content_disposition)
+
+    def test_range_request(self):
+        response = self.client.get(self.document.url, headers={"range": "bytes=2-4"})
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b"".join(response.streaming_content), b"234")
+        self.assertEqual(response["Content-Range"], "bytes 2-4/10")
+        self.assertEqual(response["Content-Length"], "3")
+
+    def test_if_range_must_match_the_etag(self):
+        response = self.client.get(self.document.url, headers={"range": "bytes=2-4", "if-range": '"outdated"'})
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get(
+            self.document.url, headers={"range": "bytes=2-4", "if-range": f'"{self.document.file_hash}"'}
+        )
+        self.assertEqual(response.status_code, 206)
+
+    def test_conditional_request(self):
+        response = self.client.get(self.document.url, headers={"if-none-match": f'"{self.document.file_hash}"'})
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_public_documents_redirect_to_storage(self):
+        document = get_document_model().objects.get(pk=self.document.pk)
+        get_document_model().objects.bulk_make_public([document])
+
+        response = self.client.get(self.document.url)
+
+        self.assertRedirects(response, document.file.url, fetch_redirect_response=False)
+
+    def test_filename_must_match(self):
+        request = RequestFactory().get("/")
+
+        with self.assertRaises(Http404):
+            serve(request, self.document.pk, "other.csv")
+
+    def test_private_documents_require_login(self):
+        self.client.logout()
+
+        response = self.client.get(self.document.url)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertIn("login", response["Location"])
@@ -0,0 +1,44 @@
+from django.http import Http404, HttpResponse
+from django.shortcuts import get_object_or_404, redirect
+from django.views.decorators.http import etag
+from wagtail import hooks
+from wagtail.documents import get_document_model
+from wagtail.documents.models import document_served
+from wagtail.documents.views.serve import document_etag
+
+from ons_alpha.private_media.serving import serve_private_file
+
+
+@etag(document_etag)
+def serve(request, document_id, document_filename):
+    """
+    Serve a document, like Wagtail's `serve` view, but without tying up a worker for
+    the whole download. Public documents with up-to-date ACLs are redirected to their
+    storage (or CDN) URL, and private documents are served with `serve_private_file()`.
+    """
+    Document = get_document_model()
+    doc = get_object_or_404(Document, id=document_id)
+
+    # Make sure the filename in the URL matches the document, as Wagtail does
+    if doc.filename != document_filename:
+        raise Http404("This document does not match the given filename.")
+
+    # e.g. to check collection view restrictions
+    for fn in hooks.get_hooks("before_serve_document"):
+        result = fn(doc, request)
+        if isinstance(result, HttpResponse):
+            return result
+
+    document_served.send(sender=Document, instance=doc, request=request)
+
+    if doc.is_public and doc.acls_are_up_to_date():
+        return redirect(doc.file.url)
+
+    return serve_private_file(
+        doc.file,
+        doc.content_type,
+        request=request,
+        content_disposition=doc.content_disposition,
+        size=doc.file_size,
+        etag=doc.file_hash,
+    )
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class ImagesConfig(AppConfig):
     default_auto_field = "django.db.models.AutoField"
     name = "ons_alpha.images"
+
+    def ready(self):
+        from .signal_handlers import register_signal_handlers  # pylint: disable=import-outside-toplevel
+
+        register_signal_handlers()
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+from wagtail.models import Page
+
+from ons_alpha.images.renditions import warm_page_renditions
+
+
+class Command(BaseCommand):
+    help = "Generates any missing renditions for the images on live pages, e.g. after a template change."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--page", type=int, action="append", dest="page_ids", help="Only warm this page.")
+        parser.add_argument("--chunk-size", type=int, default=100)
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        page_ids = options["page_ids"] or list(
+            Page.objects.live().exclude(depth=1).order_by("pk").values_list("pk", flat=True)
+        )
+
+        created = 0
+        for start in range(0, len(page_ids), chunk_size):
+            created += warm_page_renditions(page_ids[start : start + chunk_size])
+
+        self.stdout.write(f"Created {created} renditions for {len(page_ids)} pages")
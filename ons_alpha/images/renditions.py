@@ -0,0 +1,196 @@
+import logging
+
+from collections import defaultdict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from django.conf import settings
+from django.db.models import Q
+from wagtail.blocks import ListBlock, StreamBlock, StructBlock
+from wagtail.fields import StreamField
+from wagtail.images import get_image_model
+from wagtail.images.blocks import ImageChooserBlock
+from wagtail.images.models import AbstractImage, AbstractRendition, Filter
+from wagtail.models import Page
+from wagtail.snippets.blocks import SnippetChooserBlock
+
+from ons_alpha.core.blocks import ImageBlock
+from ons_alpha.core.models import BasePage, CallToActionSnippet, SocialMediaSettings
+from ons_alpha.private_media import utils
+
+
+logger = logging.getLogger(__name__)
+
+# The filter specs requested by the templates, for each way an image can appear on a page
+IMAGE_BLOCK_FILTER_SPECS = ("width-1000",)  # components/streamfield/image_block.html
+IMAGE_CHOOSER_BLOCK_FILTER_SPECS = ("original",)  # ImageChooserBlock.render_basic()
+CALL_TO_ACTION_FILTER_SPECS = ("fill-450x300",)  # components/cta/call-to-action.html
+SOCIAL_IMAGE_FILTER_SPECS = ("width-1000", "fill-1200x630-c100")  # base_page.html
+RELATED_PAGE_FILTER_SPECS = (BasePage.related_page_image_filter_spec,)
+
+
+def get_page_image_filter_specs(page: Page) -> dict[int, set[str]]:
+    """
+    Returns the filter specs that the templates will request when rendering the
+    (specific) `page`, for each image (by id).
+    """
+    filter_specs = defaultdict(set)
+
+    def add(image, specs):
+        if image_id := getattr(image, "pk", image):
+            filter_specs[image_id].update(specs)
+
+    for field in page._meta.get_fields():
+        if isinstance(field, StreamField):
+            add_block_image_filter_specs(field.stream_block, getattr(page, field.name), add)
+
+    if isinstance(page, BasePage):
+        social_image_id = page.social_image_id
+        if not social_image_id and (site := page.get_site()) is not None:
+            social_image_id = SocialMediaSettings.for_site(site).default_sharing_image_id
+        add(social_image_id, SOCIAL_IMAGE_FILTER_SPECS)
+
+        for related_page in page.related_pages:
+            add(getattr(related_page, "listing_image_id", None), RELATED_PAGE_FILTER_SPECS)
+
+    return filter_specs
+
+
+def add_block_image_filter_specs(block, value, add) -> None:
+    if value is None:
+        return
+    if isinstance(block, ImageBlock):
+        add(value.get("image"), IMAGE_BLOCK_FILTER_SPECS)
+    elif isinstance(block, ImageChooserBlock):
+        add(value, IMAGE_CHOOSER_BLOCK_FILTER_SPECS)
+    elif isinstance(block, SnippetChooserBlock) and isinstance(value, CallToActionSnippet):
+        add(value.image_id, CALL_TO_ACTION_FILTER_SPECS)
+    else:
+        for child_block, child_value in get_child_blocks(block, value):
+            add_block_image_filter_specs(child_block, child_value, add)
+
+
+def get_child_blocks(block, value) -> Iterable[tuple]:
+    """
+    Returns the (block, value) pairs for the children of a structural block.
+    """
+    if isinstance(block, StreamBlock):
+        return [(child.block, child.value) for child in value]
+    if isinstance(block, StructBlock):
+        return [(child_block, value.get(name)) for name, child_block in block.child_blocks.items()]
+    if isinstance(block, ListBlock):
+        return [(block.child_block, item) for item in value]
+    return []
+
+
+def generate_renditions(image: AbstractImage, filters: Iterable[Filter]) -> list[AbstractRendition]:
+    """
+    Returns unsaved renditions of `image` for `filters`, with their files already
+    uploaded to storage. The original is only read from storage once.
+    """
+    with image.open_file() as file:
+        source = file.read()
+
+    renditions = []
+    for image_filter in filters:
+        rendition = image.generate_rendition_instance(image_filter, BytesIO(source))
+        # upload now, so uploads happen concurrently rather than when the renditions are saved
+        rendition.file.save(rendition.file.name, rendition.file.file, save=False)
+        renditions.append(rendition)
+    return renditions
+
+
+def warm_renditions(filter_specs_by_image: dict[int, Iterable[str]], max_workers: int | None = None) -> int:
+    """
+    Generate any of the renditions in `filter_specs_by_image` that don't exist yet,
+    so that visitors don't have to wait for them to be created. Returns the number
+    of renditions created.
+
+    The renditions are generated (and uploaded) on a pool of threads, saved in bulk,
+    and have their ACLs set in a single batch.
+    """
+    if max_workers is None:
+        max_workers = getattr(settings, "RENDITION_WARMING_MAX_WORKERS", 4)
+
+    missing_filters = get_missing_filters(filter_specs_by_image)
+    if not missing_filters:
+        return 0
+
+    renditions = []
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="renditions") as executor:
+        futures = {
+            image: executor.submit(generate_renditions, image, filters) for image, filters in missing_filters.items()
+        }
+        for image, future in futures.items():
+            try:
+                renditions.extend(future.result())
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Failed to generate renditions for image %s", image.pk)
+
+    renditions = remove_existing_renditions(renditions)
+    if not renditions:
+        return 0
+    get_image_model().get_rendition_model().objects.bulk_create(renditions, ignore_conflicts=True)
+
+    set_rendition_acls(renditions)
+    return len(renditions)
+
+
+def get_missing_filters(filter_specs_by_image: dict[int, Iterable[str]]) -> dict[AbstractImage, list[Filter]]:
+    missing_filters = {}
+    images = get_image_model().objects.filter(pk__in=filter_specs_by_image).prefetch_related("renditions")
+    for image in images:
+        filters = [Filter(spec) for spec in sorted(filter_specs_by_image[image.pk])]
+        existing = image.find_existing_renditions(*filters)
+        if to_create := [image_filter for image_filter in filters if image_filter not in existing]:
+            missing_filters[image] = to_create
+    return missing_filters
+
+
+def set_rendition_acls(renditions: list[AbstractRendition]) -> None:
+    """
+    Set the ACLs for new rendition files whose default ACL is wrong, with one batch per ACL.
+    """
+    files_by_acl = defaultdict(list)
+    for rendition in renditions:
+        if acl_name := rendition.image.get_new_rendition_acl():
+            files_by_acl[acl_name].append(rendition.file)
+    for acl_name, files in files_by_acl.items():
+        utils.set_file_acls(files, acl_name)
+
+
+def remove_existing_renditions(renditions: list[AbstractRendition]) -> list[AbstractRendition]:
+    """
+    Drop (and delete the files of) any `renditions` that have been created elsewhere in the
+    meantime, e.g. by a visitor requesting the page.
+    """
+    if not renditions:
+        return renditions
+
+    lookup_q = Q()
+    for rendition in renditions:
+        lookup_q |= Q(
+            image_id=rendition.image_id, filter_spec=rendition.filter_spec, focal_point_key=rendition.focal_point_key
+        )
+    rendition_model = get_image_model().get_rendition_model()
+    existing = set(rendition_model.objects.filter(lookup_q).values_list("image_id", "filter_spec", "focal_point_key"))
+
+    new_renditions = []
+    for rendition in renditions:
+        if (rendition.image_id, rendition.filter_spec, rendition.focal_point_key) in existing:
+            rendition.file.delete(save=False)
+        else:
+            new_renditions.append(rendition)
+    return new_renditions
+
+
+def warm_page_renditions(page_ids: Iterable[int]) -> int:
+    """
+    Generate the missing renditions for the images on the given live pages.
+    """
+    filter_specs_by_image = defaultdict(set)
+    for page in Page.objects.live().filter(pk__in=list(page_ids)).specific():
+        for image_id, specs in get_page_image_filter_specs(page).items():
+            filter_specs_by_image[image_id].update(specs)
+    return warm_renditions(filter_specs_by_image)
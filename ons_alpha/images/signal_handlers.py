@@ -0,0 +1,38 @@
+import logging
+
+from django.db import transaction
+from wagtail.signals import page_published
+
+from ons_alpha.jobs.queue import enqueue
+from ons_alpha.utils.side_effects import defer_or_run, get_active_collector
+
+
+logger = logging.getLogger(__name__)
+
+
+def queue_rendition_warming(page_ids) -> None:
+    # generating the renditions can take longer than the request is allowed, so they're
+    # generated by the scheduler
+    args = [arg for page_id in sorted(page_ids) for arg in ("--page", str(page_id))]
+    try:
+        enqueue("warm_renditions", *args)
+    except Exception:  # pylint: disable=broad-exception-caught
+        # renditions will still be created when they're first requested
+        logger.exception("Failed to queue warming renditions for pages %s", page_ids)
+
+
+def warm_renditions_on_publish(instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Queue generating the renditions the page's templates will request once the publish
+    is committed, so the first visitors don't have to wait for them. Pages published
+    together (e.g. in a bundle) are warmed in one job.
+    """
+    if get_active_collector() is None:
+        page_id = instance.pk
+        transaction.on_commit(lambda: queue_rendition_warming([page_id]))
+    else:
+        defer_or_run(queue_rendition_warming, instance.pk, key=instance.pk)
+
+
+def register_signal_handlers():
+    page_published.connect(warm_renditions_on_publish, dispatch_uid="warm_renditions_publish")
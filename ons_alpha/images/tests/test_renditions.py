@@ -0,0 +1,155 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from wagtail.images import get_image_model
+from wagtail.images.views.serve import generate_image_url
+from wagtail.models import Collection
+from wagtail_factories import ImageFactory
+
+from ons_alpha.core.models import PageRelatedPage
+from ons_alpha.images.renditions import get_page_image_filter_specs, warm_page_renditions, warm_renditions
+from ons_alpha.images.utils import get_rendition_urls
+from ons_alpha.jobs.models import Job
+from ons_alpha.jobs.queue import claim_job, run_job
+from ons_alpha.private_media.constants import PRIVATE_FILE_ACL
+from ons_alpha.standardpages.factories import InformationPageFactory
+
+
+class RenditionWarmingTestCase(TestCase):
+    def setUp(self):
+        self.image = ImageFactory(collection=Collection.objects.get(name="Public"))
+        self.social_image = ImageFactory(collection=Collection.objects.get(name="Public"))
+        self.listing_image = ImageFactory(collection=Collection.objects.get(name="Public"))
+
+        related_page = InformationPageFactory(listing_image=self.listing_image)
+        self.page = InformationPageFactory(social_image=self.social_image)
+        self.page.body = [("image", {"image": self.image, "caption": ""})]
+        self.page.page_related_pages = [PageRelatedPage(page=related_page, sort_order=0)]
+        self.page.save()
+
+    def get_filter_specs(self, image):
+        return set(get_image_model().objects.get(pk=image.pk).renditions.values_list("filter_spec", flat=True))
+
+    def test_get_page_image_filter_specs(self):
+        self.assertEqual(
+            get_page_image_filter_specs(self.page),
+            {
+                self.image.pk: {"width-1000"},
+                self.social_image.pk: {"width-1000", "fill-1200x630-c100"},
+                self.listing_image.pk: {"fill-450x300"},
+            },
+        )
+
+    def test_warm_renditions_creates_missing_renditions(self):
+        self.image.get_rendition("width-1000")
+
+        created = warm_renditions({self.image.pk: ["width-1000", "fill-450x300"]})
+
+        self.assertEqual(created, 1)
+        self.assertEqual(self.get_filter_specs(self.image), {"width-1000", "fill-450x300"})
+        self.assertEqual(warm_renditions({self.image.pk: ["width-1000", "fill-450x300"]}), 0)
+
+    @override_settings(AWS_DEFAULT_ACL="public-read")
+    def test_warm_renditions_sets_acls_in_one_batch(self):
+        image = ImageFactory(collection=Collection.objects.get(name="Private"))
+
+        with mock.patch("ons_alpha.private_media.utils.set_file_acls") as set_file_acls:
+            warm_renditions({image.pk: ["width-1000", "fill-450x300"]})
+
+        set_file_acls.assert_called_once()
+        files, acl_name = set_file_acls.call_args.args
+        self.assertEqual(len(files), 2)
+        self.assertEqual(acl_name, PRIVATE_FILE_ACL)
+
+    def test_warm_page_renditions(self):
+        self.page.save_revision().publish()
+
+        self.assertEqual(warm_page_renditions([self.page.pk]), 4)
+        self.assertEqual(self.get_filter_specs(self.social_image), {"width-1000", "fill-1200x630-c100"})
+
+    def test_renditions_are_warmed_on_publish(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.page.save_revision().publish()
+
+        # by the scheduler, rather than in the request
+        self.assertEqual(self.get_filter_specs(self.image), set())
+        job = Job.objects.get()
+        self.assertEqual((job.name, job.args), ("warm_renditions", ["--page", str(self.page.pk)]))
+
+        run_job(claim_job("worker"))
+
+        self.assertEqual(self.get_filter_specs(self.image), {"width-1000"})
+        self.assertEqual(self.get_filter_specs(self.listing_image), {"fill-450x300"})
+
+    def test_command(self):
+        self.page.save_revision().publish()
+        stdout = StringIO()
+
+        call_command("warm_renditions", page_ids=[self.page.pk], stdout=stdout)
+
+        self.assertIn("Created 4 renditions for 1 pages", stdout.getvalue())
+        self.assertEqual(self.get_filter_specs(self.image), {"width-1000"})
+
+
+class RenditionUrlTestCase(TestCase):
+    def setUp(self):
+        self.image = ImageFactory(collection=Collection.objects.get(name="Private"))
+        get_image_model().get_rendition_model().url_cache.clear()
+
+    def get_rendition(self):
+        return get_image_model().objects.get(pk=self.image.pk).get_rendition("width-100")
+
+    def test_private_image_urls_use_the_serve_view(self):
+        self.assertTrue(self.get_rendition().url.startswith("/images/"))
+
+    def test_urls_are_cached(self):
+        rendition_model = get_image_model().get_rendition_model()
+        with mock.patch.object(rendition_model, "get_url", autospec=True, return_value="/image.png") as get_url:
+            self.assertEqual(self.get_rendition().url, "/image.png")
+            self.assertEqual(self.get_rendition().url, "/image.png")
+
+        get_url.assert_called_once()
+
+    def test_urls_change_with_privacy(self):
+        private_url = self.get_rendition().url
+
+        image = get_image_model().objects.get(pk=self.image.pk)
+        get_image_model().objects.bulk_make_public([image])
+
+        public_url = self.get_rendition().url
+        self.assertNotEqual(public_url, private_url)
+        self.assertEqual(public_url, self.get_rendition().file.url)
+
+    @override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+    def test_get_rendition_urls(self):
+        other_image = ImageFactory()
+        other_image.get_rendition("width-100")
+        self.get_rendition()
+
+        with self.assertNumQueries(2):
+            urls = get_rendition_urls([self.image.pk, other_image.pk], "width-100")
+
+        self.assertEqual(set(urls), {self.image.pk, other_image.pk})
+        self.assertEqual(urls[self.image.pk], self.get_rendition().url)
+
+
+@override_settings(PRIVATE_MEDIA_SERVE_METHOD="x_accel_redirect")
+class ImageServeViewTestCase(TestCase):
+    def test_private_images_are_handed_over_to_the_web_server(self):
+        image = ImageFactory(collection=Collection.objects.get(name="Private"))
+
+        response = self.client.get(image.get_rendition("width-100").url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["X-Accel-Redirect"].startswith("/private-media/images/"))
+        self.assertIn("public", response["Cache-Control"])
+
+    def test_public_images_redirect_to_storage(self):
+        image = ImageFactory(collection=Collection.objects.get(name="Public"))
+        rendition = image.get_rendition("width-100")
+
+        response = self.client.get(generate_image_url(image, "width-100"))
+
+        self.assertRedirects(response, rendition.file.url, fetch_redirect_response=False)
@@ -0,0 +1,13 @@
+from collections.abc import Iterable
+
+from wagtail.images import get_image_model
+from wagtail.images.shortcuts import get_rendition_or_not_found
+
+
+def get_rendition_urls(image_ids: Iterable[int], filter_spec: str) -> dict[int, str]:
+    """
+    Returns the URLs of the `filter_spec` renditions of the given images, by image id.
+    The existing renditions are fetched in one query, and any missing ones are created.
+    """
+    images = get_image_model().objects.filter(pk__in=set(image_ids)).prefetch_renditions(filter_spec)
+    return {image.pk: get_rendition_or_not_found(image, filter_spec).url for image in images}
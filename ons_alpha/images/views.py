@@ -1,11 +1,23 @@
 from django.shortcuts import redirect
+from django.utils.cache import patch_cache_control
 from wagtail.images.views.serve import ServeView
 
+from ons_alpha.private_media.serving import get_content_type, serve_private_file
+from ons_alpha.utils.cache import get_default_cache_control_kwargs
+
 
 class ImageServeView(ServeView):
+    def get(self, request, *args, **kwargs):
+        response = super().get(request, *args, **kwargs)
+        if not response.has_header("Cache-Control"):
+            patch_cache_control(response, **get_default_cache_control_kwargs())
+        return response
+
     def serve(self, rendition):
         # If there's no reason (within our control) for the file not to be served by S3, redirect
         if rendition.image.is_public and rendition.image.acls_are_up_to_date():
             return redirect(rendition.file.url)
-        # Serve the file until it is no longer private, or ACLs have been updated successfully
-        return super().serve(rendition)
+        # Until it is no longer private, or ACLs have been updated successfully, serve the file
+        # without streaming it through Django where possible. The content type is worked out
+        # from the file name, rather than by opening the file.
+        return serve_private_file(rendition.file, get_content_type(rendition.file), request=self.request)
@@ -0,0 +1,11 @@
+from django.db import models
+
+
+class JobStatus(models.TextChoices):
+    QUEUED = "QUEUED", "Queued"
+    RUNNING = "RUNNING", "Running"
+    SUCCEEDED = "SUCCEEDED", "Succeeded"
+    FAILED = "FAILED", "Failed"
+
+
+FINISHED_JOB_STATUSES = [JobStatus.SUCCEEDED, JobStatus.FAILED]
@@ -0,0 +1,23 @@
+import argparse
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ons_alpha.jobs.queue import enqueue
+
+
+class Command(BaseCommand):
+    help = (
+        "Queues a management command to be run by a scheduler, "
+        "e.g. `enqueue_job set_outstanding_file_acls --restart`."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("command_name", help="The management command to run.")
+        parser.add_argument("command_args", nargs=argparse.REMAINDER, help="Arguments for the command.")
+
+    def handle(self, *args, **options):
+        try:
+            job = enqueue(options["command_name"], *options["command_args"])
+        except ValueError as e:
+            raise CommandError(str(e)) from e
+        self.stdout.write(f"Queued job {job.pk}: {job.name} {' '.join(job.args)}".rstrip())
@@ -0,0 +1,49 @@
+# Generated by Django 4.2.16 on 2026-10-18 02:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="Job",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False)),
+                ("name", models.CharField(max_length=255)),
+                ("args", models.JSONField(blank=True, default=list)),
+                ("kwargs", models.JSONField(blank=True, default=dict)),
+                ("status", models.CharField(default="QUEUED", max_length=32)),
+                ("scheduled_for", models.DateTimeField(blank=True, null=True)),
+                ("run_after", models.DateTimeField()),
+                ("enqueued_at", models.DateTimeField(auto_now_add=True)),
+                ("worker", models.CharField(blank=True, max_length=255)),
+                ("lease_expires_at", models.DateTimeField(blank=True, null=True)),
+                ("started_at", models.DateTimeField(blank=True, null=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+                ("duration", models.DurationField(blank=True, null=True)),
+                ("output", models.TextField(blank=True)),
+                ("error", models.TextField(blank=True)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["status", "run_after"], name="job_status_run_after_idx"),
+                    models.Index(fields=["name", "-enqueued_at"], name="job_name_enqueued_at_idx"),
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="job",
+            constraint=models.UniqueConstraint(fields=("name", "scheduled_for"), name="unique_scheduled_job"),
+        ),
+        migrations.AddConstraint(
+            model_name="job",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("status", "RUNNING")), fields=("name",), name="unique_running_job"
+            ),
+        ),
+    ]
@@ -0,0 +1,48 @@
+from django.db import models
+from django.db.models import Q
+
+from .enums import JobStatus
+
+
+class Job(models.Model):
+    """
+    A run of a management command, queued to be picked up by one of the `scheduler`
+    processes. Finished jobs are kept for a while as a history of the runs.
+
+    Only one job with a given name can be running at a time, which is enforced by
+    the database. A running job holds a lease, which is renewed by its process for as
+    long as it is running, so the jobs of a process that dies are released once their
+    leases expire.
+    """
+
+    name = models.CharField(max_length=255, help_text="The name of the management command to run.")
+    args = models.JSONField(default=list, blank=True)
+    kwargs = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=32, choices=JobStatus.choices, default=JobStatus.QUEUED)
+
+    # The time the job was due to run, for scheduled jobs
+    scheduled_for = models.DateTimeField(null=True, blank=True)
+    run_after = models.DateTimeField()
+    enqueued_at = models.DateTimeField(auto_now_add=True)
+
+    worker = models.CharField(max_length=255, blank=True)
+    lease_expires_at = models.DateTimeField(null=True, blank=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    duration = models.DurationField(null=True, blank=True)
+    output = models.TextField(blank=True)
+    error = models.TextField(blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "run_after"], name="job_status_run_after_idx"),
+            models.Index(fields=["name", "-enqueued_at"], name="job_name_enqueued_at_idx"),
+        ]
+        constraints = [
+            # Each scheduled run is only queued once, however many schedulers there are
+            models.UniqueConstraint(fields=["name", "scheduled_for"], name="unique_scheduled_job"),
+            models.UniqueConstraint(fields=["name"], condition=Q(status=JobStatus.RUNNING), name="unique_running_job"),
+        ]
+
+    def __str__(self):
+        return f"Job {self.pk}: {self.name} ({self.get_status_display()})"
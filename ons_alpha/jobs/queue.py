@@ -0,0 +1,167 @@
+import logging
+import os
+import socket
+import time
+import traceback
+
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from io import StringIO
+
+from django.conf import settings
+from django.core.management import call_command, get_commands
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .enums import FINISHED_JOB_STATUSES, JobStatus
+from .models import Job
+
+
+logger = logging.getLogger(__name__)
+
+# The amount of a job's output and traceback that is kept in its history
+MAX_OUTPUT_LENGTH = 10_000
+
+
+def get_worker_name() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def get_lease_expiry() -> datetime:
+    return timezone.now() + timedelta(seconds=settings.JOBS_LEASE_DURATION)
+
+
+def enqueue(
+    name: str,
+    *args: str,
+    run_after: datetime | None = None,
+    scheduled_for: datetime | None = None,
+    coalesce: bool = True,
+    **kwargs,
+) -> Job | None:
+    """
+    Queue the `name` management command to be run by a `scheduler` process, with
+    the given arguments (as for `call_command()`).
+
+    With `coalesce`, nothing is queued if the same command is already waiting to run
+    with the same arguments, and the waiting job is returned. Returns `None` if
+    `scheduled_for` is given and that run has already been queued elsewhere.
+    """
+    if name not in get_commands():
+        raise ValueError(f"Unknown management command: {name}")
+
+    args = list(args)
+    if coalesce and (
+        existing := Job.objects.filter(name=name, args=args, kwargs=kwargs, status=JobStatus.QUEUED).first()
+    ):
+        return existing
+
+    try:
+        with transaction.atomic():
+            return Job.objects.create(
+                name=name,
+                args=args,
+                kwargs=kwargs,
+                scheduled_for=scheduled_for,
+                run_after=run_after or scheduled_for or timezone.now(),
+            )
+    except IntegrityError:
+        if scheduled_for is None:
+            raise
+        return None
+
+
+def claim_job(worker: str) -> Job | None:
+    """
+    Mark the next job that is due to run as running in `worker` and return it, or
+    return `None` if there isn't one. Jobs whose name matches a running job are
+    left queued until it finishes.
+    """
+    now = timezone.now()
+    running_names = Job.objects.filter(status=JobStatus.RUNNING).values("name")
+    candidates = (
+        Job.objects.filter(status=JobStatus.QUEUED, run_after__lte=now)
+        .exclude(name__in=running_names)
+        .order_by("run_after", "pk")
+    )
+
+    for job in candidates[:10]:
+        try:
+            with transaction.atomic():
+                claimed = Job.objects.filter(pk=job.pk, status=JobStatus.QUEUED).update(
+                    status=JobStatus.RUNNING, worker=worker, started_at=now, lease_expires_at=get_lease_expiry()
+                )
+        except IntegrityError:
+            # a job with the same name has been started by another worker
+            continue
+        if claimed:
+            job.refresh_from_db()
+            return job
+    return None
+
+
+def run_job(job: Job) -> Job:
+    """
+    Run a claimed job's management command, and record the outcome.
+    """
+    output = StringIO()
+    started = time.monotonic()
+    logger.info("Running job %s: %s", job.pk, job.name)
+    try:
+        call_command(job.name, *job.args, stdout=output, stderr=output, **job.kwargs)
+    except Exception:  # pylint: disable=broad-exception-caught
+        logger.exception("Job %s (%s) failed", job.pk, job.name)
+        job.status = JobStatus.FAILED
+        job.error = traceback.format_exc()[-MAX_OUTPUT_LENGTH:]
+    else:
+        job.status = JobStatus.SUCCEEDED
+
+    job.duration = timedelta(seconds=time.monotonic() - started)
+    job.finished_at = timezone.now()
+    job.output = output.getvalue()[-MAX_OUTPUT_LENGTH:]
+    job.lease_expires_at = None
+    logger.info("Job %s (%s) %s in %s", job.pk, job.name, job.get_status_display().lower(), job.duration)
+
+    # if the lease has been lost, the job has already been marked as failed
+    if not Job.objects.filter(pk=job.pk, status=JobStatus.RUNNING, worker=job.worker).update(
+        status=job.status,
+        duration=job.duration,
+        finished_at=job.finished_at,
+        output=job.output,
+        error=job.error,
+        lease_expires_at=None,
+    ):
+        logger.warning("Job %s (%s) finished after its lease expired", job.pk, job.name)
+    return job
+
+
+def renew_leases(worker: str, job_ids: Iterable[int]) -> int:
+    """
+    Extend the leases of the jobs that `worker` is still running.
+    """
+    return Job.objects.filter(pk__in=list(job_ids), status=JobStatus.RUNNING, worker=worker).update(
+        lease_expires_at=get_lease_expiry()
+    )
+
+
+def fail_expired_jobs() -> int:
+    """
+    Mark running jobs whose leases have expired (because the process running them
+    has died or stopped responding) as failed, so the job can run again.
+    """
+    now = timezone.now()
+    count = Job.objects.filter(status=JobStatus.RUNNING, lease_expires_at__lt=now).update(
+        status=JobStatus.FAILED, finished_at=now, lease_expires_at=None, error="The job's lease expired."
+    )
+    if count:
+        logger.warning("Marked %d job(s) with expired leases as failed", count)
+    return count
+
+
+def prune_job_history() -> int:
+    """
+    Delete the history of jobs that finished more than `JOBS_HISTORY_DAYS` ago.
+    """
+    cutoff = timezone.now() - timedelta(days=settings.JOBS_HISTORY_DAYS)
+    deleted, _ = Job.objects.filter(status__in=FINISHED_JOB_STATUSES, finished_at__lt=cutoff).delete()
+    return deleted
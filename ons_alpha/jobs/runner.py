@@ -0,0 +1,98 @@
+import logging
+import threading
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+
+from .models import Job
+from .queue import claim_job, fail_expired_jobs, get_worker_name, prune_job_history, renew_leases, run_job
+from .schedule import ScheduledJob, get_schedule
+
+
+logger = logging.getLogger(__name__)
+
+
+class JobRunner:
+    """
+    Queues scheduled jobs when they are due, and runs queued jobs, up to
+    `max_concurrency` at a time, until stopped.
+
+    Any number of runners can be running at once (e.g. one per container). Each
+    scheduled run is only queued once, and a job is only ever run by one runner.
+    """
+
+    def __init__(
+        self,
+        schedule: list[ScheduledJob] | None = None,
+        max_concurrency: int | None = None,
+        poll_interval: float | None = None,
+    ):
+        self.worker = get_worker_name()
+        self.schedule = get_schedule() if schedule is None else schedule
+        self.max_concurrency = max(1, max_concurrency or settings.JOBS_MAX_CONCURRENCY)
+        self.poll_interval = poll_interval or settings.JOBS_POLL_INTERVAL
+        self.executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="jobs")
+        self.running: dict[int, Future] = {}
+        self.stopping = threading.Event()
+        self.last_pruned: datetime | None = None
+
+    def run(self) -> None:
+        logger.info("Running jobs as %s, up to %d at a time", self.worker, self.max_concurrency)
+        try:
+            while not self.stopping.is_set():
+                try:
+                    self.run_once()
+                except Exception:  # pylint: disable=broad-exception-caught
+                    # e.g. the database is briefly unavailable
+                    logger.exception("Failed to check for jobs")
+                self.stopping.wait(self.get_wait_time())
+        finally:
+            # jobs that don't finish before the process is killed are released when their leases expire
+            self.executor.shutdown(wait=True, cancel_futures=True)
+
+    def stop(self) -> None:
+        self.stopping.set()
+
+    def run_once(self) -> None:
+        now = timezone.now()
+        for scheduled_job in self.schedule:
+            scheduled_job.enqueue_if_due(now)
+
+        self.running = {pk: future for pk, future in self.running.items() if not future.done()}
+        if self.running:
+            renew_leases(self.worker, self.running)
+        fail_expired_jobs()
+        self.prune_history(now)
+
+        while len(self.running) < self.max_concurrency and (job := claim_job(self.worker)):
+            self.running[job.pk] = self.executor.submit(self.run_job, job)
+
+    @staticmethod
+    def run_job(job: Job) -> None:
+        try:
+            run_job(job)
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Failed to record the outcome of job %s (%s)", job.pk, job.name)
+        finally:
+            # each job thread has its own database connections
+            connections.close_all()
+
+    def prune_history(self, now: datetime) -> None:
+        if self.last_pruned is None or now - self.last_pruned > timedelta(hours=1):
+            prune_job_history()
+            self.last_pruned = now
+
+    def get_wait_time(self) -> float:
+        """
+        Returns the number of seconds until the runner should next check for jobs,
+        waking up in time for the next scheduled run.
+        """
+        wait = self.poll_interval
+        next_runs = [scheduled_job.next_run_at for scheduled_job in self.schedule if scheduled_job.next_run_at]
+        if next_runs:
+            wait = min(wait, (min(next_runs) - timezone.now()).total_seconds())
+        return max(0, wait)
@@ -0,0 +1,51 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from apscheduler.triggers.cron import CronTrigger
+from django.conf import settings
+
+from .queue import enqueue
+
+
+@dataclass
+class ScheduledJob:
+    name: str
+    trigger: CronTrigger
+    args: tuple[str, ...] = ()
+    next_run_at: datetime | None = field(default=None, init=False)
+
+    def enqueue_if_due(self, now: datetime) -> bool:
+        """
+        Queue the run that is due, if there is one. Every scheduler works out the same
+        run times, so each run is only queued once, by the first scheduler to get to it.
+        Returns whether there was a run due.
+        """
+        if self.next_run_at is None:
+            self.next_run_at = self.trigger.get_next_fire_time(None, now)
+        if self.next_run_at is None or self.next_run_at > now:
+            return False
+
+        enqueue(self.name, *self.args, scheduled_for=self.next_run_at)
+        # missed runs are skipped, rather than run one after another
+        self.next_run_at = self.trigger.get_next_fire_time(self.next_run_at, now)
+        return True
+
+
+def get_schedule() -> list[ScheduledJob]:
+    timezone = settings.TIME_ZONE
+    return [
+        # "second=0" run the task every minute, on the minute (ie when the seconds = 0)
+        ScheduledJob("publish_bundles", CronTrigger(second=0, timezone=timezone)),
+        # Run every 5 minutes.
+        # See https://apscheduler.readthedocs.io/en/3.x/modules/triggers/cron.html#expression-types
+        ScheduledJob("publish_scheduled_without_bundles", CronTrigger(minute="*/5", timezone=timezone)),
+        # Refresh the local mirror of the dataset catalogue every 15 minutes
+        ScheduledJob("sync_dataset_catalogue", CronTrigger(minute="*/15", timezone=timezone)),
+        # Retry any file ACLs that couldn't be set (e.g. because S3 was unavailable),
+        # stopping in time for the next run
+        ScheduledJob(
+            "set_outstanding_file_acls",
+            CronTrigger(minute="*/15", timezone=timezone),
+            args=("--max-duration", str(10 * 60)),
+        ),
+    ]
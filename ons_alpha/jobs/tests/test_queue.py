@@ -0,0 +1,125 @@
+from concurrent.futures import Future
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from apscheduler.triggers.cron import CronTrigger
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from ons_alpha.jobs.enums import JobStatus
+from ons_alpha.jobs.models import Job
+from ons_alpha.jobs.queue import claim_job, enqueue, fail_expired_jobs, prune_job_history, run_job
+from ons_alpha.jobs.runner import JobRunner
+from ons_alpha.jobs.schedule import ScheduledJob
+
+
+class ImmediateExecutor:
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+class JobQueueTestCase(TestCase):
+    def test_enqueue_coalesces_waiting_jobs(self):
+        job = enqueue("set_outstanding_file_acls", "--dry-run")
+
+        self.assertEqual(enqueue("set_outstanding_file_acls", "--dry-run"), job)
+        self.assertNotEqual(enqueue("set_outstanding_file_acls"), job)
+        self.assertNotEqual(enqueue("set_outstanding_file_acls", "--dry-run", coalesce=False), job)
+
+    def test_enqueue_unknown_command(self):
+        with self.assertRaises(ValueError):
+            enqueue("not_a_command")
+
+    def test_scheduled_runs_are_only_queued_once(self):
+        now = timezone.now().replace(second=0, microsecond=0)
+        schedulers = [ScheduledJob("publish_bundles", CronTrigger(second=0)) for _ in range(2)]
+
+        for scheduled_job in schedulers:
+            self.assertFalse(scheduled_job.enqueue_if_due(now - timedelta(seconds=1)))
+            self.assertTrue(scheduled_job.enqueue_if_due(now))
+            self.assertEqual(scheduled_job.next_run_at, now + timedelta(minutes=1))
+            # another scheduler has already started the run
+            Job.objects.update(status=JobStatus.RUNNING)
+
+        job = Job.objects.get()
+        self.assertEqual((job.name, job.scheduled_for), ("publish_bundles", now))
+
+    def test_jobs_with_the_same_name_do_not_run_at_the_same_time(self):
+        first = enqueue("set_outstanding_file_acls", "--dry-run")
+        second = enqueue("set_outstanding_file_acls", "--dry-run", coalesce=False)
+        other = enqueue("rebuild_media_usage")
+
+        self.assertEqual(claim_job("worker-1"), first)
+        self.assertEqual(claim_job("worker-2"), other)
+        self.assertIsNone(claim_job("worker-2"))
+
+        run_job(Job.objects.get(pk=first.pk))
+        self.assertEqual(claim_job("worker-2"), second)
+
+    def test_run_job_records_the_outcome(self):
+        enqueue("set_outstanding_file_acls", "--dry-run")
+        enqueue("warm_renditions", "--page", "not-a-page")
+
+        succeeded = run_job(claim_job("worker"))
+        with self.assertLogs("ons_alpha.jobs.queue", "ERROR"):
+            failed = run_job(claim_job("worker"))
+
+        succeeded.refresh_from_db()
+        self.assertEqual(succeeded.status, JobStatus.SUCCEEDED)
+        self.assertIn("This is a dry run.", succeeded.output)
+        self.assertIsNotNone(succeeded.duration)
+        failed.refresh_from_db()
+        self.assertEqual(failed.status, JobStatus.FAILED)
+        self.assertIn("invalid int value", failed.error)
+
+    def test_jobs_with_expired_leases_are_failed(self):
+        enqueue("rebuild_media_usage")
+        job = claim_job("worker")
+        Job.objects.filter(pk=job.pk).update(lease_expires_at=timezone.now() - timedelta(seconds=1))
+
+        with self.assertLogs("ons_alpha.jobs.queue", "WARNING"):
+            self.assertEqual(fail_expired_jobs(), 1)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, JobStatus.FAILED)
+        # the job can run again, and the late result of the lost run is ignored
+        enqueue("rebuild_media_usage")
+        with self.assertLogs("ons_alpha.jobs.queue", "WARNING"):
+            run_job(job)
+        self.assertEqual(Job.objects.get(pk=job.pk).status, JobStatus.FAILED)
+
+    def test_prune_job_history(self):
+        enqueue("rebuild_media_usage")
+        run_job(claim_job("worker"))
+        Job.objects.update(finished_at=timezone.now() - timedelta(days=31))
+        enqueue("rebuild_media_usage")
+
+        self.assertEqual(prune_job_history(), 1)
+        self.assertEqual(Job.objects.get().status, JobStatus.QUEUED)
+
+    @mock.patch("ons_alpha.jobs.runner.connections")
+    def test_runner_runs_due_jobs_up_to_the_concurrency_limit(self, _connections):
+        now = timezone.now()
+        runner = JobRunner(schedule=[ScheduledJob("rebuild_media_usage", CronTrigger(second="*"))], max_concurrency=1)
+        runner.executor = ImmediateExecutor()
+        runner.schedule[0].next_run_at = now - timedelta(seconds=1)
+        enqueue("set_outstanding_file_acls", "--dry-run", run_after=now + timedelta(hours=1))
+
+        runner.run_once()
+
+        job = Job.objects.get(name="rebuild_media_usage")
+        self.assertEqual(job.status, JobStatus.SUCCEEDED)
+        self.assertEqual(Job.objects.get(name="set_outstanding_file_acls").status, JobStatus.QUEUED)
+        self.assertLessEqual(runner.get_wait_time(), 1)
+
+    def test_enqueue_job_command(self):
+        stdout = StringIO()
+        call_command("enqueue_job", "set_outstanding_file_acls", "--restart", stdout=stdout)
+
+        job = Job.objects.get()
+        self.assertEqual((job.name, job.args), ("set_outstanding_file_acls", ["--restart"]))
+        self.assertIn(f"Queued job {job.pk}", stdout.getvalue())
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.16 on 2026-10-18 01:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("methodologies", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="methodologypage",
+            name="stream_toc_items",
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+    ]
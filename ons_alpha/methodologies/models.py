@@ -13,11 +13,12 @@ from wagtail.search import index
 from ons_alpha.bundles.models import BundledPageMixin
 from ons_alpha.core.blocks.stream_blocks import CoreStoryBlock
 from ons_alpha.core.models.base import BasePage
+from ons_alpha.core.models.mixins import TableOfContentsMixin
 from ons_alpha.taxonomy.forms import PageWithTopicsAdminForm
 from ons_alpha.utils.fields import StreamField
 
 
-class MethodologyPage(BundledPageMixin, BasePage):
+class MethodologyPage(BundledPageMixin, TableOfContentsMixin, BasePage):
     base_form_class = PageWithTopicsAdminForm
     template = "templates/pages/methodology_page.html"
     parent_page_types = ["topics.TopicPage"]
@@ -91,9 +92,7 @@ class MethodologyPage(BundledPageMixin, BasePage):
         if self.has_background_info:
             items += [{"url": "#background", "text": "Methodology background"}]
 
-        for block in self.body:  # pylint: disable=not-an-iterable,useless-suppression
-            if hasattr(block.block, "to_table_of_contents_items"):
-                items += block.block.to_table_of_contents_items(block.value)
+        items += self.get_stream_toc_items()
         if self.contact_details_id:
             items += [{"url": "#contact-details", "text": "Contact details"}]
         return items
@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class NavigationConfig(AppConfig):
     default_auto_field = "django.db.models.AutoField"
     name = "ons_alpha.navigation"
+
+    def ready(self):
+        from ons_alpha.navigation.signal_handlers import (  # pylint: disable=import-outside-toplevel
+            register_signal_handlers,
+        )
+
+        register_signal_handlers()
@@ -0,0 +1,133 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import get_language
+from wagtail.models import Locale, Page, Site
+
+from ons_alpha.navigation.models import NavigationSettings
+from ons_alpha.utils.cache import bump_cache_generation, get_cache_generation
+
+
+NAVIGATION_CACHE_GENERATION = "navigation"
+
+NAVIGATION_FIELDS = ("primary_navigation", "secondary_navigation", "footer_navigation", "footer_links")
+
+
+def get_navigation_cache_key(site_id: int) -> str:
+    generation = get_cache_generation(NAVIGATION_CACHE_GENERATION)
+    return f"navigation:{generation}:{site_id}:{get_language()}"
+
+
+def invalidate_navigation_cache() -> None:
+    bump_cache_generation(NAVIGATION_CACHE_GENERATION)
+
+
+def get_link_values(stream_value) -> list[dict]:
+    """
+    Returns the raw values of the `LinkBlock`s in a navigation StreamField, without
+    converting them to blocks, which would fetch each linked page separately.
+    """
+    links = []
+    for child in stream_value.raw_data:
+        if child["type"] == "link":
+            links.append(child["value"])
+        elif child["type"] == "column":
+            links.extend(get_column_link_values(child["value"]))
+    return links
+
+
+def get_column_link_values(column: dict) -> list[dict]:
+    # list items are stored as {"type": "item", "value": ...}, or as plain values in older data
+    return [
+        item["value"] if isinstance(item, dict) and item.get("type") == "item" else item
+        for item in column.get("links") or []
+    ]
+
+
+def get_linked_page_ids(navigation_settings: NavigationSettings) -> set[int]:
+    return {
+        link["page"]
+        for field in NAVIGATION_FIELDS
+        for link in get_link_values(getattr(navigation_settings, field))
+        if link.get("page")
+    }
+
+
+def get_linked_pages(page_ids, locale: Locale | None = None) -> dict[int, Page]:
+    """
+    Returns the live linked pages by id, using their translation in `locale` where
+    there is one.
+    """
+    pages = {page.pk: page for page in Page.objects.live().filter(pk__in=page_ids)}
+    if locale is not None and any(page.locale_id != locale.pk for page in pages.values()):
+        translations = {
+            page.translation_key: page
+            for page in Page.objects.live().filter(
+                translation_key__in=[page.translation_key for page in pages.values()], locale=locale
+            )
+        }
+        pages = {page_id: translations.get(page.translation_key, page) for page_id, page in pages.items()}
+    return pages
+
+
+def build_navigation(site: Site, request=None) -> dict:
+    """
+    Returns the site's navigation as plain data, with every link's page fetched in
+    bulk and its URL resolved, ready to be cached.
+    """
+    navigation_settings = NavigationSettings.for_site(site)
+    try:
+        locale = Locale.get_active()
+    except Locale.DoesNotExist:
+        locale = None
+    pages = get_linked_pages(get_linked_page_ids(navigation_settings), locale)
+
+    def resolve(link_values):
+        resolved = []
+        for link in link_values:
+            if (page := pages.get(link.get("page"))) is None:
+                # the page has been deleted or unpublished
+                continue
+            resolved.append({"url": page.get_url(request=request), "text": link.get("title") or page.title})
+        return resolved
+
+    return {
+        "primary_navigation": resolve(get_link_values(navigation_settings.primary_navigation)),
+        "secondary_navigation": resolve(get_link_values(navigation_settings.secondary_navigation)),
+        "footer_navigation": [
+            {"heading": column["value"].get("heading", ""), "links": resolve(get_column_link_values(column["value"]))}
+            for column in navigation_settings.footer_navigation.raw_data
+            if column["type"] == "column"
+        ],
+        "footer_links": resolve(get_link_values(navigation_settings.footer_links)),
+    }
+
+
+def get_navigation(request) -> dict:
+    """
+    Returns the navigation for the request's site, from the cache if possible.
+    """
+    if (site := Site.find_for_request(request)) is None:
+        return {field: [] for field in NAVIGATION_FIELDS}
+
+    cache_key = get_navigation_cache_key(site.pk)
+    navigation = cache.get(cache_key)
+    if navigation is None:
+        navigation = build_navigation(site, request)
+        cache.set(cache_key, navigation, settings.NAVIGATION_CACHE_TIMEOUT)
+    return navigation
+
+
+def get_linked_translation_keys() -> set:
+    """
+    Returns the translation keys of all pages linked from the navigation of any site,
+    so changes to them (in any locale) can invalidate the cached navigation.
+    """
+    cache_key = f"navigation:{get_cache_generation(NAVIGATION_CACHE_GENERATION)}:linked_translation_keys"
+    translation_keys = cache.get(cache_key)
+    if translation_keys is None:
+        page_ids = set().union(
+            *(get_linked_page_ids(navigation_settings) for navigation_settings in NavigationSettings.objects.all())
+        )
+        translation_keys = set(Page.objects.filter(pk__in=page_ids).values_list("translation_key", flat=True))
+        cache.set(cache_key, translation_keys, settings.NAVIGATION_CACHE_TIMEOUT)
+    return translation_keys
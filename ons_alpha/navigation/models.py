@@ -3,6 +3,7 @@ from wagtail import blocks
 from wagtail.admin.panels import FieldPanel
 from wagtail.contrib.settings.models import BaseSiteSetting, register_setting
 
+from ons_alpha.utils.cache import CachedSiteSettingMixin
 from ons_alpha.utils.fields import StreamField
 
 
@@ -23,7 +24,7 @@ class LinkColumnWithHeader(blocks.StructBlock):
 
 
 @register_setting(icon="list-ul")
-class NavigationSettings(BaseSiteSetting, ClusterableModel):
+class NavigationSettings(CachedSiteSettingMixin, BaseSiteSetting, ClusterableModel):
     primary_navigation = StreamField(
         [("link", LinkBlock())],
         blank=True,
@@ -0,0 +1,27 @@
+from django.db import transaction
+from django.db.models.signals import post_save
+from wagtail.signals import page_published, page_slug_changed, page_unpublished, post_page_move
+
+from ons_alpha.navigation.cache import get_linked_translation_keys, invalidate_navigation_cache
+from ons_alpha.navigation.models import NavigationSettings
+
+
+def invalidate_navigation_cache_on_change(**kwargs):  # pylint: disable=unused-argument
+    transaction.on_commit(invalidate_navigation_cache)
+
+
+def invalidate_navigation_cache_on_page_change(instance, **kwargs):  # pylint: disable=unused-argument
+    # a linked page's title, URL or status may have changed
+    if instance.translation_key in get_linked_translation_keys():
+        transaction.on_commit(invalidate_navigation_cache)
+
+
+def register_signal_handlers():
+    post_save.connect(
+        invalidate_navigation_cache_on_change, sender=NavigationSettings, dispatch_uid="navigation_cache_settings"
+    )
+    page_published.connect(invalidate_navigation_cache_on_page_change, dispatch_uid="navigation_cache_publish")
+    page_unpublished.connect(invalidate_navigation_cache_on_page_change, dispatch_uid="navigation_cache_unpublish")
+    # moving a page changes the URLs of all the pages below it, so don't check which were linked
+    post_page_move.connect(invalidate_navigation_cache_on_change, dispatch_uid="navigation_cache_move")
+    page_slug_changed.connect(invalidate_navigation_cache_on_change, dispatch_uid="navigation_cache_slug_changed")
@@ -1,5 +1,7 @@
 from django import template
 
+from ons_alpha.navigation.cache import get_navigation
+
 
 register = template.Library()
 
@@ -9,7 +11,7 @@ register = template.Library()
 def primary_nav(context):
     request = context["request"]
     return {
-        "primary_nav": context["settings"]["navigation"]["NavigationSettings"].primary_navigation,
+        "primary_nav": get_navigation(request)["primary_navigation"],
         "request": request,
     }
 
@@ -19,7 +21,7 @@ def primary_nav(context):
 def secondary_nav(context):
     request = context["request"]
     return {
-        "secondary_nav": context["settings"]["navigation"]["NavigationSettings"].secondary_navigation,
+        "secondary_nav": get_navigation(request)["secondary_navigation"],
         "request": request,
     }
 
@@ -28,7 +30,9 @@ def secondary_nav(context):
 @register.inclusion_tag("components/navigation/footer_nav.html", takes_context=True)
 def footer_nav(context):
     request = context["request"]
+    navigation = get_navigation(request)
     return {
-        "footer_nav": context["settings"]["navigation"]["NavigationSettings"].footer_navigation,
+        "footer_nav": navigation["footer_navigation"],
+        "footer_links": navigation["footer_links"],
         "request": request,
     }
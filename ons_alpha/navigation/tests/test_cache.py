@@ -0,0 +1,57 @@
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+from wagtail.models import Site
+
+from ons_alpha.navigation.cache import get_navigation, get_navigation_cache_key
+from ons_alpha.navigation.models import NavigationSettings
+from ons_alpha.standardpages.models import InformationPage
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class NavigationCacheTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.site = Site.objects.get(is_default_site=True)
+        self.about = self.add_page("About")
+        self.contact = self.add_page("Contact")
+        self.other = self.add_page("Other")
+
+        navigation_settings = NavigationSettings.for_site(self.site)
+        navigation_settings.primary_navigation = [("link", {"page": self.about, "title": ""})]
+        navigation_settings.footer_navigation = [
+            ("column", {"heading": "Help", "links": [{"page": self.contact, "title": "Contact us"}]})
+        ]
+        with self.captureOnCommitCallbacks(execute=True):
+            navigation_settings.save()
+
+        self.request = RequestFactory().get("/")
+        self.request._wagtail_site = self.site  # pylint: disable=protected-access
+
+    def add_page(self, title):
+        page = self.site.root_page.add_child(instance=InformationPage(title=title, body=[]))
+        page.save_revision().publish()
+        return page
+
+    def test_navigation_is_resolved_and_cached(self):
+        navigation = get_navigation(self.request)
+
+        self.assertEqual(navigation["primary_navigation"], [{"url": self.about.get_url(), "text": "About"}])
+        self.assertEqual(
+            navigation["footer_navigation"],
+            [{"heading": "Help", "links": [{"url": self.contact.get_url(), "text": "Contact us"}]}],
+        )
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_navigation(self.request), navigation)
+
+    def test_cache_is_invalidated_when_a_linked_page_changes(self):
+        get_navigation(self.request)
+        cache_key = get_navigation_cache_key(self.site.pk)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.other.save_revision().publish()
+        self.assertEqual(get_navigation_cache_key(self.site.pk), cache_key)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.about.unpublish()
+        self.assertEqual(get_navigation(self.request)["primary_navigation"], [])
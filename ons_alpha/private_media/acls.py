@@ -0,0 +1,159 @@
+import logging
+import random
+import threading
+import time
+
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+
+from botocore.exceptions import BotoCoreError, ClientError
+from django.conf import settings
+from django.db.models.fields.files import FieldFile
+from storages.backends.s3 import S3Storage
+
+
+logger = logging.getLogger(__name__)
+
+THROTTLING_ERROR_CODES = frozenset(
+    {"SlowDown", "Throttling", "ThrottlingException", "TooManyRequests", "RequestLimitExceeded"}
+)
+TRANSIENT_ERROR_CODES = frozenset({"InternalError", "ServiceUnavailable", "RequestTimeout", "503", "500"})
+
+
+@dataclass(frozen=True)
+class FileAclResult:
+    name: str
+    acl_name: str
+    success: bool
+    attempts: int = 0
+    error: str = ""
+
+    @property
+    def skipped(self) -> bool:
+        """
+        Whether the file was left untouched because its storage doesn't support ACLs.
+        """
+        return self.success and not self.attempts
+
+
+class AdaptiveConcurrencyLimit:
+    """
+    Limits the number of requests in flight. The limit is halved whenever a request
+    is throttled, then grows back by one for every 'limit' successful requests, up to
+    `maximum` (additive increase, multiplicative decrease).
+    """
+
+    def __init__(self, maximum: int, minimum: int = 1):
+        self.maximum = max(1, maximum)
+        self.minimum = max(1, min(minimum, self.maximum))
+        self.limit = self.maximum
+        self._in_flight = 0
+        self._successes = 0
+        self._condition = threading.Condition()
+
+    def __enter__(self):
+        with self._condition:
+            while self._in_flight >= self.limit:
+                self._condition.wait()
+            self._in_flight += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify()
+
+    def record_success(self) -> None:
+        with self._condition:
+            self._successes += 1
+            if self.limit < self.maximum and self._successes >= self.limit:
+                self.limit += 1
+                self._successes = 0
+                self._condition.notify()
+
+    def record_throttle(self) -> None:
+        with self._condition:
+            self.limit = max(self.minimum, self.limit // 2)
+            self._successes = 0
+
+
+class AclEngine:
+    """
+    Sets S3 object ACLs for privacy-controlled files on a shared pool of worker
+    threads.
+
+    The ACL is written with a single `PutObjectAcl` request per file (there is no
+    need to read the existing ACL first). Throttled and transient failures are
+    retried with 'full jitter' exponential backoff, and throttling also lowers the
+    number of concurrent requests.
+    """
+
+    def __init__(self, max_concurrency: int = 16, max_attempts: int = 5, base_delay=0.1, max_delay=5.0):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.concurrency_limit = AdaptiveConcurrencyLimit(max_concurrency)
+        self.executor = ThreadPoolExecutor(max_workers=max(1, max_concurrency), thread_name_prefix="s3-acl")
+
+    def set_file_acls(self, files: Iterable[FieldFile], acl_name: str) -> dict[FieldFile, FileAclResult]:
+        futures = self.submit_file_acls(files, acl_name)
+        return {file: future.result() for file, future in futures.items()}
+
+    def submit_file_acls(self, files: Iterable[FieldFile], acl_name: str) -> dict[FieldFile, Future[FileAclResult]]:
+        """
+        Start setting the ACLs for `files` without waiting for them, so the caller can
+        get on with something else (e.g. fetching the next batch of files) meanwhile.
+        """
+        return {file: self.executor.submit(self.set_file_acl, file, acl_name) for file in files}
+
+    def set_file_acl(self, file: FieldFile, acl_name: str) -> FileAclResult:
+        if not isinstance(file.storage, S3Storage):
+            # In environments that don't use S3, there is nothing to do
+            logger.debug("ACL setting is unnecessary for %s", file.name)
+            return FileAclResult(file.name, acl_name, success=True)
+
+        error = ""
+        for attempt in range(1, self.max_attempts + 1):
+            with self.concurrency_limit:
+                try:
+                    self.put_object_acl(file, acl_name)
+                except ClientError as e:
+                    code = e.response.get("Error", {}).get("Code", "")
+                    error = f"{code}: {e}"
+                    if code in THROTTLING_ERROR_CODES:
+                        self.concurrency_limit.record_throttle()
+                    elif code not in TRANSIENT_ERROR_CODES:
+                        break
+                except BotoCoreError as e:
+                    # connection errors, timeouts, etc.
+                    error = repr(e)
+                else:
+                    self.concurrency_limit.record_success()
+                    logger.debug("ACL set successfully for %s", file.name)
+                    return FileAclResult(file.name, acl_name, success=True, attempts=attempt)
+
+            if attempt < self.max_attempts:
+                time.sleep(self.get_retry_delay(attempt))
+
+        logger.warning("Failed to set ACL for %s after %d attempt(s): %s", file.name, attempt, error)
+        return FileAclResult(file.name, acl_name, success=False, attempts=attempt, error=error)
+
+    def put_object_acl(self, file: FieldFile, acl_name: str) -> None:
+        client = file.storage.connection.meta.client
+        client.put_object_acl(Bucket=file.storage.bucket_name, Key=file.name, ACL=acl_name)
+
+    def get_retry_delay(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))  # noqa: S311
+
+
+@lru_cache
+def get_acl_engine() -> AclEngine:
+    """
+    Returns the process-wide `AclEngine`.
+    """
+    return AclEngine(
+        max_concurrency=getattr(settings, "PRIVATE_MEDIA_ACL_MAX_CONCURRENCY", 16),
+        max_attempts=getattr(settings, "PRIVATE_MEDIA_ACL_MAX_ATTEMPTS", 5),
+    )
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from wagtail.models import Page
+
+from ons_alpha.private_media.models import MediaUsage
+from ons_alpha.private_media.signal_handlers import record_media_usage
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the record of which live pages use each item of privacy-controlled media."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="The number of pages to process at a time.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        page_ids = list(Page.objects.live().order_by("pk").values_list("pk", flat=True))
+
+        with transaction.atomic():
+            MediaUsage.objects.all().delete()
+            for i in range(0, len(page_ids), batch_size):
+                record_media_usage([Page(pk=pk) for pk in page_ids[i : i + batch_size]])
+
+        self.stdout.write(f"Recorded {MediaUsage.objects.count()} media usages for {len(page_ids)} live pages")
@@ -1,11 +1,13 @@
+import time
+
 from django.core.management.base import BaseCommand
-from django.db.models import F
 
-from ons_alpha.private_media.constants import PRIVATE_FILE_ACL, PUBLIC_FILE_ACL
+from ons_alpha.private_media.reconciliation import get_checkpoint, reconcile_file_acls
 from ons_alpha.private_media.signal_handlers import get_private_media_models
 
 
 class Command(BaseCommand):
+    help = "Sets the file ACLs for privacy-controlled media whose privacy has changed since they were last set."
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -15,33 +17,49 @@ class Command(BaseCommand):
             default=False,
             help="Dry run -- don't change anything.",
         )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="The number of objects to fetch at a time.",
+        )
+        parser.add_argument(
+            "--max-duration",
+            type=float,
+            default=None,
+            help="Stop after this many seconds. The next run will carry on from where this one stopped.",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            default=False,
+            help="Start from the beginning, rather than from where the last unfinished run stopped.",
+        )
 
     def handle(self, *args, **options):
-        dry_run = False
         if options["dry_run"]:
             self.stdout.write("This is a dry run.")
-            dry_run = True
+            for model in get_private_media_models():
+                count = model.objects.outstanding_acls().count()
+                self.stdout.write(f"{count} {model.__name__} instances require ACL updates")
+            return
 
+        max_duration = options["max_duration"]
+        started = time.monotonic()
         for model in get_private_media_models():
-            acls_needs_updating = list(model.objects.filter(acls_last_set__lt=F("privacy_last_changed")))
-            self.stdout.write(f"{len(acls_needs_updating)} {model.__name__} instances require ACL updates")
-            if acls_needs_updating and not dry_run:
-
-                private = []
-                public = []
-                for obj in acls_needs_updating:
-                    if obj.is_private:
-                        private.append(obj)
-                    else:
-                        public.append(obj)
-
-                if private:
-                    private_result = model.objects.bulk_set_file_acls(private, PRIVATE_FILE_ACL)
-                    self.stdout.write(
-                        f"ACLs successfully set for {private_result} private {model._meta.verbose_name_plural}"
-                    )
-                if public:
-                    public_result = model.objects.bulk_set_file_acls(private, PUBLIC_FILE_ACL)
-                    self.stdout.write(
-                        f"ACLs successfully set for {public_result} public items {model._meta.verbose_name_plural}"
-                    )
+            if not options["restart"] and (checkpoint := get_checkpoint(model)) is not None:
+                self.stdout.write(f"Resuming {model.__name__} ACL updates after id {checkpoint}")
+
+            result = reconcile_file_acls(
+                model,
+                chunk_size=options["chunk_size"],
+                # the time limit applies to the run as a whole
+                max_duration=None if max_duration is None else max(0, max_duration - (time.monotonic() - started)),
+                resume=not options["restart"],
+            )
+
+            self.stdout.write(f"ACLs successfully set for {result.updated} {model._meta.verbose_name_plural}")
+            if result.failed:
+                self.stdout.write(f"Failed to set ACLs for {result.failed} {model._meta.verbose_name_plural}")
+            if not result.complete:
+                self.stdout.write(f"Stopped after {max_duration} seconds. The next run will resume.")
@@ -0,0 +1,79 @@
+# Generated by Django 4.2.16 on 2026-10-18 00:47
+
+import django.db.models.deletion
+
+from django.db import migrations, models
+
+
+def populate_media_usage(apps, schema_editor):
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    Page = apps.get_model("wagtailcore", "Page")
+    ReferenceIndex = apps.get_model("wagtailcore", "ReferenceIndex")
+    MediaUsage = apps.get_model("private_media", "MediaUsage")
+
+    page_content_type = ContentType.objects.filter(app_label="wagtailcore", model="page").first()
+    media_content_type_ids = list(
+        ContentType.objects.filter(
+            app_label__in=["images", "documents"], model__in=["customimage", "customdocument"]
+        ).values_list("id", flat=True)
+    )
+    if page_content_type is None or not media_content_type_ids:
+        return
+
+    live_page_ids = [str(pk) for pk in Page.objects.filter(live=True).values_list("pk", flat=True)]
+    references = (
+        ReferenceIndex.objects.filter(
+            base_content_type=page_content_type,
+            object_id__in=live_page_ids,
+            to_content_type_id__in=media_content_type_ids,
+        )
+        .values_list("to_content_type_id", "to_object_id", "object_id")
+        .distinct()
+    )
+    MediaUsage.objects.bulk_create(
+        [
+            MediaUsage(content_type_id=ct_id, object_id=obj_id, page_id=int(page_id))
+            for ct_id, obj_id, page_id in references.iterator()
+        ],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("wagtailcore", "0094_alter_page_locale"),
+        ("private_media", "0002_setup_collections"),
+        # the usage of existing images and documents is recorded
+        ("images", "0002_customimage_acls_last_set_customimage_is_private_and_more"),
+        ("documents", "0002_customdocument_acls_last_set_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MediaUsage",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False)),
+                ("object_id", models.CharField(max_length=255)),
+                (
+                    "content_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="+", to="contenttypes.contenttype"
+                    ),
+                ),
+                (
+                    "page",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="+", to="wagtailcore.page"
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="mediausage",
+            constraint=models.UniqueConstraint(fields=("content_type", "object_id", "page"), name="unique_media_usage"),
+        ),
+        migrations.RunPython(populate_media_usage, migrations.RunPython.noop),
+    ]
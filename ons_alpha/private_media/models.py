@@ -1,11 +1,17 @@
 import logging
+import threading
 
-from collections import defaultdict
-from collections.abc import Iterable
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable, Hashable, Iterable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from datetime import datetime
 
 from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
 from django.core.files.base import File
 from django.db import models
+from django.db.models import F, Q
 from django.db.models.fields.files import FieldFile
 from django.utils import timezone
 from wagtail.documents.models import DocumentQuerySet
@@ -13,6 +19,7 @@ from wagtail.images.models import AbstractRendition, Filter, ImageQuerySet
 from wagtail.models import Collection, CollectionMember
 
 from ons_alpha.private_media import utils
+from ons_alpha.private_media.acls import FileAclResult, get_acl_engine
 from ons_alpha.private_media.constants import PRIVATE_FILE_ACL, PUBLIC_FILE_ACL
 
 
@@ -33,6 +40,53 @@ class ProtectedCollection(models.Model):
         return f"Exists to prevent accidental deletion of {self.collection!r}"
 
 
+class MediaUsageQuerySet(models.QuerySet):
+    def for_media(self, identifiers: Iterable[tuple[int | str, str]]) -> "MediaUsageQuerySet":
+        """
+        Filter to usages of the media identified by the supplied
+        (`content_type_id`, `object_id`) tuples.
+        """
+        ids_by_ctype = defaultdict(set)
+        for ct_id, obj_id in identifiers:
+            ids_by_ctype[int(ct_id)].add(str(obj_id))
+        if not ids_by_ctype:
+            return self.none()
+
+        q = Q()
+        for ct_id, id_list in ids_by_ctype.items():
+            q |= Q(content_type_id=ct_id, object_id__in=id_list)
+        return self.filter(q)
+
+    def media_ids(self) -> set[tuple[int, str]]:
+        """
+        Return a set of (`content_type_id`, `object_id`) tuples for the media in this queryset.
+        """
+        return set(self.values_list("content_type_id", "object_id").distinct())
+
+
+class MediaUsage(models.Model):
+    """
+    Records which live pages use each item of privacy-controlled media, so that
+    deciding whether media is still in use when a page is unpublished is a single
+    indexed lookup. Kept up to date by the 'page_published' and 'page_unpublished'
+    signal handlers, and can be rebuilt with the `rebuild_media_usage` command.
+    """
+
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE, related_name="+")
+    object_id = models.CharField(max_length=255)
+    page = models.ForeignKey("wagtailcore.Page", on_delete=models.CASCADE, related_name="+")
+
+    objects = MediaUsageQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["content_type", "object_id", "page"], name="unique_media_usage"),
+        ]
+
+    def __str__(self):
+        return f"Media {self.content_type_id}:{self.object_id} used by page {self.page_id}"
+
+
 class PrivateMediaManager(models.Manager):
     """
     A custom model `Manager` to be used by concrete subclasses of
@@ -42,6 +96,7 @@ class PrivateMediaManager(models.Manager):
     """
 
     managed_privacy_fields = (
+        "collection",
         "is_private",
         "last_public_collection",
         "last_private_collection",
@@ -49,6 +104,9 @@ class PrivateMediaManager(models.Manager):
         "acls_last_set",
     )
 
+    # Related objects used by `get_privacy_controlled_files()`, to fetch in bulk
+    privacy_controlled_files_prefetch: tuple[str, ...] = ()
+
     def bulk_make_public(self, objects: list["PrivateMediaCollectionMember"]) -> int:
         """
         Make a list of objects of this type 'public' as efficiently as
@@ -85,6 +143,21 @@ class PrivateMediaManager(models.Manager):
         self.bulk_set_file_acls(to_update, PRIVATE_FILE_ACL)
         return count
 
+    def outstanding_acls(self) -> models.QuerySet:
+        """
+        Returns the objects whose privacy has changed since the ACLs for their files
+        were last set successfully (including those that have never had them set),
+        ordered by pk, with anything needed to find their files prefetched.
+        """
+        return (
+            self.filter(
+                Q(acls_last_set__lte=F("privacy_last_changed"))
+                | Q(acls_last_set__isnull=True, privacy_last_changed__isnull=False)
+            )
+            .order_by("pk")
+            .prefetch_related(*self.privacy_controlled_files_prefetch)
+        )
+
     def bulk_set_file_acls(self, objects: list["PrivateMediaCollectionMember"], acl_name: str) -> int:
         """
         For a list of objects of this type, set the ACLs for all related
@@ -92,20 +165,34 @@ class PrivateMediaManager(models.Manager):
         for which all related files were successfully updated - which will
         also have their 'acls_last_set' datetime updated.
         """
-        successfully_updated_objects = []
-        files_by_object: dict[PrivateMediaCollectionMember, list[FieldFile]] = defaultdict(list)
-        all_files = []
-
-        for obj in objects:
-            for file in obj.get_privacy_controlled_files():
-                all_files.append(file)
-                files_by_object[obj].append(file)
+        return self.save_file_acl_results(self.submit_file_acls(objects, acl_name))
 
-        results = utils.set_file_acls(all_files, acl_name)
+    def submit_file_acls(self, objects: Iterable["PrivateMediaCollectionMember"], acl_name: str) -> "PendingFileAcls":
+        """
+        Start setting the ACLs for all files related to `objects` on the shared
+        `AclEngine`, without waiting for them to finish. Pass the result to
+        `save_file_acl_results()` to wait for them and record the outcome.
+        """
+        engine = get_acl_engine()
+        return PendingFileAcls(
+            submitted_at=timezone.now(),
+            futures={
+                obj: list(engine.submit_file_acls(obj.get_privacy_controlled_files(), acl_name).values())
+                for obj in objects
+            },
+        )
 
-        for obj, files in files_by_object.items():
-            if all(results.get(file) for file in files):
-                obj.acls_last_set = timezone.now()
+    def save_file_acl_results(self, pending: "PendingFileAcls") -> int:
+        """
+        Wait for the ACL updates in `pending`, then update 'acls_last_set' for the objects
+        whose files were all updated successfully. Returns the number of those objects.
+        """
+        successfully_updated_objects = []
+        for obj, futures in pending.futures.items():
+            if all(future.result().success for future in futures):
+                # Use the time the updates started, so that any change to the object's
+                # privacy made while they were in progress still needs reconciling
+                obj.acls_last_set = pending.submitted_at
                 successfully_updated_objects.append(obj)
 
         if successfully_updated_objects:
@@ -114,6 +201,16 @@ class PrivateMediaManager(models.Manager):
         return 0
 
 
+@dataclass
+class PendingFileAcls:
+    """
+    ACL updates that have been started for the files of some objects.
+    """
+
+    submitted_at: datetime
+    futures: dict["PrivateMediaCollectionMember", list[Future[FileAclResult]]]
+
+
 class PrivateMediaCollectionMember(CollectionMember):
     """
     An abstract model class that can either be used a mixin to apply
@@ -177,8 +274,7 @@ class PrivateMediaCollectionMember(CollectionMember):
             # Only update 'acls_last_set' if all ACL updates were successfull
             if set(results.values()) == {True}:
                 self.acls_last_set = timezone.now()
-                kwargs["update_fields"] = ["acls_last_set"]
-                super().save(*args, **kwargs)
+                super().save(update_fields=["acls_last_set"])
 
     @property
     def is_public(self) -> bool:
@@ -254,6 +350,8 @@ class PrivateImageManager(PrivateMediaManager):
     filter methods other functionality that Wagtail itself depends on.
     """
 
+    privacy_controlled_files_prefetch = ("renditions",)
+
     def get_queryset(self):
         return ImageQuerySet(self.model, using=self._db)
 
@@ -276,18 +374,52 @@ class PrivateImageMixin(PrivateMediaCollectionMember):
         for rendition in self.renditions.all():
             yield rendition.file
 
+    def get_new_rendition_acl(self) -> str | None:
+        """
+        Returns the ACL that needs to be set for newly created rendition files, or
+        `None` if the default ACL applied on upload is already correct.
+        """
+        if self.is_private and getattr(settings, "AWS_DEFAULT_ACL", PRIVATE_FILE_ACL) != PRIVATE_FILE_ACL:
+            return PRIVATE_FILE_ACL
+        if self.is_public and getattr(settings, "AWS_DEFAULT_ACL", PUBLIC_FILE_ACL) != PUBLIC_FILE_ACL:
+            return PUBLIC_FILE_ACL
+        return None
+
     def create_renditions(self, *filters: Filter) -> dict[Filter, AbstractRendition]:
         created_renditions = super().create_renditions(*filters)
-        new_rendition_acl = None
-        if self.is_private and getattr(settings, "AWS_DEFAULT_ACL", PRIVATE_FILE_ACL) != PRIVATE_FILE_ACL:
-            new_rendition_acl = PRIVATE_FILE_ACL
-        elif self.is_public and getattr(settings, "AWS_DEFAULT_ACL", PUBLIC_FILE_ACL) != PUBLIC_FILE_ACL:
-            new_rendition_acl = PUBLIC_FILE_ACL
-        if new_rendition_acl:
+        if new_rendition_acl := self.get_new_rendition_acl():
             utils.set_file_acls([r.file for r in created_renditions.values()], new_rendition_acl)
         return created_renditions
 
 
+class RenditionUrlCache:
+    """
+    A bounded, process-wide cache of resolved rendition URLs, which discards the
+    least recently used URLs when full.
+    """
+
+    def __init__(self, maxsize: int = 10_000):
+        self.maxsize = maxsize
+        self._urls: OrderedDict[Hashable, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_set(self, key: Hashable, get_url: Callable[[], str]) -> str:
+        with self._lock:
+            if (url := self._urls.get(key)) is not None:
+                self._urls.move_to_end(key)
+                return url
+        url = get_url()
+        with self._lock:
+            self._urls[key] = url
+            if len(self._urls) > self.maxsize:
+                self._urls.popitem(last=False)
+        return url
+
+    def clear(self) -> None:
+        with self._lock:
+            self._urls.clear()
+
+
 class PrivateAbstractRendition(AbstractRendition):
     """
     A replacement for Wagtail's built-in `AbstractRendition` model, that should be used as
@@ -296,6 +428,8 @@ class PrivateAbstractRendition(AbstractRendition):
     for private images.
     """
 
+    url_cache = RenditionUrlCache()
+
     class Meta:
         abstract = True
 
@@ -309,6 +443,22 @@ class PrivateAbstractRendition(AbstractRendition):
             [str(image.id), image.file_hash, str(image.is_private), filter_cache_key, filter_spec]
         )
 
+    def get_url_cache_key(self) -> tuple:
+        """
+        Returns the key for this rendition's URL in `url_cache`. It includes the image's
+        file hash and privacy state, so any change to them results in a new URL.
+        """
+        image = self.image
+        return (
+            self._meta.label,
+            image.pk,
+            image.file_hash,
+            image.is_private,
+            image.acls_are_up_to_date(),
+            self.filter_spec,
+            self.focal_point_key,
+        )
+
     @property
     def url(self):
         """
@@ -319,7 +469,15 @@ class PrivateAbstractRendition(AbstractRendition):
         For public images that have undergone succesful ACL-setting attempts,
         return the file URL, so that S3 (or other active media backend)
         handles the request.
+
+        URLs are cached (per process) for saved renditions, as they are often
+        requested many times, e.g. for the thumbnails on listing pages.
         """
+        if self.pk is None:
+            return self.get_url()
+        return self.url_cache.get_or_set(self.get_url_cache_key(), self.get_url)
+
+    def get_url(self) -> str:
         from wagtail.images.views.serve import generate_image_url  # pylint: disable=import-outside-toplevel
 
         if self.image.is_public and self.image.acls_are_up_to_date():
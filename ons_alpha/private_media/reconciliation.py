@@ -0,0 +1,114 @@
+import time
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+from django.core.cache import cache
+
+from ons_alpha.private_media.constants import PRIVATE_FILE_ACL, PUBLIC_FILE_ACL
+from ons_alpha.private_media.models import PendingFileAcls, PrivateMediaCollectionMember
+
+
+# Long enough to survive between scheduled runs, short enough not to linger forever
+CHECKPOINT_TIMEOUT = 60 * 60 * 24 * 7
+
+
+@dataclass
+class ReconciliationResult:
+    model: type[PrivateMediaCollectionMember]
+    updated: int = 0
+    failed: int = 0
+    complete: bool = False
+
+
+def get_checkpoint_cache_key(model: type[PrivateMediaCollectionMember]) -> str:
+    return f"private_media:acl_reconciliation:{model._meta.label_lower}"
+
+
+def get_checkpoint(model: type[PrivateMediaCollectionMember]) -> int | None:
+    """
+    Returns the pk of the last object checked by an unfinished run, if there is one.
+    """
+    return cache.get(get_checkpoint_cache_key(model))
+
+
+def set_checkpoint(model: type[PrivateMediaCollectionMember], pk: int) -> None:
+    cache.set(get_checkpoint_cache_key(model), pk, CHECKPOINT_TIMEOUT)
+
+
+def clear_checkpoint(model: type[PrivateMediaCollectionMember]) -> None:
+    cache.delete(get_checkpoint_cache_key(model))
+
+
+def iter_outstanding_acl_chunks(
+    model: type[PrivateMediaCollectionMember], chunk_size: int, after_pk: int | None = None
+) -> Iterator[list[PrivateMediaCollectionMember]]:
+    """
+    Yields the objects that need their ACLs setting in chunks of up to `chunk_size`,
+    paginating on the pk, so that each chunk is a cheap indexed query however far
+    through the table it is.
+    """
+    queryset = model.objects.outstanding_acls()
+    while True:
+        chunk = list((queryset if after_pk is None else queryset.filter(pk__gt=after_pk))[:chunk_size])
+        if not chunk:
+            return
+        yield chunk
+        after_pk = chunk[-1].pk
+
+
+def submit_chunk(
+    model: type[PrivateMediaCollectionMember], chunk: list[PrivateMediaCollectionMember]
+) -> list[PendingFileAcls]:
+    private = [obj for obj in chunk if obj.is_private]
+    public = [obj for obj in chunk if obj.is_public]
+    return [
+        model.objects.submit_file_acls(objects, acl_name)
+        for objects, acl_name in ((private, PRIVATE_FILE_ACL), (public, PUBLIC_FILE_ACL))
+        if objects
+    ]
+
+
+def reconcile_file_acls(
+    model: type[PrivateMediaCollectionMember],
+    *,
+    chunk_size: int = 500,
+    max_duration: float | None = None,
+    resume: bool = True,
+) -> ReconciliationResult:
+    """
+    Set the ACLs for the files of all objects of `model` whose privacy has changed
+    since their ACLs were last set successfully.
+
+    The objects are fetched in chunks, and the ACLs for each chunk are set on the shared
+    `AclEngine` pool while the next chunk is being fetched. Progress is checkpointed
+    after each chunk, so a run that is interrupted, or stops after `max_duration`
+    seconds, is resumed by the next one (unless `resume` is `False`). Objects whose
+    ACLs couldn't be set are retried by the next run to start from the beginning.
+    """
+    result = ReconciliationResult(model)
+    deadline = None if max_duration is None else time.monotonic() + max_duration
+    after_pk = get_checkpoint(model) if resume else None
+
+    def finish(chunk, pending):
+        updated = sum(model.objects.save_file_acl_results(item) for item in pending)
+        result.updated += updated
+        result.failed += len(chunk) - updated
+        set_checkpoint(model, chunk[-1].pk)
+
+    in_flight = None
+    for chunk in iter_outstanding_acl_chunks(model, chunk_size, after_pk):
+        pending = submit_chunk(model, chunk)
+        if in_flight is not None:
+            finish(*in_flight)
+        in_flight = (chunk, pending)
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+    else:
+        result.complete = True
+
+    if in_flight is not None:
+        finish(*in_flight)
+    if result.complete:
+        clear_checkpoint(model)
+    return result
@@ -0,0 +1,188 @@
+import mimetypes
+
+from collections.abc import Iterator
+from urllib.parse import quote
+
+from django.conf import settings
+from django.db.models.fields.files import FieldFile
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from django.shortcuts import redirect
+from django.utils.cache import patch_cache_control
+from django.utils.http import quote_etag
+from storages.backends.s3 import S3Storage
+
+
+SERVE_METHOD_REDIRECT = "redirect"
+SERVE_METHOD_X_ACCEL_REDIRECT = "x_accel_redirect"
+SERVE_METHOD_STREAM = "stream"
+
+STREAMING_CHUNK_SIZE = 64 * 1024
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def get_content_type(file: FieldFile) -> str:
+    return mimetypes.guess_type(file.name)[0] or "application/octet-stream"
+
+
+def get_signed_url(file: FieldFile, expires_in: int, **response_params) -> str | None:
+    """
+    Returns a short-lived signed URL for `file`, which can be used to download it even
+    though its ACL is private, or `None` if its storage doesn't support signed URLs.
+    `response_params` (e.g. `ResponseContentType`) override the response headers.
+    """
+    if not isinstance(file.storage, S3Storage):
+        return None
+    client = file.storage.connection.meta.client
+    return client.generate_presigned_url(
+        "get_object",
+        Params={"Bucket": file.storage.bucket_name, "Key": file.name, **response_params},
+        ExpiresIn=expires_in,
+    )
+
+
+def serve_private_file(
+    file: FieldFile,
+    content_type: str | None = None,
+    *,
+    request: HttpRequest | None = None,
+    content_disposition: str | None = None,
+    size: int | None = None,
+    etag: str | None = None,
+) -> HttpResponse:
+    """
+    Serve a privacy-controlled `file` that can't be served from its public URL, without
+    streaming its contents through this process where possible. Depending on the
+    `PRIVATE_MEDIA_SERVE_METHOD` setting, this is done by:
+
+    - "redirect": redirecting to a short-lived signed URL (for files in S3)
+    - "x_accel_redirect": handing the file over to the web server (e.g. nginx) with an
+      `X-Accel-Redirect` header, which must be mapped to the storage by the server
+    - "stream": streaming the file (also used when the file can't be redirected to),
+      with support for range requests when `request` is given
+    """
+    content_type = content_type or get_content_type(file)
+    method = getattr(settings, "PRIVATE_MEDIA_SERVE_METHOD", SERVE_METHOD_REDIRECT)
+
+    if method == SERVE_METHOD_X_ACCEL_REDIRECT:
+        response = HttpResponse(content_type=content_type)
+        response["X-Accel-Redirect"] = settings.PRIVATE_MEDIA_X_ACCEL_REDIRECT_PREFIX + quote(file.name)
+        if content_disposition:
+            response["Content-Disposition"] = content_disposition
+        return response
+
+    if method == SERVE_METHOD_REDIRECT:
+        expires_in = settings.PRIVATE_MEDIA_SIGNED_URL_EXPIRY
+        response_params = {"ResponseContentType": content_type}
+        if content_disposition:
+            response_params["ResponseContentDisposition"] = content_disposition
+        if url := get_signed_url(file, expires_in, **response_params):
+            response = redirect(url)
+            # the redirect must not be reused once the signed URL has expired
+            patch_cache_control(response, private=True, max_age=expires_in // 2)
+            return response
+
+    return stream_file(
+        file, content_type, request=request, content_disposition=content_disposition, size=size, etag=etag
+    )
+
+
+def stream_file(
+    file: FieldFile,
+    content_type: str,
+    *,
+    request: HttpRequest | None = None,
+    content_disposition: str | None = None,
+    size: int | None = None,
+    etag: str | None = None,
+) -> HttpResponse:
+    """
+    Stream `file` in chunks, or the single byte range requested by `request`. Files in
+    S3 are streamed as they are downloaded, rather than downloaded to disk first.
+    """
+    if size is None:
+        size = file.size
+
+    try:
+        byte_range = get_byte_range(request, size, etag) if request is not None else None
+    except RangeNotSatisfiable:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+        return response
+
+    if byte_range is None:
+        first, last = 0, size - 1
+        response = StreamingHttpResponse(iter_file_range(file, first, last), content_type=content_type)
+    else:
+        first, last = byte_range
+        response = StreamingHttpResponse(iter_file_range(file, first, last), content_type=content_type, status=206)
+        response["Content-Range"] = f"bytes {first}-{last}/{size}"
+
+    response["Content-Length"] = last - first + 1
+    response["Accept-Ranges"] = "bytes"
+    if content_disposition:
+        response["Content-Disposition"] = content_disposition
+    return response
+
+
+def get_byte_range(request: HttpRequest, size: int, etag: str | None = None) -> tuple[int, int] | None:
+    """
+    Returns the (first, last) byte positions requested by the request's `Range` header, or
+    `None` if the whole file should be served. Raises `RangeNotSatisfiable` if the range
+    is outside of the file.
+
+    Only single ranges are supported. Other ranges, and ranges with an `If-Range` header
+    that doesn't match `etag`, are ignored, as allowed by RFC 9110.
+    """
+    header = request.headers.get("Range", "")
+    if not header:
+        return None
+    if_range = request.headers.get("If-Range")
+    if if_range is not None and (etag is None or if_range != quote_etag(etag)):
+        return None
+
+    unit, _, ranges = header.partition("=")
+    first, separator, last = ranges.strip().partition("-")
+    if unit.strip().lower() != "bytes" or "," in ranges or not separator:
+        return None
+
+    try:
+        if not first:
+            # a suffix range, for the last N bytes
+            length = int(last)
+            if length <= 0 or size == 0:
+                raise RangeNotSatisfiable(header)
+            return max(0, size - length), size - 1
+        first = int(first)
+        last = int(last) if last else size - 1
+    except ValueError:
+        return None
+
+    if first >= size:
+        raise RangeNotSatisfiable(header)
+    if first > last:
+        return None
+    return first, min(last, size - 1)
+
+
+def iter_file_range(file: FieldFile, first: int, last: int) -> Iterator[bytes]:
+    if last < first:
+        return
+
+    if isinstance(file.storage, S3Storage):
+        client = file.storage.connection.meta.client
+        body = client.get_object(Bucket=file.storage.bucket_name, Key=file.name, Range=f"bytes={first}-{last}")["Body"]
+        try:
+            yield from body.iter_chunks(STREAMING_CHUNK_SIZE)
+        finally:
+            body.close()
+        return
+
+    with file.storage.open(file.name, "rb") as f:
+        f.seek(first)
+        remaining = last - first + 1
+        while remaining > 0 and (chunk := f.read(min(STREAMING_CHUNK_SIZE, remaining))):
+            remaining -= len(chunk)
+            yield chunk
@@ -2,12 +2,14 @@ from collections import defaultdict
 
 from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import Q, QuerySet
+from django.db.models import QuerySet
 from wagtail.images.models import AbstractImage
 from wagtail.models import Page, ReferenceIndex
 from wagtail.signals import page_published, page_unpublished
 
-from .models import PrivateMediaCollectionMember
+from ons_alpha.utils.side_effects import defer_or_run
+
+from .models import MediaUsage, PrivateMediaCollectionMember
 
 
 def get_private_media_models():
@@ -19,14 +21,64 @@ def publish_page_media_on_publish(instance, **kwargs):  # pylint: disable=unused
     Signal handler to be connected to the 'page_published' signal for
     all page types. It is responsible for identifying any privacy-controlled
     media used by the page, and ensuring that it is also made public.
+
+    Media usage is recorded straight away, as part of the publish. Updating the
+    media itself is deferred when pages are published together (e.g. as part of a
+    bundle), and merged into a single pass once the changes are committed.
     """
-    ids_by_ctype = defaultdict(list)
-    for ct_id, obj_id in get_all_page_media_ids(instance):
-        ids_by_ctype[ct_id].append(obj_id)
+    media_ids = record_media_usage([instance])
+    defer_or_run(make_media_public, media_ids, key=instance.pk)
 
-    for ct_id, id_list in ids_by_ctype.items():
-        model_class = ContentType.objects.get_for_id(ct_id).model_class()
-        id_list = [model_class._meta.pk.to_python(id) for id in id_list]
+
+def unpublish_page_media_on_unpublish(instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Signal handler to be connected to the 'page_unpublished' signal for
+    all page types. It is responsible for identifying any privacy-controlled
+    media used exclusively by the page, and ensuring that it is also made
+    private.
+    """
+    media_ids = remove_media_usage([instance])
+    defer_or_run(make_unused_media_private, media_ids, key=instance.pk)
+
+
+def record_media_usage(pages: list[Page]) -> set[tuple[int, str]]:
+    """
+    Replace the `MediaUsage` records for the provided (live) pages with their
+    current media references. Returns a set of (`content_type_id`, `object_id`)
+    tuples for all media used by the pages.
+    """
+    page_ids = [page.pk for page in pages]
+    usages = set(
+        get_pages_media_references(pages).values_list("to_content_type", "to_object_id", "object_id").distinct()
+    )
+    MediaUsage.objects.filter(page_id__in=page_ids).delete()
+    MediaUsage.objects.bulk_create(
+        [
+            MediaUsage(content_type_id=ct_id, object_id=obj_id, page_id=int(page_id))
+            for ct_id, obj_id, page_id in usages
+        ],
+        ignore_conflicts=True,
+    )
+    return {(ct_id, obj_id) for ct_id, obj_id, _ in usages}
+
+
+def remove_media_usage(pages: list[Page]) -> set[tuple[int, str]]:
+    """
+    Remove the `MediaUsage` records for the provided pages. Returns a set of
+    (`content_type_id`, `object_id`) tuples for the media they were using.
+    """
+    usages = MediaUsage.objects.filter(page_id__in=[page.pk for page in pages])
+    media_ids = usages.media_ids()
+    usages.delete()
+    return media_ids
+
+
+def make_media_public(media_id_sets: list[set[tuple[int, str]]]) -> None:
+    """
+    Make the privacy-controlled media identified by the provided sets of
+    (`content_type_id`, `object_id`) tuples public.
+    """
+    for model_class, id_list in _group_ids_by_model(set().union(*media_id_sets)).items():
         private_objects_qs = model_class.objects.filter(id__in=id_list, is_private=True).select_related(
             "collection", "last_public_collection", "last_private_collection"
         )
@@ -35,20 +87,15 @@ def publish_page_media_on_publish(instance, **kwargs):  # pylint: disable=unused
         model_class.objects.bulk_make_public(list(private_objects_qs))
 
 
-def unpublish_page_media_on_unpublish(instance, **kwargs):  # pylint: disable=unused-argument
+def make_unused_media_private(media_id_sets: list[set[tuple[int, str]]]) -> None:
     """
-    Signal handler to be connected to the 'page_unpublished' signal for
-    all page types. It is responsible for identifying any privacy-controlled
-    media used exclusively by the page, and ensuring that it is also made
-    private.
+    Make the privacy-controlled media identified by the provided sets of
+    (`content_type_id`, `object_id`) tuples private, unless it is still used
+    by a live page.
     """
-    ids_by_ctype = defaultdict(list)
-    for ct_id, obj_id in get_unique_to_page_media_ids(instance):
-        ids_by_ctype[ct_id].append(obj_id)
-
-    for ct_id, id_list in ids_by_ctype.items():
-        model_class = ContentType.objects.get_for_id(ct_id).model_class()
-        id_list = [model_class._meta.pk.to_python(id) for id in id_list]
+    media_ids = set().union(*media_id_sets)
+    unused_media_ids = media_ids - MediaUsage.objects.for_media(media_ids).media_ids()
+    for model_class, id_list in _group_ids_by_model(unused_media_ids).items():
         public_objects_qs = model_class.objects.filter(id__in=id_list, is_private=False).select_related(
             "collection", "last_public_collection", "last_private_collection"
         )
@@ -57,6 +104,18 @@ def unpublish_page_media_on_unpublish(instance, **kwargs):  # pylint: disable=un
         model_class.objects.bulk_make_private(list(public_objects_qs))
 
 
+def _group_ids_by_model(identifiers: set[tuple[int, str]]) -> dict[type, list]:
+    ids_by_ctype = defaultdict(list)
+    for ct_id, obj_id in identifiers:
+        ids_by_ctype[ct_id].append(obj_id)
+
+    ids_by_model = {}
+    for ct_id, id_list in ids_by_ctype.items():
+        model_class = ContentType.objects.get_for_id(ct_id).model_class()
+        ids_by_model[model_class] = [model_class._meta.pk.to_python(id) for id in id_list]
+    return ids_by_model
+
+
 def register_signal_handlers():
     page_published.connect(publish_page_media_on_publish, dispatch_uid="publish_media")
     page_unpublished.connect(unpublish_page_media_on_unpublish, dispatch_uid="unpublish_media")
@@ -68,9 +127,20 @@ def get_media_references(page: Page) -> QuerySet[ReferenceIndex]:
     `Page`, which refer to images, documents or instances of other model classe that
     subclass `PrivateMediaCollectionMember`.
     """
+    return get_pages_media_references([page])
+
+
+def get_pages_media_references(pages: list[Page]) -> QuerySet[ReferenceIndex]:
+    """
+    Like `get_media_references()`, but for several pages at once.
+    """
     models = get_private_media_models()
     content_types = ContentType.objects.get_for_models(*models)
-    return ReferenceIndex.get_references_for_object(page).filter(to_content_type__in=content_types.values())
+    return ReferenceIndex.objects.filter(
+        base_content_type=ContentType.objects.get_for_model(Page),
+        object_id__in=[str(page.pk) for page in pages],
+        to_content_type__in=content_types.values(),
+    )
 
 
 def get_all_page_media_ids(page: Page) -> set[tuple[str, str]]:
@@ -78,7 +148,15 @@ def get_all_page_media_ids(page: Page) -> set[tuple[str, str]]:
     Return a set of (`content_type_id`, `object_id`) tuples for all media referenced
     by the provided `Page`.
     """
-    return set(get_media_references(page).values_list("to_content_type", "to_object_id").distinct())
+    return get_all_pages_media_ids([page])
+
+
+def get_all_pages_media_ids(pages: list[Page]) -> set[tuple[str, str]]:
+    """
+    Return a set of (`content_type_id`, `object_id`) tuples for all media referenced
+    by any of the provided pages.
+    """
+    return set(get_pages_media_references(pages).values_list("to_content_type", "to_object_id").distinct())
 
 
 def get_unique_to_page_media_ids(page) -> set[tuple[str, str]]:
@@ -87,17 +165,16 @@ def get_unique_to_page_media_ids(page) -> set[tuple[str, str]]:
     ONLY by the provided `Page` (similar to `get_all_page_media_ids()`, but
     excluding media used on other pages).
     """
-    page_ctype = ContentType.objects.get_for_model(Page)
-    all_identifiers = get_all_page_media_ids(page)
-    all_identifiers_q = Q()
-    for ct_id, obj_id in all_identifiers:
-        all_identifiers_q |= Q(to_content_type_id=ct_id, to_object_id=obj_id)
-
-    referenced_elsewhere_identifiers = {
-        ReferenceIndex.objects.filter(all_identifiers_q)
-        .filter(base_content_type=page_ctype)
-        .exclude(object_id=page.id)
-        .values_list("to_content_type", "to_object_id")
-        .distinct()
-    }
+    return get_unique_to_pages_media_ids([page])
+
+
+def get_unique_to_pages_media_ids(pages: list[Page]) -> set[tuple[str, str]]:
+    """
+    Return a set of (`content_type_id`, `object_id`) tuples for media referenced
+    ONLY by the provided pages (excluding media used on any other live page).
+    """
+    all_identifiers = get_all_pages_media_ids(pages)
+    referenced_elsewhere_identifiers = (
+        MediaUsage.objects.for_media(all_identifiers).exclude(page_id__in=[page.pk for page in pages]).media_ids()
+    )
     return all_identifiers - referenced_elsewhere_identifiers
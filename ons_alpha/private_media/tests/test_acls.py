@@ -0,0 +1,99 @@
+from unittest import mock
+
+from botocore.exceptions import ClientError
+from django.core.files.base import ContentFile
+from django.core.files.storage import InMemoryStorage
+from django.db.models.fields.files import FieldFile
+from django.test import SimpleTestCase
+from storages.backends.s3 import S3Storage
+
+from ons_alpha.private_media.acls import AclEngine, AdaptiveConcurrencyLimit
+from ons_alpha.private_media.constants import PUBLIC_FILE_ACL
+
+
+def client_error(code):
+    return ClientError({"Error": {"Code": code, "Message": code}}, "PutObjectAcl")
+
+
+class AclEngineTestCase(SimpleTestCase):
+    def setUp(self):
+        self.engine = AclEngine(max_concurrency=4, max_attempts=3, base_delay=0)
+        self.storage = S3Storage(bucket_name="media")
+        self.client = mock.Mock()
+        connection_patcher = mock.patch.object(
+            S3Storage,
+            "connection",
+            new_callable=mock.PropertyMock,
+            return_value=mock.Mock(meta=mock.Mock(client=self.client)),
+        )
+        connection_patcher.start()
+        self.addCleanup(connection_patcher.stop)
+        self.addCleanup(self.engine.executor.shutdown)
+
+    def get_file(self, name):
+        return FieldFile(None, mock.Mock(storage=self.storage), name)
+
+    def test_sets_acls_without_reading_them(self):
+        files = [self.get_file(f"images/{i}.png") for i in range(3)]
+
+        results = self.engine.set_file_acls(files, PUBLIC_FILE_ACL)
+
+        self.assertTrue(all(result.success and result.attempts == 1 for result in results.values()))
+        self.assertEqual(self.client.put_object_acl.call_count, 3)
+        self.client.put_object_acl.assert_any_call(Bucket="media", Key="images/0.png", ACL=PUBLIC_FILE_ACL)
+        self.client.get_object_acl.assert_not_called()
+
+    def test_retries_when_throttled(self):
+        self.client.put_object_acl.side_effect = [client_error("SlowDown"), None]
+
+        result = self.engine.set_file_acl(self.get_file("images/1.png"), PUBLIC_FILE_ACL)
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.attempts, 2)
+        self.assertEqual(self.engine.concurrency_limit.limit, 2)
+
+    def test_gives_up_after_max_attempts(self):
+        self.client.put_object_acl.side_effect = client_error("ServiceUnavailable")
+
+        with self.assertLogs("ons_alpha.private_media.acls", "WARNING"):
+            result = self.engine.set_file_acl(self.get_file("images/1.png"), PUBLIC_FILE_ACL)
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.attempts, 3)
+        self.assertIn("ServiceUnavailable", result.error)
+
+    def test_does_not_retry_permanent_errors(self):
+        self.client.put_object_acl.side_effect = client_error("AccessDenied")
+
+        with self.assertLogs("ons_alpha.private_media.acls", "WARNING"):
+            result = self.engine.set_file_acl(self.get_file("images/1.png"), PUBLIC_FILE_ACL)
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.attempts, 1)
+
+    def test_skips_non_s3_storage(self):
+        storage = InMemoryStorage()
+        name = storage.save("images/1.png", ContentFile(b""))
+
+        result = self.engine.set_file_acl(FieldFile(None, mock.Mock(storage=storage), name), PUBLIC_FILE_ACL)
+
+        self.assertTrue(result.success)
+        self.assertTrue(result.skipped)
+        self.client.put_object_acl.assert_not_called()
+
+
+class AdaptiveConcurrencyLimitTestCase(SimpleTestCase):
+    def test_backs_off_and_recovers(self):
+        limit = AdaptiveConcurrencyLimit(maximum=8)
+
+        limit.record_throttle()
+        limit.record_throttle()
+        self.assertEqual(limit.limit, 2)
+
+        for _ in range(2):
+            limit.record_success()
+        self.assertEqual(limit.limit, 3)
+
+        for _ in range(100):
+            limit.record_success()
+        self.assertEqual(limit.limit, 8)
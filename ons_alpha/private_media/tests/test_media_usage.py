@@ -0,0 +1,61 @@
+from importlib import import_module
+
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.test import TestCase
+from wagtail.images import get_image_model
+from wagtail.models import Collection
+from wagtail_factories import ImageFactory
+
+from ons_alpha.private_media.models import MediaUsage
+from ons_alpha.standardpages.factories import InformationPageFactory
+
+
+class MediaUsageTestCase(TestCase):
+    def setUp(self):
+        self.image = ImageFactory(collection=Collection.objects.get(name="Private"))
+        self.pages = [InformationPageFactory(live=False) for _ in range(2)]
+        for page in self.pages:
+            page.body = [("image", {"image": self.image, "caption": ""})]
+            page.save_revision()
+
+    def get_image(self):
+        return get_image_model().objects.get(pk=self.image.pk)
+
+    def get_usage_page_ids(self):
+        return set(
+            MediaUsage.objects.for_media(
+                [(ContentType.objects.get_for_model(self.image).pk, str(self.image.pk))]
+            ).values_list("page_id", flat=True)
+        )
+
+    def test_publish_records_usage_and_makes_media_public(self):
+        self.pages[0].get_latest_revision().publish()
+
+        self.assertEqual(self.get_usage_page_ids(), {self.pages[0].pk})
+        self.assertFalse(self.get_image().is_private)
+
+    def test_unpublish_keeps_media_used_by_other_live_pages_public(self):
+        for page in self.pages:
+            page.get_latest_revision().publish()
+        self.assertEqual(self.get_usage_page_ids(), {page.pk for page in self.pages})
+
+        for page in self.pages:
+            page.refresh_from_db()
+
+        self.pages[0].unpublish()
+        self.assertEqual(self.get_usage_page_ids(), {self.pages[1].pk})
+        self.assertFalse(self.get_image().is_private)
+
+        self.pages[1].unpublish()
+        self.assertEqual(self.get_usage_page_ids(), set())
+        self.assertTrue(self.get_image().is_private)
+
+    def test_migration_records_usage_of_live_pages(self):
+        self.pages[0].get_latest_revision().publish()
+        MediaUsage.objects.all().delete()
+
+        migration = import_module("ons_alpha.private_media.migrations.0003_media_usage")
+        migration.populate_media_usage(apps, None)
+
+        self.assertEqual(self.get_usage_page_ids(), {self.pages[0].pk})
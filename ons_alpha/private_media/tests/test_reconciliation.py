@@ -0,0 +1,98 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from wagtail.images import get_image_model
+from wagtail.models import Collection
+from wagtail_factories import ImageFactory
+
+from ons_alpha.private_media.acls import FileAclResult, get_acl_engine
+from ons_alpha.private_media.constants import PRIVATE_FILE_ACL, PUBLIC_FILE_ACL
+from ons_alpha.private_media.reconciliation import clear_checkpoint, get_checkpoint, reconcile_file_acls
+
+
+class ReconcileFileAclsTestCase(TestCase):
+    def setUp(self):
+        self.model = get_image_model()
+        clear_checkpoint(self.model)
+
+        self.private_image = ImageFactory(collection=Collection.objects.get(name="Private"))
+        self.public_images = [ImageFactory(collection=Collection.objects.get(name="Public")) for _ in range(3)]
+        self.up_to_date_image = ImageFactory(collection=Collection.objects.get(name="Public"))
+        self.private_image.get_rendition("width-100")
+
+        # ACLs that have never been set, and ACLs set before the privacy last changed
+        self.model.objects.filter(pk=self.private_image.pk).update(acls_last_set=None)
+        self.model.objects.filter(pk__in=[image.pk for image in self.public_images]).update(
+            acls_last_set=timezone.now() - timedelta(days=1)
+        )
+
+    def set_file_acl(self, success=True):
+        return mock.patch.object(
+            get_acl_engine(),
+            "set_file_acl",
+            side_effect=lambda file, acl_name: FileAclResult(file.name, acl_name, success=success, attempts=1),
+        )
+
+    def get_outstanding_ids(self):
+        return set(self.model.objects.outstanding_acls().values_list("pk", flat=True))
+
+    def test_outstanding_acls(self):
+        self.assertEqual(
+            self.get_outstanding_ids(), {self.private_image.pk, *(image.pk for image in self.public_images)}
+        )
+
+    def test_sets_the_acls_for_each_object_privacy(self):
+        with self.set_file_acl() as set_file_acl:
+            result = reconcile_file_acls(self.model, chunk_size=2)
+
+        self.assertEqual((result.updated, result.failed, result.complete), (4, 0, True))
+        self.assertEqual(self.get_outstanding_ids(), set())
+        acls = {call.args[0].name: call.args[1] for call in set_file_acl.call_args_list}
+        self.assertEqual(len(acls), 5)
+        self.assertEqual(acls[self.private_image.file.name], PRIVATE_FILE_ACL)
+        self.assertEqual(acls[self.public_images[0].file.name], PUBLIC_FILE_ACL)
+
+    @override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+    def test_fetches_renditions_in_bulk(self):
+        # chunks of 2, 2 and 0 objects, renditions for each non-empty chunk,
+        # then one update for each ACL in each chunk (private and public, then public)
+        with self.set_file_acl(), self.assertNumQueries(3 + 2 + 3):
+            reconcile_file_acls(self.model, chunk_size=2)
+
+    def test_failures_remain_outstanding(self):
+        with self.set_file_acl(success=False):
+            result = reconcile_file_acls(self.model)
+
+        self.assertEqual((result.updated, result.failed, result.complete), (0, 4, True))
+        self.assertEqual(len(self.get_outstanding_ids()), 4)
+
+    def test_resumes_from_the_checkpoint(self):
+        with self.set_file_acl():
+            result = reconcile_file_acls(self.model, chunk_size=1, max_duration=0)
+
+        self.assertFalse(result.complete)
+        self.assertEqual(result.updated, 1)
+        self.assertEqual(get_checkpoint(self.model), self.private_image.pk)
+
+        with self.set_file_acl(success=False):
+            self.model.objects.filter(pk=self.private_image.pk).update(acls_last_set=None)
+            result = reconcile_file_acls(self.model)
+
+        # the object before the checkpoint is left for the next full pass
+        self.assertEqual((result.updated, result.failed, result.complete), (0, 3, True))
+        self.assertIsNone(get_checkpoint(self.model))
+
+    def test_command(self):
+        stdout = StringIO()
+        call_command("set_outstanding_file_acls", dry_run=True, stdout=stdout)
+        self.assertIn("4 CustomImage instances require ACL updates", stdout.getvalue())
+        self.assertEqual(len(self.get_outstanding_ids()), 4)
+
+        stdout = StringIO()
+        call_command("set_outstanding_file_acls", stdout=stdout)
+        self.assertIn("ACLs successfully set for 4 custom images", stdout.getvalue())
+        self.assertEqual(self.get_outstanding_ids(), set())
@@ -0,0 +1,116 @@
+from unittest import mock
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import InMemoryStorage
+from django.db.models.fields.files import FieldFile
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from storages.backends.s3 import S3Storage
+
+from ons_alpha.private_media.serving import RangeNotSatisfiable, get_byte_range, serve_private_file
+
+
+class ServePrivateFileTestCase(SimpleTestCase):
+    def setUp(self):
+        self.client = mock.Mock()
+        self.client.generate_presigned_url.return_value = "https://media.s3.amazonaws.com/images/1.png?signature"
+        connection_patcher = mock.patch.object(
+            S3Storage,
+            "connection",
+            new_callable=mock.PropertyMock,
+            return_value=mock.Mock(meta=mock.Mock(client=self.client)),
+        )
+        connection_patcher.start()
+        self.addCleanup(connection_patcher.stop)
+
+    def get_file(self, storage, name="images/1.png"):
+        return FieldFile(None, mock.Mock(storage=storage), name)
+
+    @override_settings(PRIVATE_MEDIA_SERVE_METHOD="redirect", PRIVATE_MEDIA_SIGNED_URL_EXPIRY=300)
+    def test_redirects_to_signed_url(self):
+        response = serve_private_file(self.get_file(S3Storage(bucket_name="media")))
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response["Location"], "https://media.s3.amazonaws.com/images/1.png?signature")
+        self.assertEqual(response["Cache-Control"], "private, max-age=150")
+        self.client.generate_presigned_url.assert_called_once_with(
+            "get_object",
+            Params={"Bucket": "media", "Key": "images/1.png", "ResponseContentType": "image/png"},
+            ExpiresIn=300,
+        )
+
+    @override_settings(PRIVATE_MEDIA_SERVE_METHOD="redirect")
+    def test_streams_files_that_cannot_be_signed(self):
+        storage = InMemoryStorage()
+        storage.save("images/1.png", ContentFile(b"image"))
+
+        response = serve_private_file(self.get_file(storage))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), b"image")
+        self.assertEqual(response["Content-Type"], "image/png")
+
+    @override_settings(
+        PRIVATE_MEDIA_SERVE_METHOD="x_accel_redirect", PRIVATE_MEDIA_X_ACCEL_REDIRECT_PREFIX="/private-media/"
+    )
+    def test_x_accel_redirect(self):
+        response = serve_private_file(self.get_file(S3Storage(bucket_name="media"), "images/a b.png"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["X-Accel-Redirect"], "/private-media/images/a%20b.png")
+        self.assertEqual(response["Content-Type"], "image/png")
+        self.assertEqual(response.content, b"")
+        self.client.generate_presigned_url.assert_not_called()
+
+
+class ByteRangeTestCase(SimpleTestCase):
+    def get_byte_range(self, header, size=10, **headers):
+        return get_byte_range(RequestFactory().get("/", headers={"range": header, **headers}), size, etag="abc")
+
+    def test_ranges(self):
+        self.assertEqual(self.get_byte_range("bytes=0-4"), (0, 4))
+        self.assertEqual(self.get_byte_range("bytes=5-"), (5, 9))
+        self.assertEqual(self.get_byte_range("bytes=-3"), (7, 9))
+        self.assertEqual(self.get_byte_range("bytes=-30"), (0, 9))
+        self.assertEqual(self.get_byte_range("bytes=8-100"), (8, 9))
+
+    def test_ignored_ranges(self):
+        self.assertIsNone(self.get_byte_range(""))
+        self.assertIsNone(self.get_byte_range("bytes=0-1,3-4"))
+        self.assertIsNone(self.get_byte_range("items=0-1"))
+        self.assertIsNone(self.get_byte_range("bytes=a-b"))
+        self.assertIsNone(self.get_byte_range("bytes=4-2"))
+        self.assertIsNone(self.get_byte_range("bytes=0-4", **{"if-range": '"other"'}))
+        self.assertEqual(self.get_byte_range("bytes=0-4", **{"if-range": '"abc"'}), (0, 4))
+
+    def test_unsatisfiable_ranges(self):
+        with self.assertRaises(RangeNotSatisfiable):
+            self.get_byte_range("bytes=10-")
+        with self.assertRaises(RangeNotSatisfiable):
+            self.get_byte_range("bytes=-0")
+
+    @override_settings(PRIVATE_MEDIA_SERVE_METHOD="stream")
+    def test_unsatisfiable_range_response(self):
+        storage = InMemoryStorage()
+        storage.save("documents/data.csv", ContentFile(b"0123456789"))
+        file = FieldFile(None, mock.Mock(storage=storage), "documents/data.csv")
+
+        response = serve_private_file(file, request=RequestFactory().get("/", headers={"range": "bytes=20-"}))
+
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response["Content-Range"], "bytes */10")
+
+
+class S3StreamingTestCase(ServePrivateFileTestCase):
+    @override_settings(PRIVATE_MEDIA_SERVE_METHOD="stream")
+    def test_streams_ranges_from_s3(self):
+        body = mock.Mock()
+        body.iter_chunks.return_value = iter([b"23", b"4"])
+        self.client.get_object.return_value = {"Body": body}
+        request = RequestFactory().get("/", headers={"range": "bytes=2-4"})
+
+        response = serve_private_file(self.get_file(S3Storage(bucket_name="media")), request=request, size=10)
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b"".join(response.streaming_content), b"234")
+        self.client.get_object.assert_called_once_with(Bucket="media", Key="images/1.png", Range="bytes=2-4")
+        body.close.assert_called_once()
@@ -1,18 +1,12 @@
-import concurrent.futures
-import logging
-
 from collections.abc import Iterable
 from functools import lru_cache
 from typing import NamedTuple
 
-from botocore.exceptions import ClientError
 from django.core.exceptions import ObjectDoesNotExist
 from django.db.models.fields.files import FieldFile
-from storages.backends.s3 import S3Storage
 from wagtail.models import Collection
 
-
-logger = logging.getLogger(__name__)
+from ons_alpha.private_media.acls import get_acl_engine
 
 
 class CollectionDetails(NamedTuple):
@@ -88,35 +82,13 @@ def set_file_acl(file: FieldFile, acl_name: str) -> bool:
     Any exceptions raised during the processed are captured and logged.
     Returns `True` if no errors occured, otherwise `False`.
     """
-    if not isinstance(file.storage, S3Storage):
-        # In environments that don't use S3, return True immediately,
-        # as no futher action is needed, and there's nothing to go wrong!
-        logger.info(f"ACL setting is unnecessary for {file.name}")
-        return True
-
-    obj = file.storage.bucket.Object(file.name)
-    try:
-        obj_acl = obj.Acl()
-    except ClientError as e:
-        logger.debug(f"Failed to retreive ACL for {file.name}: {e!r}")
-        return False
-    try:
-        obj_acl.put(ACL=acl_name)
-    except ClientError as e:
-        logger.debug(f"Failed to set ACL for {file.name}: {e!r}")
-        return False
-
-    logger.info(f"ACL set successfully for {file.name}")
-    return True
+    return get_acl_engine().set_file_acl(file, acl_name).success
 
 
 def set_file_acls(files: Iterable[FieldFile], acl_name: str) -> dict[FieldFile, bool]:
-    results: dict[FieldFile, bool] = {}
-
-    def set_file_acl_and_report(file: FieldFile) -> None:
-        results[file] = set_file_acl(file, acl_name)
-
-    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-        executor.map(set_file_acl_and_report, files)
-
-    return results
+    """
+    Set the ACL for all of the supplied `files` concurrently, using the shared
+    `AclEngine`. Returns a dict indicating whether each file was updated successfully.
+    Use `get_acl_engine().set_file_acls()` directly for more detailed results.
+    """
+    return {file: result.success for file, result in get_acl_engine().set_file_acls(files, acl_name).items()}
@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class ReleaseCalendarConfig(AppConfig):
     default_auto_field = "django.db.models.AutoField"
     name = "ons_alpha.release_calendar"
+
+    def ready(self):
+        from ons_alpha.release_calendar.signal_handlers import (  # pylint: disable=import-outside-toplevel
+            register_signal_handlers,
+        )
+
+        register_signal_handlers()
@@ -0,0 +1,79 @@
+from urllib.parse import parse_qsl
+
+from django import forms
+from django.http import QueryDict
+from django.utils.translation import gettext_lazy as _
+
+from ons_alpha.release_calendar.enums import ReleaseStatus
+from ons_alpha.taxonomy.models import Topic
+
+
+class ReleaseCalendarFilterForm(forms.Form):
+    status = forms.MultipleChoiceField(
+        label=_("Status"),
+        choices=ReleaseStatus.choices,
+        required=False,
+        widget=forms.CheckboxSelectMultiple,
+    )
+    date_from = forms.DateField(label=_("Released after"), required=False)
+    date_to = forms.DateField(label=_("Released before"), required=False)
+    topic = forms.ModelChoiceField(label=_("Topic"), queryset=Topic.objects.all(), required=False)
+
+    def __init__(self, data=None, *args, **kwargs):
+        if isinstance(data, QueryDict) and "status" in data:
+            # ignore unknown statuses, rather than the whole status filter
+            data = data.copy()
+            data.setlist("status", [status for status in data.getlist("status") if status in ReleaseStatus.values])
+        super().__init__(data, *args, **kwargs)
+
+    def clean(self):
+        cleaned_data = super().clean()
+        date_from = cleaned_data.get("date_from")
+        date_to = cleaned_data.get("date_to")
+        if date_from and date_to and date_from > date_to:
+            self.add_error("date_to", _("The end date must be after the start date"))
+        return cleaned_data
+
+    def get_filters(self) -> dict:
+        """
+        Returns the valid filters. Invalid values are ignored, rather than
+        showing an error, as the filters are given in the URL.
+        """
+        self.is_valid()
+        return {name: value for name, value in self.cleaned_data.items() if name not in self.errors and value}
+
+    def get_query_string(self, cursor: str | None = None) -> str:
+        """
+        Returns the canonical query string for the valid filters (and `cursor`), with
+        the parameters and values in a consistent order, so that equivalent requests
+        share the same URL (and so the same CDN cache entry).
+        """
+        query = QueryDict(mutable=True)
+        if cursor:
+            query["cursor"] = cursor
+        for name, value in sorted(self.get_filters().items()):
+            if name == "status":
+                query.setlist(name, sorted(value))
+            elif name == "topic":
+                query[name] = str(value.pk)
+            else:
+                query[name] = value.isoformat()
+        return query.urlencode()
+
+    def get_redirect_query_string(self, query_string: str) -> str | None:
+        """
+        Returns the query string to redirect to if the filters (and cursor) in
+        `query_string`, which the form was bound to, aren't in their canonical form,
+        keeping any other parameters (e.g. for analytics) as they are. Returns `None`
+        if they are.
+        """
+        recognised = {*self.fields, "cursor"}
+        query = QueryDict(mutable=True)
+        other = QueryDict(mutable=True)
+        for name, value in parse_qsl(query_string, keep_blank_values=True):
+            (query if name in recognised else other).appendlist(name, value)
+
+        canonical = self.get_query_string(cursor=query.get("cursor"))
+        if query.urlencode() == canonical:
+            return None
+        return "&".join(part for part in (canonical, other.urlencode()) if part)
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from ons_alpha.release_calendar.models import ReleaseIndex
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the precomputed release counts used for the release calendar facets."
+
+    def handle(self, *args, **options):
+        for index in ReleaseIndex.objects.all():
+            index.rebuild_release_calendar_buckets()
+            self.stdout.write(f"Rebuilt release calendar counts for {index}")
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.16 on 2026-10-18 01:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("release_calendar", "0003_alter_releasepage_status"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="releasepage",
+            name="stream_toc_items",
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+    ]
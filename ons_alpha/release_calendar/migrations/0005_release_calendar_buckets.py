@@ -0,0 +1,71 @@
+# Generated by Django 4.2.16 on 2026-10-18 01:11
+
+import django.db.models.deletion
+
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import TruncMonth
+
+
+def populate_release_calendar_buckets(apps, schema_editor):
+    ReleaseIndex = apps.get_model("release_calendar", "ReleaseIndex")
+    ReleasePage = apps.get_model("release_calendar", "ReleasePage")
+    ReleaseCalendarBucket = apps.get_model("release_calendar", "ReleaseCalendarBucket")
+
+    for index in ReleaseIndex.objects.all():
+        rows = (
+            ReleasePage.objects.filter(live=True, path__startswith=index.path, depth=index.depth + 1)
+            .annotate(month=TruncMonth("release_date", output_field=models.DateField()))
+            .order_by()
+            .values_list("status", "month")
+            .annotate(count=Count("pk"))
+        )
+        ReleaseCalendarBucket.objects.bulk_create(
+            [
+                ReleaseCalendarBucket(index=index, status=status, month=month, count=count)
+                for status, month, count in rows
+            ]
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("release_calendar", "0004_stream_toc_items"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReleaseCalendarBucket",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False)),
+                ("status", models.CharField(max_length=32)),
+                ("month", models.DateField()),
+                ("count", models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="releasepage",
+            index=models.Index(fields=["release_date"], name="release_date_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="releasepage",
+            index=models.Index(fields=["status", "release_date"], name="release_status_date_idx"),
+        ),
+        migrations.AddField(
+            model_name="releasecalendarbucket",
+            name="index",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="release_calendar_buckets",
+                to="release_calendar.releaseindex",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="releasecalendarbucket",
+            constraint=models.UniqueConstraint(
+                fields=("index", "month", "status"), name="unique_release_calendar_bucket"
+            ),
+        ),
+        migrations.RunPython(populate_release_calendar_buckets, migrations.RunPython.noop),
+    ]
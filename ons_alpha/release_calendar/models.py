@@ -1,25 +1,38 @@
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
-from django.core.paginator import Paginator
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Count
+from django.db.models.functions import TruncMonth
+from django.shortcuts import redirect
 from django.utils.functional import cached_property
+from django.utils.timezone import make_aware
 from django.utils.translation import gettext_lazy as _
 from modelcluster.fields import ParentalKey
-from wagtail.admin.panels import FieldPanel, FieldRowPanel, InlinePanel, MultiFieldPanel
+from wagtail.admin.panels import (
+    FieldPanel,
+    FieldRowPanel,
+    InlinePanel,
+    MultiFieldPanel,
+    MultipleChooserPanel,
+    ObjectList,
+    TabbedInterface,
+)
 from wagtail.fields import RichTextField, StreamField
 from wagtail.models import Orderable, Page
 
-from ons_alpha.core.models import BasePage
+from ons_alpha.core.cache import get_page_listing_count_cache_key
+from ons_alpha.core.models import BasePage, TableOfContentsMixin
 from ons_alpha.datasets.blocks import DatasetStoryBlock
 from ons_alpha.release_calendar.blocks import ReleaseStoryBlock
+from ons_alpha.release_calendar.enums import ReleaseStatus
+from ons_alpha.release_calendar.forms import ReleaseCalendarFilterForm
+from ons_alpha.taxonomy.forms import PageWithTopicsAdminForm
 from ons_alpha.utils.models import LinkFields
-
-
-class ReleaseStatus(models.TextChoices):
-    PROVISIONAL = "PROVISIONAL", _("Provisional")
-    CONFIRMED = "CONFIRMED", _("Confirmed")
-    CANCELLED = "CANCELLED", _("Cancelled")
-    PUBLISHED = "PUBLISHED", _("Published")
+from ons_alpha.utils.pagination import KeysetPaginator
 
 
 class ReleaseIndex(BasePage):
@@ -29,15 +42,130 @@ class ReleaseIndex(BasePage):
     subpage_types = ["ReleasePage"]
     max_count_per_parent = 1
 
+    def serve(self, request, *args, **kwargs):
+        form = ReleaseCalendarFilterForm(request.GET)
+        if not getattr(request, "is_preview", False):
+            # Redirect to the canonical URL for the filters, so that equivalent
+            # requests share the same URL, and so the same CDN cache entry. This
+            # isn't permanent, as what's valid (e.g. the topics) can change.
+            query_string = form.get_redirect_query_string(request.META.get("QUERY_STRING", ""))
+            if query_string is not None:
+                return redirect(self.get_url(request) + (f"?{query_string}" if query_string else ""))
+        return super().serve(request, *args, filter_form=form, **kwargs)
+
     def get_context(self, request, *args, **kwargs):
+        form = kwargs.pop("filter_form", None) or ReleaseCalendarFilterForm(request.GET)
         context = super().get_context(request, *args, **kwargs)
-        page = request.GET.get("page", 1)
-        context["releases"] = Paginator(
-            ReleasePage.objects.child_of(self).public().live(),
-            settings.DEFAULT_PER_PAGE,
-        ).get_page(page)
+
+        filters = form.get_filters()
+        status_counts, month_counts = self.get_release_counts(filters)
+        paginator = KeysetPaginator(self.get_releases(filters), settings.DEFAULT_PER_PAGE)
+        statuses = filters.get("status") or ReleaseStatus.values
+        paginator.count = sum(count for status, count in status_counts.items() if status in statuses)
+
+        context["filter_form"] = form
+        context["filters"] = filters
+        context["releases"] = paginator.get_page(request.GET.get("cursor"))
+        context["status_counts"] = status_counts
+        context["month_counts"] = month_counts
         return context
 
+    def get_releases(self, filters: dict):
+        releases = ReleasePage.objects.child_of(self).live().public()
+        if statuses := filters.get("status"):
+            releases = releases.filter(status__in=statuses)
+        # compare with datetimes rather than dates, so the release date index can be used
+        if date_from := filters.get("date_from"):
+            releases = releases.filter(release_date__gte=make_aware(datetime.combine(date_from, time.min)))
+        if date_to := filters.get("date_to"):
+            releases = releases.filter(
+                release_date__lt=make_aware(datetime.combine(date_to + timedelta(days=1), time.min))
+            )
+        if topic := filters.get("topic"):
+            releases = releases.filter(topics__topic=topic)
+        return releases
+
+    def get_release_counts(self, filters: dict) -> tuple[dict[str, int], dict[date, int]]:
+        """
+        Returns the facet counts for `filters`: the number of releases per status (for
+        any status), and per month (for the chosen statuses).
+
+        The counts come from the precomputed `ReleaseCalendarBucket`s where possible,
+        i.e. if there's no topic filter, and the dates are whole months.
+        """
+        statuses = filters.get("status")
+        date_from = filters.get("date_from")
+        date_to = filters.get("date_to")
+        if "topic" not in filters and is_month_range(date_from, date_to):
+            buckets = self.release_calendar_buckets.all()
+            if date_from:
+                buckets = buckets.filter(month__gte=date_from)
+            if date_to:
+                buckets = buckets.filter(month__lte=date_to)
+            return aggregate_release_counts(buckets.values_list("status", "month", "count"), statuses)
+
+        # the counts are for all statuses, so the status filter isn't part of the key
+        key_filters = ",".join(
+            f"{name}={getattr(value, 'pk', value)}" for name, value in sorted(filters.items()) if name != "status"
+        )
+        cache_key = get_page_listing_count_cache_key(f"release_index:{self.pk}:{key_filters}")
+        if (rows := cache.get(cache_key)) is None:
+            rows = list(count_releases_by_month(self.get_releases({**filters, "status": None})))
+            cache.set(cache_key, rows, 300)
+        return aggregate_release_counts(rows, statuses)
+
+    def rebuild_release_calendar_buckets(self) -> None:
+        buckets = [
+            ReleaseCalendarBucket(index=self, status=status, month=month, count=count)
+            for status, month, count in count_releases_by_month(self.get_releases({}))
+        ]
+        with transaction.atomic():
+            self.release_calendar_buckets.all().delete()
+            ReleaseCalendarBucket.objects.bulk_create(buckets)
+
+
+def count_releases_by_month(releases):
+    return (
+        releases.annotate(month=TruncMonth("release_date", output_field=models.DateField()))
+        .order_by()
+        .values_list("status", "month")
+        .annotate(count=Count("pk"))
+    )
+
+
+def aggregate_release_counts(rows, statuses=None) -> tuple[dict[str, int], dict[date, int]]:
+    status_counts = dict.fromkeys(ReleaseStatus.values, 0)
+    month_counts = defaultdict(int)
+    for status, month, count in rows:
+        status_counts[status] += count
+        if not statuses or status in statuses:
+            month_counts[month] += count
+    return status_counts, dict(sorted(month_counts.items(), reverse=True))
+
+
+def is_month_range(date_from: date | None, date_to: date | None) -> bool:
+    return (date_from is None or date_from.day == 1) and (date_to is None or (date_to + timedelta(days=1)).day == 1)
+
+
+class ReleaseCalendarBucket(models.Model):
+    """
+    The number of live releases per status and month in a release calendar, kept up to
+    date when releases are published or unpublished, and used for the facet counts.
+    """
+
+    index = models.ForeignKey(ReleaseIndex, on_delete=models.CASCADE, related_name="release_calendar_buckets")
+    status = models.CharField(choices=ReleaseStatus.choices, max_length=32)
+    month = models.DateField()
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["index", "month", "status"], name="unique_release_calendar_bucket"),
+        ]
+
+    def __str__(self):
+        return f"{self.month:%B %Y} {self.status}: {self.count}"
+
 
 class ReleasePageRelatedLink(Orderable, LinkFields):
     """
@@ -47,11 +175,13 @@ class ReleasePageRelatedLink(Orderable, LinkFields):
     parent = ParentalKey("ReleasePage", related_name="related_links", on_delete=models.CASCADE)
 
 
-class ReleasePage(BasePage):
+class ReleasePage(TableOfContentsMixin, BasePage):
+    base_form_class = PageWithTopicsAdminForm
     template = "templates/pages/release_page.html"
 
     parent_page_types = ["ReleaseIndex"]
     subpage_types = []
+    toc_stream_field_name = "content"
 
     status = models.CharField(choices=ReleaseStatus.choices, default=ReleaseStatus.PROVISIONAL, max_length=32)
     summary = RichTextField(features=settings.RICH_TEXT_BASIC)
@@ -86,6 +216,13 @@ class ReleasePage(BasePage):
         ),
     )
 
+    class Meta:
+        indexes = [
+            # for the release calendar filters and ordering
+            models.Index(fields=["release_date"], name="release_date_idx"),
+            models.Index(fields=["status", "release_date"], name="release_status_date_idx"),
+        ]
+
     content_panels = Page.content_panels + [
         MultiFieldPanel(
             [
@@ -110,6 +247,21 @@ class ReleasePage(BasePage):
         InlinePanel("related_links", heading="Related links"),
     ]
 
+    edit_handler = TabbedInterface(
+        [
+            ObjectList(content_panels, heading="Content"),
+            ObjectList(
+                [
+                    MultipleChooserPanel("topics", label="Topic", chooser_field_name="topic"),
+                ],
+                help_text="Select the topics that this release relates to, for the release calendar's topic filter.",
+                heading="Taxonomy",
+            ),
+            ObjectList(BasePage.promote_panels, heading="Promote"),
+            ObjectList(BasePage.settings_panels, heading="Settings", classname="settings"),
+        ]
+    )
+
     def clean(self):
         super().clean()
         if self.status == ReleaseStatus.CANCELLED and not self.notice:
@@ -149,8 +301,7 @@ class ReleasePage(BasePage):
         items = [{"url": "#summary", "text": _("Summary")}]
 
         if self.status == ReleaseStatus.PUBLISHED:
-            for block in self.content:  # pylint: disable=not-an-iterable
-                items += block.block.to_table_of_contents_items(block.value)
+            items += self.get_stream_toc_items()
 
             if self.datasets:
                 items += [{"url": "#datasets", "text": _("Data")}]
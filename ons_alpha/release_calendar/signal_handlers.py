@@ -0,0 +1,43 @@
+from django.db import transaction
+from django.db.models.signals import post_delete
+from wagtail.signals import page_published, page_unpublished, post_page_move
+
+from ons_alpha.release_calendar.models import ReleaseIndex, ReleasePage
+from ons_alpha.utils.side_effects import defer_or_run
+
+
+def rebuild_release_calendar_buckets(index_paths) -> None:
+    for index in ReleaseIndex.objects.filter(path__in=set(index_paths)):
+        index.rebuild_release_calendar_buckets()
+
+
+def update_release_calendar(index_path: str) -> None:
+    # coalesced when many releases are published together, e.g. in a bundle
+    defer_or_run(rebuild_release_calendar_buckets, index_path, key=index_path)
+
+
+def update_release_calendar_on_status_change(instance, **kwargs):  # pylint: disable=unused-argument
+    update_release_calendar(instance.path[: -instance.steplen])
+
+
+def update_release_calendar_on_move(
+    instance, parent_page_before, parent_page_after, **kwargs
+):  # pylint: disable=unused-argument
+    update_release_calendar(parent_page_before.path)
+    update_release_calendar(parent_page_after.path)
+
+
+def update_release_calendar_on_delete(instance, **kwargs):  # pylint: disable=unused-argument
+    index_path = instance.path[: -instance.steplen]
+    transaction.on_commit(lambda: rebuild_release_calendar_buckets([index_path]))
+
+
+def register_signal_handlers():
+    page_published.connect(
+        update_release_calendar_on_status_change, sender=ReleasePage, dispatch_uid="release_calendar_publish"
+    )
+    page_unpublished.connect(
+        update_release_calendar_on_status_change, sender=ReleasePage, dispatch_uid="release_calendar_unpublish"
+    )
+    post_page_move.connect(update_release_calendar_on_move, sender=ReleasePage, dispatch_uid="release_calendar_move")
+    post_delete.connect(update_release_calendar_on_delete, sender=ReleasePage, dispatch_uid="release_calendar_delete")
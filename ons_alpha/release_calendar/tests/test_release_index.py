@@ -0,0 +1,118 @@
+from datetime import date, datetime
+
+from django.http import QueryDict
+from django.test import RequestFactory, TestCase
+from django.utils.timezone import make_aware
+from wagtail.models import Site
+
+from ons_alpha.release_calendar.enums import ReleaseStatus
+from ons_alpha.release_calendar.forms import ReleaseCalendarFilterForm
+from ons_alpha.release_calendar.models import (
+    ReleaseCalendarBucket,
+    ReleaseIndex,
+    ReleasePage,
+    aggregate_release_counts,
+    count_releases_by_month,
+)
+from ons_alpha.taxonomy.forms import PageWithTopicsAdminForm
+from ons_alpha.taxonomy.models import PageTopicRelationship, Topic
+
+
+class ReleaseIndexTestCase(TestCase):
+    def setUp(self):
+        self.index = Site.objects.get(is_default_site=True).root_page.add_child(instance=ReleaseIndex(title="Releases"))
+        self.january = self.add_release("January", ReleaseStatus.PUBLISHED, datetime(2024, 1, 10, 9, 30))
+        self.february = self.add_release("February", ReleaseStatus.CONFIRMED, datetime(2024, 2, 1, 9, 30))
+        self.late_february = self.add_release("Late February", ReleaseStatus.PROVISIONAL, datetime(2024, 2, 29, 23, 30))
+        self.topic = Topic.add_root(name="Economy")
+        PageTopicRelationship.objects.create(page=self.february, topic=self.topic)
+
+    def add_release(self, title, status, release_date):
+        release = self.index.add_child(
+            instance=ReleasePage(
+                title=title, status=status, release_date=make_aware(release_date), summary="<p>Summary</p>", live=False
+            )
+        )
+        release.save_revision().publish()
+        return release
+
+    def get_buckets(self):
+        return set(ReleaseCalendarBucket.objects.values_list("status", "month", "count"))
+
+    def test_buckets_are_updated_on_publish_and_unpublish(self):
+        self.assertEqual(
+            self.get_buckets(),
+            {
+                (ReleaseStatus.PUBLISHED, date(2024, 1, 1), 1),
+                (ReleaseStatus.CONFIRMED, date(2024, 2, 1), 1),
+                (ReleaseStatus.PROVISIONAL, date(2024, 2, 1), 1),
+            },
+        )
+
+        self.february.refresh_from_db()
+        self.february.unpublish()
+
+        self.assertNotIn(ReleaseStatus.CONFIRMED, {status for status, _, _ in self.get_buckets()})
+
+    def test_filters(self):
+        def titles(**filters):
+            return sorted(release.title for release in self.index.get_releases(filters))
+
+        self.assertEqual(titles(status=[ReleaseStatus.CONFIRMED, ReleaseStatus.PUBLISHED]), ["February", "January"])
+        # the end date includes the whole day
+        self.assertEqual(titles(date_from=date(2024, 2, 1), date_to=date(2024, 2, 29)), ["February", "Late February"])
+        self.assertEqual(titles(topic=self.topic), ["February"])
+
+    def test_editors_can_choose_topics(self):
+        form_class = ReleasePage.get_edit_handler().get_form_class()
+
+        self.assertTrue(issubclass(form_class, PageWithTopicsAdminForm))
+        self.assertIn("topics", form_class.formsets)
+
+    def test_counts_from_buckets_match_the_releases(self):
+        filters = {"status": [ReleaseStatus.PROVISIONAL], "date_from": date(2024, 2, 1), "date_to": date(2024, 2, 29)}
+
+        # served from the buckets: the facets table only
+        with self.assertNumQueries(1):
+            status_counts, month_counts = self.index.get_release_counts(filters)
+
+        expected = aggregate_release_counts(
+            count_releases_by_month(self.index.get_releases({**filters, "status": None})), filters["status"]
+        )
+        self.assertEqual((status_counts, month_counts), expected)
+        self.assertEqual(status_counts[ReleaseStatus.CONFIRMED], 1)
+        self.assertEqual(month_counts, {date(2024, 2, 1): 1})
+
+    def test_counts_with_topic(self):
+        status_counts, month_counts = self.index.get_release_counts({"topic": self.topic})
+
+        self.assertEqual(status_counts[ReleaseStatus.CONFIRMED], 1)
+        self.assertEqual(sum(status_counts.values()), 1)
+        self.assertEqual(month_counts, {date(2024, 2, 1): 1})
+
+    def test_redirects_to_canonical_query_string(self):
+        request = RequestFactory().get(
+            "/releases/", {"topic": "", "status": ["PUBLISHED", "CONFIRMED", "nope"], "date_from": "2024-01-01"}
+        )
+
+        response = self.index.serve(request)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(response.url.endswith("?date_from=2024-01-01&status=CONFIRMED&status=PUBLISHED"), response.url)
+
+    def test_redirects_keep_other_parameters(self):
+        request = RequestFactory().get("/releases/", {"status": ["PUBLISHED", "CONFIRMED"], "utm_source": "email"})
+
+        response = self.index.serve(request)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(response.url.endswith("?status=CONFIRMED&status=PUBLISHED&utm_source=email"), response.url)
+
+    def test_canonical_query_strings_are_not_redirected(self):
+        def get_redirect_query_string(query_string):
+            return ReleaseCalendarFilterForm(QueryDict(query_string)).get_redirect_query_string(query_string)
+
+        for query_string in ["", "status=CONFIRMED&status=PUBLISHED", "utm_source=email&date_from=2024-01-01"]:
+            with self.subTest(query_string=query_string):
+                self.assertIsNone(get_redirect_query_string(query_string))
+        self.assertEqual(get_redirect_query_string("topic=&utm_source=email"), "utm_source=email")
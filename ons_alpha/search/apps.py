@@ -0,0 +1,13 @@
+from django.apps import AppConfig
+
+
+class SearchConfig(AppConfig):
+    default_auto_field = "django.db.models.AutoField"
+    name = "ons_alpha.search"
+
+    def ready(self):
+        from ons_alpha.search.signal_handlers import (  # pylint: disable=import-outside-toplevel
+            register_signal_handlers,
+        )
+
+        register_signal_handlers()
@@ -0,0 +1,246 @@
+import logging
+import threading
+
+from bisect import bisect_left, insort
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass
+
+from django.core.cache import cache
+from django.db import connections
+from django.urls import reverse
+from django.utils.http import urlencode
+
+from ons_alpha.search.cache import normalize_search_query
+from ons_alpha.search.models import SearchDocument
+from ons_alpha.taxonomy.models import Topic
+from ons_alpha.utils.cache import bump_cache_generation, get_cache_generation
+
+
+logger = logging.getLogger(__name__)
+
+AUTOCOMPLETE_CACHE_GENERATION = "autocomplete"
+
+
+@dataclass(frozen=True, slots=True)
+class Suggestion:
+    title: str
+    url: str
+    kind: str
+
+
+class PrefixIndex:
+    """
+    An in-memory index of suggestions, which can be searched by the prefix of any
+    word in their title, e.g. "pri" matches "Consumer price inflation".
+
+    Every word-suffix of each title ("consumer price inflation", "price inflation"
+    and "inflation") is kept in a sorted list, so the suggestions for a prefix are
+    found with a binary search, followed by a scan of the matching keys.
+    """
+
+    def __init__(self, suggestions: Iterable[tuple[Hashable, Suggestion]] = ()):
+        self._suggestions: dict[Hashable, Suggestion] = {}
+        self._keys: list[tuple[str, Hashable]] = []
+        self._lock = threading.Lock()
+        for key, suggestion in suggestions:
+            self._suggestions[key] = suggestion
+            self._keys.extend(self._get_keys(key, suggestion))
+        self._keys.sort(key=lambda item: item[0])
+
+    def __len__(self):
+        return len(self._suggestions)
+
+    @staticmethod
+    def _get_keys(key: Hashable, suggestion: Suggestion) -> list[tuple[str, Hashable]]:
+        words = normalize_search_query(suggestion.title).split()
+        return [(" ".join(words[i:]), key) for i in range(len(words))]
+
+    def add(self, key: Hashable, suggestion: Suggestion) -> None:
+        with self._lock:
+            self._remove(key)
+            self._suggestions[key] = suggestion
+            for item in self._get_keys(key, suggestion):
+                insort(self._keys, item, key=lambda item: item[0])
+
+    def remove(self, key: Hashable) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def _remove(self, key: Hashable) -> None:
+        if (suggestion := self._suggestions.pop(key, None)) is None:
+            return
+        for text, _ in self._get_keys(key, suggestion):
+            i = bisect_left(self._keys, text, key=lambda item: item[0])
+            while i < len(self._keys) and self._keys[i][0] == text:
+                if self._keys[i][1] == key:
+                    del self._keys[i]
+                    break
+                i += 1
+
+    def search(self, query: str, limit: int = 10) -> list[Suggestion]:
+        """
+        Returns up to `limit` suggestions matching `query`, preferring those whose
+        title starts with it, then the shortest.
+        """
+        query = normalize_search_query(query)
+        if not query:
+            return []
+
+        keys = self._keys
+        matches = {}
+        # look at a few more matches than needed, so the best can be picked
+        i = bisect_left(keys, query, key=lambda item: item[0])
+        while i < len(keys) and len(matches) < limit * 5 and keys[i][0].startswith(query):
+            if (suggestion := self._suggestions.get(keys[i][1])) is not None:
+                matches[keys[i][1]] = suggestion
+            i += 1
+
+        return sorted(
+            matches.values(),
+            key=lambda suggestion: (
+                not normalize_search_query(suggestion.title).startswith(query),
+                len(suggestion.title),
+                suggestion.title,
+            ),
+        )[:limit]
+
+
+def get_page_suggestion(document: SearchDocument) -> Suggestion:
+    return Suggestion(title=document.title, url=document.url, kind="page")
+
+
+def get_topic_suggestion(topic: Topic) -> Suggestion:
+    return Suggestion(title=topic.name, url=f"{reverse('search')}?{urlencode({'query': topic.name})}", kind="topic")
+
+
+def build_prefix_index() -> PrefixIndex:
+    """
+    Build the index from the live pages' search documents and the topics.
+    """
+    suggestions = [
+        (("page", document.page_id), get_page_suggestion(document))
+        for document in SearchDocument.objects.exclude(url="").only("page_id", "title", "url")
+    ]
+    suggestions += [(("topic", topic.pk), get_topic_suggestion(topic)) for topic in Topic.objects.only("name")]
+    return PrefixIndex(suggestions)
+
+
+# Each process has its own copy of the index. Changes are published to other processes
+# through the shared cache, as a numbered log of the keys added and removed, which each
+# process applies to its index. A process only rebuilds its index (in a background
+# thread, while carrying on with the old one) if it falls too far behind.
+_prefix_index: PrefixIndex | None = None
+_prefix_index_version: int | None = None
+_rebuilding = False
+_lock = threading.Lock()
+
+# How long published changes are kept, for processes to catch up with
+CHANGES_CACHE_TIMEOUT = 60 * 60
+# Processes that are further behind than this rebuild their index instead
+MAX_CHANGES_TO_APPLY = 1000
+
+
+def get_changes_cache_key(version: int) -> str:
+    return f"autocomplete:changes:{version}"
+
+
+def get_prefix_index() -> PrefixIndex | None:
+    """
+    Returns this process's index, with any changes published by other processes
+    applied, or `None` if it hasn't been built yet. The index is never built here,
+    but in a background thread, so requests don't have to wait for it.
+    """
+    version = get_cache_generation(AUTOCOMPLETE_CACHE_GENERATION)
+    if (
+        _prefix_index is None
+        or version < _prefix_index_version
+        or version - _prefix_index_version > MAX_CHANGES_TO_APPLY
+        or not apply_published_changes(version)
+    ):
+        # e.g. the cache has been cleared, or the process has been idle
+        start_rebuild()
+    return _prefix_index
+
+
+def apply_published_changes(version: int) -> bool:
+    """
+    Apply the changes published since this process's index was built or last updated,
+    up to `version`. Returns `False` if any of them are no longer available.
+    """
+    global _prefix_index_version  # pylint: disable=global-statement
+
+    with _lock:
+        if _prefix_index is None:
+            return False
+        if version <= _prefix_index_version:
+            return True
+        keys = [get_changes_cache_key(v) for v in range(_prefix_index_version + 1, version + 1)]
+        changes = cache.get_many(keys)
+        if keys[-1] not in changes:
+            # the latest changes are still being published (the version is bumped first),
+            # so catch up with them next time
+            keys.pop()
+            version -= 1
+        if len(changes) < len(keys):
+            return False
+        for key in keys:
+            added, removed = changes[key]
+            for suggestion_key in removed:
+                _prefix_index.remove(suggestion_key)
+            for suggestion_key, suggestion in added.items():
+                _prefix_index.add(suggestion_key, suggestion)
+        _prefix_index_version = version
+    return True
+
+
+def rebuild_prefix_index() -> None:
+    global _prefix_index, _prefix_index_version  # pylint: disable=global-statement
+
+    # read before building, so no changes made during the build are missed
+    # (changes that are already included are applied again, which is harmless)
+    version = get_cache_generation(AUTOCOMPLETE_CACHE_GENERATION)
+    index = build_prefix_index()
+    with _lock:
+        _prefix_index, _prefix_index_version = index, version
+
+
+def start_rebuild() -> None:
+    global _rebuilding  # pylint: disable=global-statement
+
+    with _lock:
+        if _rebuilding:
+            return
+        _rebuilding = True
+
+    def rebuild():
+        global _rebuilding  # pylint: disable=global-statement
+        try:
+            rebuild_prefix_index()
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Failed to build the search autocomplete index")
+        finally:
+            with _lock:
+                _rebuilding = False
+
+    run_in_background(rebuild)
+
+
+def run_in_background(func: Callable[[], None]) -> None:
+    def run():
+        try:
+            func()
+        finally:
+            # the thread has its own database connection
+            connections.close_all()
+
+    threading.Thread(target=run, name="autocomplete-index", daemon=True).start()
+
+
+def update_prefix_index(added: dict[Hashable, Suggestion], removed: Iterable[Hashable] = ()) -> None:
+    """
+    Publish changes to the index for all processes, and apply them to this process's
+    index (if it has one) straight away.
+    """
+    version = bump_cache_generation(AUTOCOMPLETE_CACHE_GENERATION)
+    cache.set(get_changes_cache_key(version), (added, list(removed)), CHANGES_CACHE_TIMEOUT)
+    apply_published_changes(version)
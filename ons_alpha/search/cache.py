@@ -0,0 +1,30 @@
+import hashlib
+
+from django.utils.translation import get_language
+
+from ons_alpha.utils.cache import bump_cache_generation, get_cache_generation
+
+
+SEARCH_RESULTS_CACHE_GENERATION = "search_results"
+
+
+def normalize_search_query(search_query: str) -> str:
+    """
+    Normalise case and whitespace, which don't affect the results, so that equivalent
+    queries share cache entries.
+    """
+    return " ".join(search_query.lower().split())
+
+
+def get_search_results_cache_key(search_query: str, name: str) -> str:
+    """
+    Returns the cache key for `name` (e.g. a page of results, or the count) for
+    `search_query`, which changes whenever the search documents change.
+    """
+    query_hash = hashlib.sha1(normalize_search_query(search_query).encode(), usedforsecurity=False).hexdigest()
+    generation = get_cache_generation(SEARCH_RESULTS_CACHE_GENERATION)
+    return f"search:{generation}:{get_language()}:{query_hash}:{name}"
+
+
+def invalidate_search_results_cache() -> None:
+    bump_cache_generation(SEARCH_RESULTS_CACHE_GENERATION)
@@ -0,0 +1,113 @@
+import random
+import time
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand
+from django.core.paginator import Paginator
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from wagtail.models import Page, Site
+from wagtail.search.backends import get_search_backend
+
+from ons_alpha.search.models import SearchDocument
+from ons_alpha.utils.pagination import OffsetPaginator
+
+
+WORDS = (
+    "labour market employment inflation prices population census migration trade economy output "
+    "wages housing health wellbeing crime energy retail productivity earnings regional annual quarterly"
+).split()
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares searching pages with searching search documents, against a synthetic corpus. "
+        "The corpus is created in a transaction which is rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--size", type=int, default=100_000, help="Number of synthetic pages.")
+        parser.add_argument("--queries", nargs="+", default=["labour market", "inflation", "housing prices"])
+        parser.add_argument("--pages", type=int, default=3, help="Number of result pages to fetch per query.")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self.create_corpus(options["size"])
+            self.stdout.write(f"{'query':>20} {'page':>5} {'pages':>16} {'documents':>16}")
+            for query in options["queries"]:
+                for number in range(1, options["pages"] + 1):
+                    page_time, page_queries = self.time(self.search_pages, query, number)
+                    document_time, document_queries = self.time(self.search_documents, query, number)
+                    self.stdout.write(
+                        f"{query:>20} {number:>5} "
+                        f"{page_time * 1000:>8.1f}ms {page_queries:>3}q "
+                        f"{document_time * 1000:>8.1f}ms {document_queries:>3}q"
+                    )
+            transaction.set_rollback(True)
+
+    def create_corpus(self, size: int) -> None:
+        self.stdout.write(f"Creating {size} pages...")
+        rng = random.Random(0)  # noqa: S311
+        parent = Site.objects.get(is_default_site=True).root_page
+        start = parent.numchild + 1
+        # plain pages, as multi-table pages can't be bulk created. Loading a specific page
+        # of another type costs a query per result, so the page search timings are optimistic.
+        content_type = ContentType.objects.get_for_model(Page)
+
+        pages = []
+        for i in range(size):
+            title = " ".join(rng.sample(WORDS, 4)).capitalize()
+            pages.append(
+                Page(
+                    title=title,
+                    draft_title=title,
+                    slug=f"benchmark-{i}",
+                    path=Page._get_path(parent.path, parent.depth + 1, start + i),  # pylint: disable=protected-access
+                    depth=parent.depth + 1,
+                    url_path=f"{parent.url_path}benchmark-{i}/",
+                    # not indexed for plain pages, so keep it out of the vocabulary to match the same results
+                    search_description=f"Summary of synthetic page {i}",
+                    locale_id=parent.locale_id,
+                    content_type=content_type,
+                )
+            )
+        Page.objects.bulk_create(pages, batch_size=1000)
+        Page.objects.filter(pk=parent.pk).update(numchild=parent.numchild + size)
+
+        pages = Page.objects.filter(path__startswith=parent.path, slug__startswith="benchmark-")
+        SearchDocument.objects.bulk_create(
+            [
+                SearchDocument(
+                    page_id=page.pk,
+                    title=page.title,
+                    summary=page.search_description,
+                    page_type="Page",
+                    url=f"/{page.slug}/",
+                )
+                for page in pages
+            ],
+            batch_size=1000,
+        )
+
+        self.stdout.write("Indexing...")
+        backend = get_search_backend()
+        backend.add_bulk(Page, pages)
+        backend.add_bulk(SearchDocument, SearchDocument.objects.filter(page__in=pages))
+
+    def time(self, func, *args) -> tuple[float, int]:
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            func(*args)
+            return time.perf_counter() - start, len(queries)
+
+    def search_pages(self, query: str, number: int) -> list[str]:
+        # the previous implementation: search and count pages, then load each specific page
+        results = Page.objects.live().search(query, operator="and")
+        paginator_page = Paginator(results, settings.DEFAULT_PER_PAGE).get_page(number)
+        return [page.specific.get_url() for page in paginator_page]
+
+    def search_documents(self, query: str, number: int) -> list[str]:
+        results = SearchDocument.objects.search(query, operator="and")
+        paginator_page = OffsetPaginator(results, settings.DEFAULT_PER_PAGE).page(number)
+        return [document.url for document in paginator_page]
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+from wagtail.models import Page
+
+from ons_alpha.search.models import SearchDocument
+from ons_alpha.search.signal_handlers import update_search_documents
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the search documents used for the site search, e.g. after deploying a change to them."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        # documents for pages that are no longer live are removed with their chunk
+        page_ids = sorted(
+            {*Page.objects.live().exclude(depth=1).values_list("pk", flat=True)}
+            | {*SearchDocument.objects.values_list("page_id", flat=True)}
+        )
+        for start in range(0, len(page_ids), chunk_size):
+            update_search_documents(page_ids[start : start + chunk_size])
+
+        self.stdout.write(f"Rebuilt {SearchDocument.objects.count()} search documents")
@@ -0,0 +1,40 @@
+# Generated by Django 4.2.16 on 2026-10-18 01:20
+
+import django.db.models.deletion
+import wagtail.search.index
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("wagtailcore", "0094_alter_page_locale"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchDocument",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False)),
+                ("title", models.CharField(max_length=255)),
+                ("summary", models.TextField(blank=True)),
+                ("content", models.TextField(blank=True)),
+                ("release_date", models.DateField(blank=True, null=True)),
+                ("page_type", models.CharField(max_length=255)),
+                ("topic_ids", models.JSONField(blank=True, default=list)),
+                ("url", models.CharField(blank=True, max_length=2048)),
+                (
+                    "page",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="search_document",
+                        to="wagtailcore.page",
+                    ),
+                ),
+            ],
+            bases=(wagtail.search.index.Indexed, models.Model),
+        ),
+    ]
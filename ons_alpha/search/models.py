@@ -0,0 +1,109 @@
+from datetime import datetime
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.utils.timezone import localtime
+from wagtail.models import Page
+from wagtail.rich_text import get_text_for_indexing
+from wagtail.search import index
+from wagtail.search.queryset import SearchableQuerySetMixin
+
+
+class SearchDocumentQuerySet(SearchableQuerySetMixin, models.QuerySet):
+    pass
+
+
+class SearchDocument(index.Indexed, models.Model):
+    """
+    A compact, denormalised copy of a live page, with everything needed to show it
+    in the site search results. Searching these, rather than pages, means results
+    can be shown without loading each specific page. Kept up to date when pages are
+    published, unpublished or moved, and rebuilt by the `rebuild_search_documents`
+    management command.
+    """
+
+    page = models.OneToOneField(Page, on_delete=models.CASCADE, related_name="search_document")
+    title = models.CharField(max_length=255)
+    summary = models.TextField(blank=True)
+    content = models.TextField(blank=True)
+    release_date = models.DateField(null=True, blank=True)
+    page_type = models.CharField(max_length=255)
+    topic_ids = models.JSONField(default=list, blank=True)
+    url = models.CharField(max_length=2048, blank=True)
+
+    objects = SearchDocumentQuerySet.as_manager()
+
+    search_fields = [
+        index.SearchField("title", boost=2),
+        index.AutocompleteField("title"),
+        index.SearchField("summary"),
+        index.SearchField("content"),
+        index.FilterField("page_type"),
+        index.FilterField("release_date"),
+    ]
+
+    def __str__(self):
+        return self.title
+
+    @classmethod
+    def from_page(cls, page: Page) -> "SearchDocument":
+        page = page.specific_deferred
+        return cls(
+            page_id=page.pk,
+            title=getattr(page, "listing_title", "") or page.title,
+            summary=get_page_summary(page),
+            content=get_page_content(page),
+            release_date=get_page_release_date(page),
+            page_type=str(getattr(page, "document_type", "") or page.specific_class._meta.verbose_name),
+            topic_ids=get_page_topic_ids(page),
+            url=page.get_url() or "",
+        )
+
+
+def get_page_summary(page: Page) -> str:
+    summary = getattr(page, "listing_summary", "") or page.search_description or getattr(page, "summary", "")
+    return get_text_for_indexing(summary or "")
+
+
+def get_page_content(page: Page) -> str:
+    """
+    Returns the text of the page's other indexed fields, e.g. its StreamField content.
+    """
+    content = []
+    for field in page.get_search_fields():
+        if isinstance(field, index.SearchField) and field.field_name not in ("title", "summary"):
+            content.extend(get_search_field_content(page, field))
+    return "\n".join(text for text in content if text)
+
+
+def get_search_field_content(page: Page, field: index.SearchField) -> list[str]:
+    try:
+        model_field = field.get_field(type(page))
+    except FieldDoesNotExist:
+        model_field = None
+    if hasattr(model_field, "get_searchable_content"):
+        # e.g. StreamFields, whose text is extracted the way Wagtail indexes it, without
+        # rendering their templates
+        return model_field.get_searchable_content(model_field.value_from_object(page))
+
+    try:
+        value = field.get_value(page)
+    except AttributeError:
+        return []
+    values = value if isinstance(value, list | tuple) else [value]
+    return [get_text_for_indexing(str(item)) for item in values if item]
+
+
+def get_page_release_date(page: Page):
+    release_date = getattr(page, "release_date", None)
+    if isinstance(release_date, datetime):
+        return localtime(release_date).date()
+    return release_date
+
+
+def get_page_topic_ids(page: Page) -> list[int]:
+    topic_ids = [relationship.topic_id for relationship in page.topics.all()]
+    if (topic_id := getattr(page, "topic_id", None)) and topic_id not in topic_ids:
+        # topic pages have a single topic of their own
+        topic_ids.append(topic_id)
+    return topic_ids
@@ -0,0 +1,81 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from wagtail.models import Page
+from wagtail.search import index
+from wagtail.signals import page_published, page_slug_changed, page_unpublished, post_page_move
+
+from ons_alpha.search.autocomplete import get_page_suggestion, get_topic_suggestion, update_prefix_index
+from ons_alpha.search.cache import invalidate_search_results_cache
+from ons_alpha.search.models import SearchDocument
+from ons_alpha.taxonomy.models import Topic
+from ons_alpha.utils.side_effects import defer_or_run, get_active_collector
+
+
+DOCUMENT_FIELDS = ["title", "summary", "content", "release_date", "page_type", "topic_ids", "url"]
+
+
+def update_search_documents(page_ids) -> None:
+    """
+    Rebuild the search documents for `page_ids`, removing those for pages which
+    are no longer live.
+    """
+    page_ids = set(page_ids)
+    documents = [
+        SearchDocument.from_page(page)
+        for page in Page.objects.live().filter(pk__in=page_ids).specific().prefetch_related("topics")
+    ]
+    live_page_ids = {document.page_id for document in documents}
+
+    with transaction.atomic():
+        stale = list(SearchDocument.objects.filter(page_id__in=page_ids - live_page_ids))
+        SearchDocument.objects.filter(pk__in=[document.pk for document in stale]).delete()
+        SearchDocument.objects.bulk_create(
+            documents, update_conflicts=True, unique_fields=["page"], update_fields=DOCUMENT_FIELDS, batch_size=500
+        )
+
+    # bulk operations don't trigger search index updates, so handle them here
+    for document in SearchDocument.objects.filter(page_id__in=live_page_ids):
+        index.insert_or_update_object(document)
+    for document in stale:
+        index.remove_object(document)
+
+    transaction.on_commit(invalidate_search_results_cache)
+    transaction.on_commit(
+        lambda: update_prefix_index(
+            added={("page", document.page_id): get_page_suggestion(document) for document in documents if document.url},
+            removed=[("page", page_id) for page_id in page_ids],
+        )
+    )
+
+
+def update_search_document(instance, **kwargs):  # pylint: disable=unused-argument
+    # coalesced when many pages are published together, e.g. in a bundle
+    defer_or_run(update_search_documents, instance.pk, key=instance.pk)
+
+
+def update_search_document_urls(instance, **kwargs):  # pylint: disable=unused-argument
+    # the URLs of the page and all of its descendants have changed
+    page_ids = SearchDocument.objects.filter(page__path__startswith=instance.path).values_list("page_id", flat=True)
+    if get_active_collector() is None:
+        update_search_documents(page_ids)
+    else:
+        for page_id in page_ids:
+            defer_or_run(update_search_documents, page_id, key=page_id)
+
+
+def update_topic_suggestion(instance, **kwargs):  # pylint: disable=unused-argument
+    transaction.on_commit(lambda: update_prefix_index(added={("topic", instance.pk): get_topic_suggestion(instance)}))
+
+
+def remove_topic_suggestion(instance, **kwargs):  # pylint: disable=unused-argument
+    topic_id = instance.pk
+    transaction.on_commit(lambda: update_prefix_index(added={}, removed=[("topic", topic_id)]))
+
+
+def register_signal_handlers():
+    page_published.connect(update_search_document, dispatch_uid="search_document_publish")
+    page_unpublished.connect(update_search_document, dispatch_uid="search_document_unpublish")
+    post_page_move.connect(update_search_document_urls, dispatch_uid="search_document_move")
+    page_slug_changed.connect(update_search_document_urls, dispatch_uid="search_document_slug_changed")
+    post_save.connect(update_topic_suggestion, sender=Topic, dispatch_uid="autocomplete_topic_save")
+    post_delete.connect(remove_topic_suggestion, sender=Topic, dispatch_uid="autocomplete_topic_delete")
@@ -0,0 +1,135 @@
+import json
+
+from datetime import datetime
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils.timezone import make_aware
+from wagtail.models import Site
+
+from ons_alpha.release_calendar.models import ReleaseIndex, ReleasePage
+from ons_alpha.search import autocomplete
+from ons_alpha.search.autocomplete import AUTOCOMPLETE_CACHE_GENERATION, PrefixIndex, Suggestion, update_prefix_index
+from ons_alpha.search.views import autocomplete as autocomplete_view
+from ons_alpha.taxonomy.models import Topic
+from ons_alpha.utils.cache import bump_cache_generation
+
+
+class PrefixIndexTestCase(TestCase):
+    def setUp(self):
+        self.index = PrefixIndex(
+            [
+                (1, Suggestion("Consumer price inflation", "/cpi/", "page")),
+                (2, Suggestion("Prices", "/prices/", "topic")),
+                (3, Suggestion("Labour market", "/labour/", "page")),
+            ]
+        )
+
+    def titles(self, query, **kwargs):
+        return [suggestion.title for suggestion in self.index.search(query, **kwargs)]
+
+    def test_matches_the_start_of_any_word(self):
+        self.assertEqual(self.titles("infl"), ["Consumer price inflation"])
+        self.assertEqual(self.titles("PRICE  infl"), ["Consumer price inflation"])
+        self.assertEqual(self.titles("market lab"), [])
+        self.assertEqual(self.titles(" "), [])
+
+    def test_prefers_titles_starting_with_the_query(self):
+        self.assertEqual(self.titles("pri"), ["Prices", "Consumer price inflation"])
+        self.assertEqual(self.titles("pri", limit=1), ["Prices"])
+
+    def test_add_and_remove(self):
+        self.index.add(3, Suggestion("Labour productivity", "/productivity/", "page"))
+        self.index.add(4, Suggestion("Population", "/population/", "topic"))
+        self.index.remove(1)
+
+        self.assertEqual(self.titles("p"), ["Prices", "Population", "Labour productivity"])
+        self.assertEqual(self.titles("market"), [])
+        self.assertEqual(len(self.index), 3)
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class AutocompleteViewTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        autocomplete._prefix_index = None  # pylint: disable=protected-access
+        autocomplete._rebuilding = False  # pylint: disable=protected-access
+        # build the index straight away, rather than in another thread
+        patcher = mock.patch.object(autocomplete, "run_in_background", side_effect=lambda func: func())
+        self.run_in_background = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.topic = Topic.add_root(name="Economy")
+        self.index = Site.objects.get(is_default_site=True).root_page.add_child(instance=ReleaseIndex(title="Releases"))
+        self.index.save_revision().publish()
+
+    def get_response(self, query):
+        return autocomplete_view(RequestFactory().get("/search/autocomplete/", {"query": query}))
+
+    def get_results(self, query):
+        return json.loads(self.get_response(query).content)["results"]
+
+    def publish_from_another_process(self, **kwargs):
+        # i.e. one without an index
+        with mock.patch.object(autocomplete, "_prefix_index", None):
+            update_prefix_index(**kwargs)
+
+    def test_suggests_topics_and_live_pages(self):
+        self.assertEqual(
+            self.get_results("econ"), [{"title": "Economy", "url": "/search/?query=Economy", "type": "topic"}]
+        )
+
+        # the index is only built once
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get_results("rel")[0]["title"], "Releases")
+
+    def test_index_is_updated_on_publish(self):
+        self.assertEqual(self.get_results("labour"), [])
+
+        release = ReleasePage(title="Labour market", summary="Summary", release_date=make_aware(datetime(2024, 1, 1)))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.index.add_child(instance=release).save_revision().publish()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get_results("labour")[0]["url"], release.get_url())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            release.unpublish()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get_results("labour"), [])
+
+    def test_changes_published_by_other_processes_are_applied(self):
+        self.assertEqual(self.get_results("pop"), [])
+
+        self.publish_from_another_process(added={("topic", 0): Suggestion("Population", "/population/", "topic")})
+
+        with mock.patch.object(autocomplete, "build_prefix_index") as build_prefix_index, self.assertNumQueries(0):
+            self.assertEqual(self.get_results("pop")[0]["title"], "Population")
+        build_prefix_index.assert_not_called()
+
+    def test_index_is_rebuilt_in_the_background_when_changes_are_missing(self):
+        self.assertEqual(self.get_results("pop"), [])
+        # changes made without publishing them, followed by others
+        Topic.add_root(name="Population")
+        bump_cache_generation(AUTOCOMPLETE_CACHE_GENERATION)
+        self.publish_from_another_process(added={})
+
+        self.run_in_background.reset_mock(side_effect=True)
+        # the old index is used until the new one has been built
+        self.assertEqual(self.get_results("pop"), [])
+        self.assertEqual(self.get_results("econ")[0]["title"], "Economy")
+        self.run_in_background.assert_called_once()
+
+        self.run_in_background.call_args.args[0]()
+        self.assertEqual(self.get_results("pop")[0]["title"], "Population")
+
+    def test_nothing_is_cached_until_the_index_is_built(self):
+        self.run_in_background.side_effect = None
+
+        response = self.get_response("econ")
+
+        self.assertEqual(json.loads(response.content)["results"], [])
+        self.assertIn("no-cache", response["Cache-Control"])
+        self.assertIn("no-cache", self.get_response("econ")["Cache-Control"])
+        self.run_in_background.assert_called_once()
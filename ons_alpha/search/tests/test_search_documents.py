@@ -0,0 +1,156 @@
+from datetime import datetime
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils.timezone import make_aware
+from wagtail.blocks import StreamBlock
+from wagtail.models import Page, Site
+from wagtail.rich_text import RichText
+
+from ons_alpha.release_calendar.enums import ReleaseStatus
+from ons_alpha.release_calendar.models import ReleaseIndex, ReleasePage
+from ons_alpha.search.models import SearchDocument
+from ons_alpha.search.views import get_search_results, search
+from ons_alpha.standardpages.models import InformationPage
+from ons_alpha.taxonomy.models import PageTopicRelationship, Topic
+
+
+class SearchDocumentTestCase(TestCase):
+    def setUp(self):
+        self.index = Site.objects.get(is_default_site=True).root_page.add_child(instance=ReleaseIndex(title="Releases"))
+        self.release = self.index.add_child(
+            instance=ReleasePage(
+                title="Labour market overview",
+                status=ReleaseStatus.PUBLISHED,
+                release_date=make_aware(datetime(2024, 1, 10, 9, 30)),
+                summary="<p>Employment <strong>figures</strong></p>",
+                live=False,
+            )
+        )
+        self.topic = Topic.add_root(name="Economy")
+        PageTopicRelationship.objects.create(page=self.release, topic=self.topic)
+        self.release.save_revision().publish()
+
+    def test_document_is_created_on_publish(self):
+        document = SearchDocument.objects.get(page=self.release)
+
+        self.assertEqual(document.title, "Labour market overview")
+        self.assertEqual(document.summary, "Employment figures")
+        self.assertEqual(document.release_date.isoformat(), "2024-01-10")
+        self.assertEqual(document.topic_ids, [self.topic.pk])
+        self.assertEqual(document.url, self.release.get_url())
+
+    def test_document_text_is_extracted_without_rendering(self):
+        page = self.index.add_child(
+            instance=InformationPage(
+                title="Jobs",
+                search_description="<p>Jobs &amp; pay</p>",
+                introduction="Pay &amp; conditions",
+                body=[("paragraph", RichText("<p>Hours <em>worked</em> &amp; paid</p>"))],
+            )
+        )
+
+        with mock.patch.object(StreamBlock, "render", side_effect=AssertionError("rendered")):
+            document = SearchDocument.from_page(page)
+
+        self.assertEqual(document.summary, "Jobs & pay")
+        self.assertEqual(document.content, "Pay & conditions\nHours worked & paid")
+
+    def test_document_is_removed_on_unpublish(self):
+        self.release.refresh_from_db()
+        self.release.unpublish()
+
+        self.assertFalse(SearchDocument.objects.filter(page=self.release).exists())
+
+    def test_document_url_is_updated_when_parent_slug_changes(self):
+        # the signal is sent once the change is committed
+        with self.captureOnCommitCallbacks(execute=True):
+            self.index.slug = "calendar"
+            self.index.save_revision().publish()
+
+        self.assertIn("/calendar/", SearchDocument.objects.get(page=self.release).url)
+
+    def test_rebuild_command(self):
+        SearchDocument.objects.all().delete()
+
+        call_command("rebuild_search_documents", stdout=StringIO())
+
+        self.assertEqual(
+            set(SearchDocument.objects.values_list("page_id", flat=True)),
+            set(Page.objects.live().exclude(depth=1).values_list("pk", flat=True)),
+        )
+        self.assertTrue(SearchDocument.objects.filter(page=self.release).exists())
+
+    @override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+    def test_search_view_does_not_load_pages(self):
+        request = RequestFactory().get("/search/", {"query": "labour"})
+
+        # the ranked index entries and their documents, with no queries for the pages
+        with self.assertNumQueries(2):
+            response = search(request)
+            results = list(response.context_data["search_results"])
+
+        self.assertEqual(results, [SearchDocument.objects.get(page=self.release)])
+        self.assertEqual(results[0].url, self.release.get_url())
+        self.assertEqual(response.context_data["pagination_query_string"]("2"), "query=labour&page=2")
+
+    def test_search_results_are_paginated(self):
+        for i in range(3):
+            release = ReleasePage(title=f"Labour market {i}", summary="Summary", release_date=self.release.release_date)
+            self.index.add_child(instance=release).save_revision().publish()
+
+        with self.settings(DEFAULT_PER_PAGE=3):
+            first = search(RequestFactory().get("/search/", {"query": "labour"})).context_data["search_results"]
+            second = search(RequestFactory().get("/search/", {"query": "labour", "page": first.next_cursor}))
+
+        second = second.context_data["search_results"]
+        self.assertEqual(len(first), 3)
+        self.assertEqual(len(second), 1)
+        self.assertFalse(second.has_next())
+        self.assertEqual(second.paginator.count, 4)
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class SearchResultsCacheTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.index = Site.objects.get(is_default_site=True).root_page.add_child(instance=ReleaseIndex(title="Releases"))
+
+    def add_release(self, title):
+        release = ReleasePage(title=title, summary="Summary", release_date=make_aware(datetime(2024, 1, 10, 9, 30)))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.index.add_child(instance=release).save_revision().publish()
+        return release
+
+    def get_titles(self, query):
+        return [result.title for result in get_search_results(query, 1)]
+
+    def test_equivalent_queries_are_served_from_the_cache(self):
+        self.add_release("Consumer price inflation")
+        self.assertEqual(self.get_titles("inflation"), ["Consumer price inflation"])
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get_titles("  Inflation "), ["Consumer price inflation"])
+
+    def test_cache_is_invalidated_on_publish(self):
+        self.add_release("Consumer price inflation")
+        self.assertEqual(len(self.get_titles("inflation")), 1)
+
+        self.add_release("Producer price inflation")
+
+        self.assertEqual(len(self.get_titles("inflation")), 2)
+
+    def test_invalid_page_numbers_show_the_first_page(self):
+        self.add_release("Consumer price inflation")
+
+        for page in ["²", "-1", "0", "one", None]:
+            with self.subTest(page=page):
+                self.assertEqual(
+                    [result.title for result in get_search_results("inflation", page)], ["Consumer price inflation"]
+                )
+
+        response = search(RequestFactory().get("/search/", {"query": "inflation", "page": "²"}))
+        self.assertEqual(len(response.context_data["search_results"]), 1)
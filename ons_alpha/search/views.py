@@ -1,32 +1,102 @@
 from django.conf import settings
-from django.core.paginator import Paginator
+from django.core.cache import cache
+from django.http import JsonResponse, QueryDict
 from django.template.response import TemplateResponse
 from django.utils.cache import add_never_cache_headers, patch_cache_control
-from wagtail.models import Page
 
+from ons_alpha.search.autocomplete import get_prefix_index
+from ons_alpha.search.cache import get_search_results_cache_key, normalize_search_query
+from ons_alpha.search.models import SearchDocument
 from ons_alpha.utils.cache import get_default_cache_control_kwargs
+from ons_alpha.utils.pagination import KeysetPage, OffsetPaginator
+
+
+def get_search_results(search_query: str, page) -> KeysetPage:
+    """
+    Returns the page of search documents matching `search_query`. Popular searches
+    are served from the cache, which is invalidated whenever the documents change.
+    """
+    search_query = normalize_search_query(search_query)
+    paginator = OffsetPaginator(
+        SearchDocument.objects.search(search_query, operator="and"),
+        settings.DEFAULT_PER_PAGE,
+        count_cache_key=get_search_results_cache_key(search_query, "count"),
+        count_cache_timeout=settings.SEARCH_RESULTS_CACHE_TIMEOUT,
+    )
+    if not settings.SEARCH_RESULTS_CACHE_TIMEOUT:
+        return paginator.get_page(page)
+
+    # invalid page numbers show the first page
+    try:
+        page = max(int(page), 1)
+    except (TypeError, ValueError):
+        page = 1
+    cache_key = get_search_results_cache_key(search_query, f"page:{page}")
+    if (cached := cache.get(cache_key)) is not None:
+        object_list, next_cursor, previous_cursor = cached
+        return KeysetPage(object_list, paginator, next_cursor=next_cursor, previous_cursor=previous_cursor)
+
+    search_results = paginator.page(page)
+    cache.set(
+        cache_key,
+        (search_results.object_list, search_results.next_cursor, search_results.previous_cursor),
+        settings.SEARCH_RESULTS_CACHE_TIMEOUT,
+    )
+    return search_results
 
 
 def search(request):
     search_query = request.GET.get("query", None)
     page = request.GET.get("page", 1)
 
-    # Search
-    search_results = Page.objects.live().search(search_query, operator="and") if search_query else Page.objects.none()
+    # Search the search documents, which have everything needed to show the results,
+    # rather than pages, which would need loading individually
+    search_results = get_search_results(search_query, page) if search_query else None
 
-    # Pagination
-    search_results = Paginator(search_results, settings.DEFAULT_PER_PAGE).get_page(page)
+    def pagination_query_string(cursor):
+        query = QueryDict(mutable=True)
+        query.update({"query": search_query, "page": cursor})
+        return query.urlencode()
 
     response = TemplateResponse(
         request,
         "templates/pages/search/search.html",
-        {"search_query": search_query, "search_results": search_results},
+        {
+            "search_query": search_query,
+            "search_results": search_results,
+            "pagination_query_string": pagination_query_string,
+        },
     )
     # Instruct FE cache to not cache when the search query is present.
     # It's so hits get added to the database and results include newly
-    # added pages.
+    # added pages. The results themselves are cached server-side, see
+    # `get_search_results()`.
     if search_query:
         add_never_cache_headers(response)
     else:
         patch_cache_control(response, **get_default_cache_control_kwargs())
     return response
+
+
+def autocomplete(request):
+    """
+    Returns the titles of pages and topics matching the start of `query`, for a
+    typeahead. These are looked up in an in-memory index, without querying the database.
+    """
+    index = get_prefix_index()
+    query = request.GET.get("query", "")[:100]
+    suggestions = index.search(query, limit=settings.AUTOCOMPLETE_LIMIT) if index is not None else []
+    response = JsonResponse(
+        {
+            "results": [
+                {"title": suggestion.title, "url": suggestion.url, "type": suggestion.kind}
+                for suggestion in suggestions
+            ]
+        }
+    )
+    if index is None:
+        # the index is still being built, so don't let the FE cache keep the empty results
+        add_never_cache_headers(response)
+    else:
+        patch_cache_control(response, **get_default_cache_control_kwargs())
+    return response
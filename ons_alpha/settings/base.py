@@ -77,6 +77,7 @@ INSTALLED_APPS = [
     "ons_alpha.topics",
     "ons_alpha.bulletins",
     "ons_alpha.bundles",
+    "ons_alpha.jobs",
     "ons_alpha.workflows",
     "crispy_forms",
     "tbxforms",
@@ -402,6 +403,21 @@ if "AWS_STORAGE_BUCKET_NAME" in env:
     # https://github.com/jschneier/django-storages/blob/10d1929de5e0318dbd63d715db4bebc9a42257b5/storages/backends/s3boto3.py#L217
     AWS_S3_URL_PROTOCOL = env.get("AWS_S3_URL_PROTOCOL", "https:")
 
+# Private media file ACLs are set concurrently on a shared pool of worker threads.
+# The concurrency limit adapts to throttling from S3, backing off and slowly
+# recovering up to this maximum. Failed requests are retried with jittered backoff.
+PRIVATE_MEDIA_ACL_MAX_CONCURRENCY = int(env.get("PRIVATE_MEDIA_ACL_MAX_CONCURRENCY", 16))
+PRIVATE_MEDIA_ACL_MAX_ATTEMPTS = int(env.get("PRIVATE_MEDIA_ACL_MAX_ATTEMPTS", 5))
+
+# How private media files (and public ones whose ACLs are out of date) are served:
+# "redirect" to a short-lived signed URL (for files in S3), "x_accel_redirect" to hand
+# the file over to the web server, or "stream" it through Django. Files that can't be
+# redirected to are streamed. For "x_accel_redirect", the web server must map the
+# prefix to the storage location, as an internal location.
+PRIVATE_MEDIA_SERVE_METHOD = env.get("PRIVATE_MEDIA_SERVE_METHOD", "redirect")
+PRIVATE_MEDIA_SIGNED_URL_EXPIRY = int(env.get("PRIVATE_MEDIA_SIGNED_URL_EXPIRY", 60 * 5))
+PRIVATE_MEDIA_X_ACCEL_REDIRECT_PREFIX = env.get("PRIVATE_MEDIA_X_ACCEL_REDIRECT_PREFIX", "/private-media/")
+
 
 # Logging
 # This logging is configured to be used with Sentry and console logs. Console
@@ -754,6 +770,8 @@ WAGTAILDOCS_DOCUMENT_MODEL = "documents.CustomDocument"
 
 # Document serve method - avoid serving files directly from the storage.
 # https://docs.wagtail.io/en/stable/advanced_topics/settings.html#documents
+# Documents are served by `ons_alpha.documents.views.serve`, which redirects public
+# documents to the storage, and serves private ones using PRIVATE_MEDIA_SERVE_METHOD.
 WAGTAILDOCS_SERVE_METHOD = "serve_view"
 
 
@@ -807,9 +825,59 @@ SLACK_NOTIFICATIONS_WEBHOOK_URL = env.get("SLACK_NOTIFICATIONS_WEBHOOK_URL")
 
 SHORT_DATETIME_FORMAT = "d/m/Y P"
 
+# How long (in seconds) to cache the rendered HTML of StreamField blocks on content
+# pages. Set to 0 to disable the block render cache.
+BLOCK_RENDER_CACHE_TIMEOUT = int(env.get("BLOCK_RENDER_CACHE_TIMEOUT", 60 * 60 * 24))
+
+# How long (in seconds) to cache site search results. They're also invalidated when
+# pages are published or unpublished. Set to 0 to disable the search results cache.
+SEARCH_RESULTS_CACHE_TIMEOUT = int(env.get("SEARCH_RESULTS_CACHE_TIMEOUT", 60 * 5))
+
+# How long (in seconds) to cache site settings (e.g. navigation and tracking). They're
+# also invalidated when saved.
+SITE_SETTINGS_CACHE_TIMEOUT = int(env.get("SITE_SETTINGS_CACHE_TIMEOUT", 60 * 60 * 24))
+
+# How long (in seconds) to cache the URLs for the language switcher. They're also
+# invalidated when pages are published, unpublished or moved, or locales change.
+TRANSLATION_URLS_CACHE_TIMEOUT = int(env.get("TRANSLATION_URLS_CACHE_TIMEOUT", 60 * 60 * 24))
+
+# How long (in seconds) to cache the resolved site navigation. It's also invalidated when
+# the navigation settings or linked pages change.
+NAVIGATION_CACHE_TIMEOUT = int(env.get("NAVIGATION_CACHE_TIMEOUT", 60 * 60 * 24))
+
+# How long (in seconds) to cache the resolved related page cards on content pages. They're
+# also invalidated when pages are published, unpublished or moved. Set to 0 to disable.
+RELATED_PAGES_CACHE_TIMEOUT = int(env.get("RELATED_PAGES_CACHE_TIMEOUT", 60 * 60 * 24))
+
+# The number of threads used to generate (and upload) renditions when warming them for
+# newly published pages, and with the warm_renditions command.
+RENDITION_WARMING_MAX_WORKERS = int(env.get("RENDITION_WARMING_MAX_WORKERS", 4))
+
+# The maximum number of suggestions returned by the search autocomplete endpoint.
+AUTOCOMPLETE_LIMIT = int(env.get("AUTOCOMPLETE_LIMIT", 10))
+
+# The maximum number of bundles the publish_bundles command publishes concurrently.
+# Each worker uses its own database connection.
+BUNDLE_PUBLISH_MAX_WORKERS = int(env.get("BUNDLE_PUBLISH_MAX_WORKERS", 4))
+
+# The scheduler runs queued jobs (scheduled or ad hoc), up to JOBS_MAX_CONCURRENCY
+# at a time in each process, checking for new jobs every JOBS_POLL_INTERVAL seconds.
+# Running jobs hold a lease that is renewed while they run, and jobs whose lease
+# expires (e.g. because the process died) are marked as failed.
+JOBS_MAX_CONCURRENCY = int(env.get("JOBS_MAX_CONCURRENCY", 2))
+JOBS_POLL_INTERVAL = int(env.get("JOBS_POLL_INTERVAL", 5))
+JOBS_LEASE_DURATION = int(env.get("JOBS_LEASE_DURATION", 60))
+# How long the history of finished jobs is kept
+JOBS_HISTORY_DAYS = int(env.get("JOBS_HISTORY_DAYS", 30))
+
 ONS_API_DATASET_BASE_URL = env.get("ONS_API_DATASET_BASE_URL", "https://api.beta.ons.gov.uk/v1/datasets")
 ONS_WEBSITE_DATASET_BASE_URL = env.get("ONS_WEBSITE_DATASET_BASE_URL", "https://www.ons.gov.uk/datasets")
 
+# ONS API requests use a pooled keep-alive session with these timeouts (in seconds).
+ONS_API_CONNECT_TIMEOUT = float(env.get("ONS_API_CONNECT_TIMEOUT", 3.05))
+ONS_API_READ_TIMEOUT = float(env.get("ONS_API_READ_TIMEOUT", 10))
+ONS_API_POOL_MAXSIZE = int(env.get("ONS_API_POOL_MAXSIZE", 10))
+
 # Disable new version check and "what's new" banner
 WAGTAIL_ENABLE_UPDATE_CHECK = False
 WAGTAIL_ENABLE_WHATS_NEW_BANNER = False
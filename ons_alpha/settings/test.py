@@ -24,3 +24,10 @@ ALLOWED_HOSTS = ["*"]
 # By default, Django uses a computationally difficult algorithm for passwords hashing.
 # We don't need such a strong algorithm in tests, so use MD5
 PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+# #############
+# Storage
+
+# Keep the files created in tests (e.g. images and their renditions) in memory, rather
+# than leaving them in MEDIA_ROOT
+STORAGES["default"] = {"BACKEND": "django.core.files.storage.InMemoryStorage"}  # noqa: F405
@@ -1,11 +1,11 @@
 from django.conf import settings
-from django.core.paginator import Paginator
 from django.db import models
 from wagtail.admin.panels import FieldPanel, InlinePanel
 from wagtail.search import index
 
 from ons_alpha.core.models import BasePage
 from ons_alpha.utils.fields import StreamField
+from ons_alpha.utils.pagination import KeysetPaginator
 
 from .blocks import StoryBlock
 
@@ -29,13 +29,7 @@ class InformationPage(BasePage):
 
     def get_context(self, request, *args, **kwargs):
         context = super().get_context(request, *args, **kwargs)
-        context["related_pages"] = [
-            {
-                "text": page.listing_title or page.title,
-                "url": page.get_full_url(request),
-            }
-            for page in self.related_pages
-        ]
+        context["related_pages"] = self.get_related_page_cards(request)
 
         return context
 
@@ -53,8 +47,8 @@ class IndexPage(BasePage):
         context = super().get_context(request, *args, **kwargs)
         subpages = self.get_children().live()
         per_page = settings.DEFAULT_PER_PAGE
-        page_number = request.GET.get("page")
-        subpages = Paginator(subpages, per_page).get_page(page_number)
+        cursor = request.GET.get("cursor")
+        subpages = KeysetPaginator(subpages, per_page, ordering=["path"]).get_page(cursor)
 
         context["subpages"] = subpages
 
@@ -1,4 +1,9 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import RequestFactory, override_settings
 from wagtail.test.utils import WagtailPageTestCase
+from wagtail_factories import ImageFactory
 
 from ons_alpha.core.models import PageRelatedPage
 from ons_alpha.home.models import HomePage
@@ -34,3 +39,70 @@ class StandrdPageTests(WagtailPageTestCase):
         info_page.refresh_from_db()
 
         self.assertEqual(list(info_page.related_pages), [p1, p3, p4, p2])
+
+    def test_related_pages_excludes_non_live_pages(self):
+        p1 = InformationPageFactory()
+        p2 = InformationPageFactory(live=False)
+
+        info_page = InformationPageFactory()
+        info_page.page_related_pages = [PageRelatedPage(page=p2, sort_order=0), PageRelatedPage(page=p1, sort_order=1)]
+        info_page.save()
+        info_page.refresh_from_db()
+
+        self.assertEqual(info_page.related_pages, [p1])
+
+
+@override_settings(
+    RELATED_PAGES_CACHE_TIMEOUT=60,
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+)
+class RelatedPageCardsTests(WagtailPageTestCase):
+    def setUp(self):
+        cache.clear()
+        self.request = RequestFactory().get("/")
+        self.related = [
+            InformationPageFactory(listing_title="Listing title", listing_summary="Summary"),
+            InformationPageFactory(listing_image=ImageFactory()),
+            InformationPageFactory(),
+        ]
+        self.page = InformationPageFactory()
+        self.page.page_related_pages = [
+            PageRelatedPage(page=page, sort_order=i) for i, page in enumerate(reversed(self.related))
+        ]
+        self.page.save_revision().publish()
+        self.page.refresh_from_db()
+
+    def test_cards(self):
+        cards = self.page.get_related_page_cards(self.request)
+
+        self.assertEqual([card["url"] for card in cards], [page.get_full_url() for page in reversed(self.related)])
+        self.assertEqual(cards[2]["text"], "Listing title")
+        self.assertEqual(cards[2]["summary"], "Summary")
+        self.assertEqual(cards[0]["image"], None)
+        self.assertIn("fill-450x300", cards[1]["image"])
+
+    def test_cards_are_cached(self):
+        self.page.get_related_page_cards(self.request)
+
+        page = InformationPage.objects.get(pk=self.page.pk)
+        with self.assertNumQueries(0):
+            page.get_related_page_cards(self.request)
+
+    def test_cards_are_invalidated_when_a_related_page_is_published(self):
+        self.page.get_related_page_cards(self.request)
+
+        self.related[2].title = "New title"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.related[2].save_revision().publish()
+
+        cards = InformationPage.objects.get(pk=self.page.pk).get_related_page_cards(self.request)
+        self.assertEqual(cards[2]["text"], "Listing title")
+        self.assertEqual(cards[0]["text"], "New title")
+
+    def test_cards_are_not_cached_in_previews(self):
+        self.request.is_preview = True
+        with mock.patch.object(InformationPage, "build_related_page_cards", return_value=[]) as build:
+            self.page.get_related_page_cards(self.request)
+            self.page.get_related_page_cards(self.request)
+
+        self.assertEqual(build.call_count, 2)
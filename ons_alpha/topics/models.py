@@ -3,14 +3,15 @@ from typing import Type
 
 from django.core.exceptions import ValidationError
 from django.db import models
-from django.db.models import OuterRef, QuerySet, Subquery
+from django.db.models import F, Q, QuerySet, Window
+from django.db.models.functions import Length, RowNumber, Substr
 from django.utils.text import slugify
 from django.utils.translation import gettext as _
 from wagtail.admin.panels import FieldPanel, ObjectList, TabbedInterface
 from wagtail.models import Page
 
-from ons_alpha.articles.models import ArticlePage, ArticleSeriesPage
-from ons_alpha.bulletins.models import BulletinPage, BulletinSeriesPage
+from ons_alpha.articles.models import ArticlePage
+from ons_alpha.bulletins.models import BulletinPage
 from ons_alpha.core.models.base import BasePage
 from ons_alpha.core.models.mixins import SubpageMixin
 from ons_alpha.methodologies.models import MethodologyPage
@@ -63,47 +64,65 @@ class TopicPage(BaseTopicPage):
     subpage_types = ["articles.ArticleSeriesPage", "bulletins.BulletinSeriesPage", "methodologies.MethodologyPage"]
     page_description = "A specific topic page. e.g. Public sector finance or Inflation and price indices"
 
-    def latest_by_series(self, model: Type[Page], series_model: Type[Page], topic: Topic = None) -> QuerySet:
-        newest_qs = (
-            model.objects.live().public().filter(path__startswith=OuterRef("path"), depth__gte=OuterRef("depth"))
-        )
-        if topic:
-            newest_qs = newest_qs.filter(topics__topic=topic)
-        newest_qs = newest_qs.order_by("-release_date")
-
-        model_pk_qs = series_model.objects.not_child_of(self) if topic else series_model.objects.child_of(self)
-        return model.objects.filter(
-            pk__in=model_pk_qs.annotate(latest_child_page=Subquery(newest_qs.values("pk")[:1])).values_list(
-                "latest_child_page", flat=True
+    @cached_property
+    def private_pages_q(self) -> Q:
+        # `PageQuerySet.public()` queries the view restrictions each time it's called,
+        # so look them up once for all the sections on this page.
+        return Page.objects.private_q()
+
+    def latest_by_series(self, model: Type[Page], topic: Topic | int | None = None) -> QuerySet:
+        """
+        Returns the latest live, public `model` page in each series, in a single query.
+
+        Without `topic`, this covers the series under this page. With `topic`, it covers
+        the series elsewhere, considering only pages tagged with `topic`.
+        """
+        pages = model.objects.live().exclude(self.private_pages_q)
+        pages = pages.not_descendant_of(self).filter(topics__topic=topic) if topic else pages.descendant_of(self)
+
+        # series pages are the parents of `model` pages, so partition by the parent path
+        series_path = Substr("path", 1, Length("path") - Page.steplen)
+        return (
+            pages.annotate(
+                series_rank=Window(
+                    RowNumber(), partition_by=series_path, order_by=[F("release_date").desc(), F("pk").desc()]
+                )
             )
-        ).order_by("-release_date")
+            .filter(series_rank=1)
+            .order_by("-release_date", "-pk")
+        )
 
     @cached_property
     def latest_bulletins(self) -> QuerySet[BulletinPage]:
-        return self.latest_by_series(BulletinPage, BulletinSeriesPage)
+        return self.latest_by_series(BulletinPage)
 
     @cached_property
     def latest_articles(self) -> QuerySet[ArticlePage]:
-        return self.latest_by_series(ArticlePage, ArticleSeriesPage)
+        return self.latest_by_series(ArticlePage)
 
     @cached_property
     def latest_methodologies(self) -> QuerySet[MethodologyPage]:
-        return MethodologyPage.objects.live().public().child_of(self).order_by("-last_revised_date", "-pk")[:5]
+        return (
+            MethodologyPage.objects.live()
+            .exclude(self.private_pages_q)
+            .child_of(self)
+            .order_by("-last_revised_date", "-pk")[:5]
+        )
 
     @cached_property
     def related_by_topic(self) -> dict[str, QuerySet]:
         related = {}
-        if bulletins := self.latest_by_series(BulletinPage, BulletinSeriesPage, self.topic):
+        if bulletins := self.latest_by_series(BulletinPage, self.topic_id):
             related[_("Bulletins")] = bulletins
 
-        if articles := self.latest_by_series(ArticlePage, ArticleSeriesPage, self.topic):
+        if articles := self.latest_by_series(ArticlePage, self.topic_id):
             related[_("Articles")] = articles
 
         methodologies_qs = (
             MethodologyPage.objects.live()
-            .public()
+            .exclude(self.private_pages_q)
             .not_child_of(self)
-            .filter(topics__topic=self.topic)
+            .filter(topics__topic=self.topic_id)
             .order_by("-last_revised_date", "-pk")
         )
         if methodologies := methodologies_qs:
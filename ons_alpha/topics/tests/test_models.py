@@ -0,0 +1,77 @@
+from datetime import date
+
+from django.test import TestCase
+from wagtail.models import Page, PageViewRestriction
+
+from ons_alpha.articles.models import ArticlePage, ArticleSeriesPage
+from ons_alpha.bulletins.models import BulletinPage, BulletinSeriesPage
+from ons_alpha.methodologies.models import MethodologyPage
+from ons_alpha.taxonomy.models import PageTopicRelationship, Topic
+from ons_alpha.topics.models import TopicPage
+
+
+class TopicPageTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        root = Page.get_first_root_node()
+        cls.topic = Topic.add_root(name="Inflation")
+        cls.topic_page = root.add_child(instance=TopicPage(title="Inflation", topic=cls.topic))
+        other_topic_page = root.add_child(instance=TopicPage(title="Economy", topic=Topic.add_root(name="Economy")))
+
+        cls.latest_bulletins = []
+        for series_idx in range(3):
+            series = cls.topic_page.add_child(instance=BulletinSeriesPage(title=f"Bulletin series {series_idx}"))
+            for month in range(1, 4):
+                bulletin = cls.add_release(series, BulletinPage, f"Bulletin {series_idx}.{month}", month)
+            cls.latest_bulletins.append(bulletin)
+
+        article_series = cls.topic_page.add_child(instance=ArticleSeriesPage(title="Article series"))
+        cls.add_release(article_series, ArticlePage, "Older article", 1)
+        cls.latest_article = cls.add_release(article_series, ArticlePage, "Latest article", 2)
+
+        other_series = other_topic_page.add_child(instance=BulletinSeriesPage(title="Other bulletin series"))
+        cls.related_bulletin = cls.add_release(other_series, BulletinPage, "Related bulletin", 1)
+        PageTopicRelationship.objects.create(page=cls.related_bulletin, topic=cls.topic)
+        cls.add_release(other_series, BulletinPage, "Untagged bulletin", 2)
+
+        cls.topic_page.add_child(instance=MethodologyPage(title="Methodology", summary="Summary", body=[]))
+
+    @staticmethod
+    def add_release(series, model, title, month):
+        return series.add_child(
+            instance=model(
+                title=title,
+                summary="Summary",
+                release_date=date(2024, month, 1),
+                next_release_date=date(2025, month, 1),
+                body=[],
+            )
+        )
+
+    def get_topic_page(self):
+        return TopicPage.objects.get(pk=self.topic_page.pk)
+
+    def test_latest_by_series(self):
+        page = self.get_topic_page()
+
+        self.assertEqual(set(page.latest_bulletins), set(self.latest_bulletins))
+        self.assertEqual(list(page.latest_articles), [self.latest_article])
+
+    def test_latest_by_series_excludes_private_pages(self):
+        PageViewRestriction.objects.create(page=self.latest_article, restriction_type=PageViewRestriction.LOGIN)
+
+        self.assertEqual([page.title for page in self.get_topic_page().latest_articles], ["Older article"])
+
+    def test_related_by_topic(self):
+        related = self.get_topic_page().related_by_topic
+
+        self.assertEqual(list(related), ["Bulletins"])
+        self.assertEqual(list(related["Bulletins"]), [self.related_bulletin])
+
+    def test_query_count(self):
+        page = self.get_topic_page()
+
+        # view restrictions, then one query per section and related content type
+        with self.assertNumQueries(7):
+            for items in [*page.sections.values(), *page.related_by_topic.values()]:
+                list(items)
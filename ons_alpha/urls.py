@@ -10,6 +10,7 @@ from wagtail.contrib.sitemaps.views import sitemap
 from wagtail.documents import urls as wagtaildocs_urls
 from wagtail.utils.urlpatterns import decorate_urlpatterns
 
+from ons_alpha.documents import views as document_views
 from ons_alpha.images.views import ImageServeView
 from ons_alpha.search import views as search_views
 from ons_alpha.utils.cache import get_default_cache_control_decorator
@@ -17,6 +18,8 @@ from ons_alpha.utils.cache import get_default_cache_control_decorator
 
 # Private URLs are not meant to be cached.
 private_urlpatterns = [
+    # Replaces Wagtail's document serve view, to avoid streaming documents where possible
+    re_path(r"^documents/(\d+)/(.*)$", document_views.serve, name="wagtaildocs_serve"),
     path("documents/", include(wagtaildocs_urls)),
 ]
 
@@ -74,10 +77,14 @@ if settings.DEBUG:
 # Public URLs that are meant to be cached.
 urlpatterns = [
     path("sitemap.xml", sitemap),
-    re_path(r"^images/([^/]*)/(\d*)/([^/]*)/[^/]*$", ImageServeView.as_view(), name="wagtailimages_serve"),
 ]
 # Set public URLs to use the "default" cache settings.
 urlpatterns = decorate_urlpatterns(urlpatterns, get_default_cache_control_decorator())
+# The image serve view sets the "default" cache settings itself, except for
+# redirects to short-lived signed URLs, which must not be cached publicly.
+urlpatterns.append(
+    re_path(r"^images/([^/]*)/(\d*)/([^/]*)/[^/]*$", ImageServeView.as_view(), name="wagtailimages_serve"),
+)
 
 # Set private URLs to use the "never cache" cache settings.
 private_urlpatterns = decorate_urlpatterns(private_urlpatterns, never_cache)
@@ -100,6 +107,7 @@ urlpatterns = (
         # Wagtail cache-control is set on the page models' serve methods
         # and is handled conditionally on the search view
         path("search/", search_views.search, name="search"),
+        path("search/autocomplete/", search_views.autocomplete, name="search_autocomplete"),
         path("", include(wagtail_urls)),
         prefix_default_language=False,
     )
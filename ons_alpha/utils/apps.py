@@ -5,3 +5,16 @@ class UtilsConfig(AppConfig):
     default_auto_field = "django.db.models.AutoField"
     name = "ons_alpha.utils"
     label = "utils"
+
+    def ready(self) -> None:
+        from .wagtail_patches import (  # pylint: disable=import-outside-toplevel
+            patch_frontend_cache_signal_handlers,
+            patch_search_signal_handlers,
+        )
+
+        patch_frontend_cache_signal_handlers()
+        patch_search_signal_handlers()
+
+        from .signal_handlers import register_signal_handlers  # pylint: disable=import-outside-toplevel
+
+        register_signal_handlers()
@@ -1,4 +1,9 @@
+import copy
+import time
+
+from django.apps import apps
 from django.conf import settings
+from django.core.cache import cache
 from django.views.decorators.cache import cache_control
 from wagtail.contrib.frontend_cache.utils import purge_url_from_cache
 from wagtail.models import Site
@@ -35,3 +40,93 @@ def get_default_cache_control_decorator():
     """
     cache_control_kwargs = get_default_cache_control_kwargs()
     return cache_control(**cache_control_kwargs)
+
+
+def get_cache_generation(name: str) -> int:
+    """
+    Get the current generation number for a named group of cache entries.
+    Including it in cache keys allows the whole group to be invalidated at
+    once with `bump_cache_generation()`.
+    """
+    key = f"generation:{name}"
+    cache.add(key, 1, None)
+    return cache.get(key, 1)
+
+
+def bump_cache_generation(name: str) -> int:
+    """
+    Start a new generation, and return its number.
+    """
+    key = f"generation:{name}"
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # the key has expired or been evicted
+        cache.set(key, 2, None)
+        return 2
+
+
+SITE_SETTINGS_CACHE_GENERATION = "site_settings"
+
+# How long (in seconds) each process reuses the site settings it has loaded, as long as
+# the cache generation is unchanged. This is kept short in case the generation is lost
+# (e.g. if the cache is cleared), and restarts from a number that's already been used.
+SITE_SETTINGS_MEMO_TIMEOUT = 60
+
+# The site settings for each site, with the cache generation and time they were loaded at
+_site_settings: dict[int, tuple[int, float, dict]] = {}
+
+
+class CachedSiteSettingMixin:
+    """
+    Loads a site setting from the cache (see `get_site_settings()`), rather than the
+    database. Add it before `BaseSiteSetting`.
+    """
+
+    @classmethod
+    def for_site(cls, site):
+        if site is None:
+            raise cls.DoesNotExist(f"{cls} does not exist for site None.")
+        # copied, as `for_request()` sets the request on the instance
+        return copy.copy(get_site_settings(site.pk)[cls._meta.label_lower])
+
+
+def get_cached_site_setting_models() -> list:
+    return [model for model in apps.get_models() if issubclass(model, CachedSiteSettingMixin)]
+
+
+def load_site_settings(site_id: int) -> dict:
+    site_settings = {}
+    for model in get_cached_site_setting_models():
+        # include related objects (e.g. images), so they don't need to be fetched separately
+        related_fields = [
+            field.name for field in model._meta.concrete_fields if field.many_to_one and field.name != "site"
+        ]
+        queryset = model.base_queryset().select_related(*related_fields)
+        site_settings[model._meta.label_lower], _ = queryset.get_or_create(site_id=site_id)
+    return site_settings
+
+
+def get_site_settings(site_id: int) -> dict:
+    """
+    Returns all the cached site settings for a site, keyed by model label. They're
+    kept in the shared cache, and memoised in each process until they change.
+    """
+    generation = get_cache_generation(SITE_SETTINGS_CACHE_GENERATION)
+    if (memoised := _site_settings.get(site_id)) is not None:
+        memoised_generation, loaded_at, site_settings = memoised
+        if memoised_generation == generation and time.monotonic() - loaded_at < SITE_SETTINGS_MEMO_TIMEOUT:
+            return site_settings
+
+    site_settings = cache.get(f"site_settings:{generation}:{site_id}")
+    if site_settings is None:
+        site_settings = load_site_settings(site_id)
+        # creating missing settings bumps the generation
+        generation = get_cache_generation(SITE_SETTINGS_CACHE_GENERATION)
+        cache.set(f"site_settings:{generation}:{site_id}", site_settings, settings.SITE_SETTINGS_CACHE_TIMEOUT)
+    _site_settings[site_id] = (generation, time.monotonic(), site_settings)
+    return site_settings
+
+
+def invalidate_site_settings_cache() -> None:
+    bump_cache_generation(SITE_SETTINGS_CACHE_GENERATION)
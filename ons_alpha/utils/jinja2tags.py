@@ -1,16 +1,24 @@
 from crispy_forms.utils import render_crispy_form
+from django.conf import settings
+from django.core.cache import cache
 from django.templatetags.static import static
-from jinja2 import pass_context
+from django.utils.translation import get_language
+from jinja2 import nodes, pass_context
 from jinja2.ext import Extension
+from markupsafe import Markup, escape
 from wagtail.contrib.routable_page.templatetags.wagtailroutablepage_tags import routablepageurl
-from wagtail.models import Locale
+from wagtail.coreutils import get_supported_content_language_variant
+from wagtail.models import Locale, Site
 from wagtailmath.templatetags.wagtailmath import mathjax
 
+from ons_alpha.core.cache import get_translation_urls_cache_key, render_block_cached
 from ons_alpha.navigation.templatetags.navigation_tags import footer_nav, primary_nav, secondary_nav
 from ons_alpha.utils.templatetags.util_tags import social_image, social_text
 
 
 class UtilsExtension(Extension):  # pylint: disable=abstract-method
+    tags = {"include_cached_block"}
+
     def __init__(self, environment):
         super().__init__(environment)
 
@@ -34,19 +42,59 @@ class UtilsExtension(Extension):  # pylint: disable=abstract-method
             }
         )
 
+    def parse(self, parser):
+        """
+        `{% include_cached_block block %}` works like Wagtail's `{% include_block %}`
+        (always passing the context), but reuses the rendered HTML from the block
+        render cache. See `ons_alpha.core.cache`.
+        """
+        lineno = next(parser.stream).lineno
+        args = [parser.parse_expression(), nodes.DerivedContextReference()]
+        return nodes.Output([self.call_method("_include_cached_block", args, lineno=lineno)], lineno=lineno)
+
+    def _include_cached_block(self, value, context):
+        if not hasattr(value, "render_as_block"):
+            return escape(value) if context.eval_ctx.autoescape else Markup(value)
+        return Markup(render_block_cached(value, context.get_all()))
+
 
 @pass_context
 def get_translation_urls(context) -> list[dict[str, str | bool]]:
     if not (page := context.get("page")):
         return []
 
+    request = context["request"]
+    if getattr(request, "is_preview", False) or not page.pk:
+        variants = get_locale_variant_urls(page, request)
+    else:
+        # the variants are cached by translation key, for each site (as URLs may be relative to it)
+        cache_key = get_translation_urls_cache_key(page.translation_key)
+        site_id = getattr(Site.find_for_request(request), "pk", None)
+        cached = cache.get(cache_key) or {}
+        if (variants := cached.get(site_id)) is None:
+            variants = cached[site_id] = get_locale_variant_urls(page, request)
+            cache.set(cache_key, cached, settings.TRANSLATION_URLS_CACHE_TIMEOUT)
+
+    active_language_code = get_supported_content_language_variant(get_language())
+    return [
+        {
+            "url": variant["url"],
+            "isoCode": variant["isoCode"],
+            "text": variant["text"],
+            "current": variant["languageCode"] == active_language_code,
+        }
+        for variant in variants
+    ]
+
+
+def get_locale_variant_urls(page, request) -> list[dict[str, str]]:
     default_locale = Locale.get_default()
     variants = {variant.locale_id: variant for variant in page.get_translations(inclusive=True)}
     default_page = variants.get(default_locale.pk)
     urls = []
     for locale in Locale.objects.all().order_by("pk"):
         variant = variants.get(locale.pk, default_page)
-        url = variant.get_url(request=context["request"]) if variant is not None else ""
+        url = variant.get_url(request=request) if variant is not None else ""
         if variant and variant == default_page and locale.pk != variant.locale_id:
             # if there is no translation in this locale, append the language code to the path
             # Wagtail will serve the original page, but strings in templates will be localized
@@ -57,7 +105,7 @@ def get_translation_urls(context) -> list[dict[str, str | bool]]:
                 "url": url,
                 "isoCode": locale.language_code.split("-", 1)[0],
                 "text": locale.language_name_local,
-                "current": locale.is_active,
+                "languageCode": locale.language_code,
             }
         )
 
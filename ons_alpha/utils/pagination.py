@@ -0,0 +1,230 @@
+import datetime
+
+from collections.abc import Sequence
+from functools import cached_property
+
+from django.core import signing
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q, QuerySet
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+class KeysetPage(Sequence):
+    """
+    A page of results from `KeysetPaginator`. Like Django's `Page`, it can be
+    iterated over, and the results are available as `object_list`.
+    """
+
+    def __init__(
+        self,
+        object_list: list,
+        paginator: "KeysetPaginator",
+        *,
+        next_cursor: str | None = None,
+        previous_cursor: str | None = None,
+    ):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __repr__(self):
+        return f"<KeysetPage of {len(self.object_list)} items>"
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+    def has_other_pages(self) -> bool:
+        return self.has_next() or self.has_previous()
+
+
+class BasePaginator:
+    def __init__(
+        self, object_list, per_page: int, *, count_cache_key: str | None = None, count_cache_timeout: int = 300
+    ):
+        self.object_list = object_list
+        self.per_page = per_page
+        self.count_cache_key = count_cache_key
+        self.count_cache_timeout = count_cache_timeout
+
+    @cached_property
+    def count(self) -> int:
+        if self.count_cache_key is None:
+            return self.object_list.count()
+
+        count = cache.get(self.count_cache_key)
+        if count is None:
+            count = self.object_list.count()
+            cache.set(self.count_cache_key, count, self.count_cache_timeout)
+        return count
+
+
+class OffsetPaginator(BasePaginator):
+    """
+    Paginates by page number, for results that can't be paginated by key (e.g. search
+    results ordered by relevance). Like `KeysetPaginator`, it fetches one extra item
+    to find out whether there's a next page, so each page is fetched in one query and
+    the total is only counted if `count` is used.
+    """
+
+    def page(self, cursor: str | int | None = None) -> KeysetPage:
+        try:
+            number = int(cursor or 1)
+        except (TypeError, ValueError) as e:
+            raise InvalidCursor(cursor) from e
+        if number < 1:
+            raise InvalidCursor(cursor)
+
+        offset = (number - 1) * self.per_page
+        object_list = list(self.object_list[offset : offset + self.per_page + 1])
+        has_next = len(object_list) > self.per_page
+        return KeysetPage(
+            object_list[: self.per_page],
+            self,
+            next_cursor=str(number + 1) if has_next else None,
+            previous_cursor=str(number - 1) if number > 1 else None,
+        )
+
+    def get_page(self, cursor: str | int | None = None) -> KeysetPage:
+        try:
+            return self.page(cursor)
+        except InvalidCursor:
+            return self.page()
+
+
+class KeysetPaginator(BasePaginator):
+    """
+    Paginates `queryset` by seeking past the last item of the previous page (using
+    the `ordering` fields, which must uniquely order the results), rather than using
+    `OFFSET`. Every page is as fast to fetch as the first, and no count is needed.
+
+    Pages are identified by opaque, signed cursors. The total count is only queried
+    if `count` is used, and is cached if `count_cache_key` is given.
+    """
+
+    cursor_salt = "ons_alpha.utils.pagination"
+
+    def __init__(
+        self,
+        queryset: QuerySet,
+        per_page: int,
+        ordering: Sequence[str] = ("-release_date", "-pk"),
+        *,
+        count_cache_key: str | None = None,
+        count_cache_timeout: int = 300,
+    ):
+        super().__init__(queryset, per_page, count_cache_key=count_cache_key, count_cache_timeout=count_cache_timeout)
+        self.queryset = queryset
+        self.ordering = tuple(ordering)
+
+    def _get_fields(self) -> list[tuple[str, bool]]:
+        return [(name.removeprefix("-"), name.startswith("-")) for name in self.ordering]
+
+    def _to_python(self, name: str, value):
+        field = self.queryset.model._meta.pk if name == "pk" else self.queryset.model._meta.get_field(name)
+        return field.to_python(value)
+
+    def encode_cursor(self, obj, *, backwards: bool = False) -> str:
+        return signing.dumps(
+            {"v": [getattr(obj, name) for name, _ in self._get_fields()], "b": backwards},
+            salt=self.cursor_salt,
+            serializer=CursorSerializer,
+            compress=True,
+        )
+
+    def decode_cursor(self, cursor: str) -> tuple[list, bool]:
+        try:
+            data = signing.loads(cursor, salt=self.cursor_salt, serializer=CursorSerializer)
+            values = [
+                self._to_python(name, value) for (name, _), value in zip(self._get_fields(), data["v"], strict=True)
+            ]
+        except (signing.BadSignature, KeyError, TypeError, ValueError) as e:
+            raise InvalidCursor(cursor) from e
+        return values, bool(data.get("b"))
+
+    def _seek_q(self, values: list, *, backwards: bool) -> Q:
+        """
+        Returns a filter for the items after `values` in the ordering (or before,
+        when going `backwards`), e.g. `a > x OR (a = x AND b > y)`.
+        """
+        q = Q()
+        equal = {}
+        for (name, descending), value in zip(self._get_fields(), values, strict=True):
+            lookup = "lt" if descending != backwards else "gt"
+            q |= Q(**equal, **{f"{name}__{lookup}": value})
+            equal[name] = value
+        return q
+
+    def page(self, cursor: str | None = None) -> KeysetPage:
+        """
+        Returns the page for `cursor` (or the first page), raising `InvalidCursor`
+        if the cursor is invalid.
+        """
+        queryset = self.queryset
+        backwards = False
+        if cursor:
+            values, backwards = self.decode_cursor(cursor)
+            queryset = queryset.filter(self._seek_q(values, backwards=backwards))
+
+        ordering = self.ordering
+        if backwards:
+            ordering = [name.removeprefix("-") if name.startswith("-") else f"-{name}" for name in ordering]
+
+        # fetch an extra item to find out if there is another page
+        object_list = list(queryset.order_by(*ordering)[: self.per_page + 1])
+        has_more = len(object_list) > self.per_page
+        object_list = object_list[: self.per_page]
+
+        if backwards:
+            object_list.reverse()
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, bool(cursor)
+
+        return KeysetPage(
+            object_list,
+            self,
+            next_cursor=self.encode_cursor(object_list[-1]) if has_next and object_list else None,
+            previous_cursor=(
+                self.encode_cursor(object_list[0], backwards=True) if has_previous and object_list else None
+            ),
+        )
+
+    def get_page(self, cursor: str | None = None) -> KeysetPage:
+        """
+        Returns the page for `cursor`, or the first page if the cursor is invalid.
+        """
+        try:
+            return self.page(cursor)
+        except InvalidCursor:
+            return self.page()
+
+
+class CursorEncoder(DjangoJSONEncoder):
+    def default(self, o):
+        # DjangoJSONEncoder truncates times to milliseconds, but cursor values must be
+        # exact, or items would be skipped or repeated at page boundaries
+        if isinstance(o, datetime.datetime | datetime.time):
+            return o.isoformat()
+        return super().default(o)
+
+
+class CursorSerializer:
+    def dumps(self, obj) -> bytes:
+        return CursorEncoder(separators=(",", ":")).encode(obj).encode("latin-1")
+
+    def loads(self, data: bytes):
+        return signing.JSONSerializer().loads(data)
@@ -1,22 +1,15 @@
-from django.db.models import Case, IntegerField, QuerySet, When
+from collections.abc import Iterable, Sequence
 
 
-def order_by_pk_position(
-    queryset: QuerySet,
-    pks: list | tuple,
-    exclude_non_matches: bool | None = False,
-) -> QuerySet:
+def sort_by_pk_position(objects: Iterable, pks: Sequence) -> list:
     """
-    Returns the supplied `queryset` ordered according to the
-    PK's position in `pks` (a list or tuple of pk values).
+    Returns the supplied `objects` as a list, ordered according to the
+    PK's position in `pks` (a list or tuple of pk values). Objects with
+    a PK value not in `pks` are excluded, and objects whose PK appears
+    more than once in `pks` are repeated.
 
-    Use the `exclude_non_matches` option to exclude items with
-    a PK value not in `pks`.
+    Sorting is done in Python, rather than with a `CASE` expression with
+    a branch per PK, so the query doesn't grow with the number of PKs.
     """
-    if exclude_non_matches:
-        queryset = queryset.filter(pk__in=pks)
-
-    cases = (When(pk=value, then=i) for i, value in enumerate(pks))
-    return queryset.annotate(pk_pos_order=Case(*cases, default=len(pks), output_field=IntegerField())).order_by(
-        "pk_pos_order"
-    )
+    objects_by_pk = {obj.pk: obj for obj in objects}
+    return [objects_by_pk[pk] for pk in pks if pk in objects_by_pk]
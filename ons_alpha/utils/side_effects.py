@@ -0,0 +1,82 @@
+import logging
+
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from django.db import transaction
+
+
+logger = logging.getLogger(__name__)
+
+BatchHandler = Callable[[list[Any]], None]
+
+_active_collector: ContextVar["PublishSideEffectCollector | None"] = ContextVar(
+    "publish_side_effect_collector", default=None
+)
+
+
+class PublishSideEffectCollector:
+    """
+    Gathers the side effects of publishing (media privacy changes, front-end cache
+    purges, search index updates, etc.) so that they can be merged and run in as
+    few batches as possible once the changes have been committed.
+
+    Items are grouped by the handler that will process them, and de-duplicated by
+    key. An item only becomes eligible for flushing once the transaction it was
+    deferred in has committed, so work that is rolled back has no side effects.
+    """
+
+    def __init__(self):
+        self.committed: dict[BatchHandler, dict[Hashable, Any]] = {}
+
+    def defer(self, handler: BatchHandler, item: Any, key: Hashable | None = None) -> None:
+        if key is None:
+            key = id(item)
+        transaction.on_commit(lambda: self.committed.setdefault(handler, {}).__setitem__(key, item))
+
+    def flush(self) -> None:
+        batches, self.committed = self.committed, {}
+        for handler, items in batches.items():
+            try:
+                handler(list(items.values()))
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Failed to run deferred publish side effect %s", handler.__qualname__)
+
+
+def get_active_collector() -> PublishSideEffectCollector | None:
+    return _active_collector.get()
+
+
+def defer_or_run(handler: BatchHandler, item: Any, key: Hashable | None = None) -> None:
+    """
+    Hand `item` over to the active collector, if there is one. Otherwise, process it
+    straight away.
+    """
+    if (collector := get_active_collector()) is not None:
+        collector.defer(handler, item, key=key)
+    else:
+        handler([item])
+
+
+@contextmanager
+def collect_publish_side_effects() -> Iterator[PublishSideEffectCollector]:
+    """
+    Defer publish-time side effects triggered within this block, and flush them
+    together after the outermost transaction commits. Nested blocks share the
+    outer collector.
+    """
+    if (collector := get_active_collector()) is not None:
+        yield collector
+        return
+
+    collector = PublishSideEffectCollector()
+    token = _active_collector.set(collector)
+    try:
+        yield collector
+    finally:
+        _active_collector.reset(token)
+        # on_commit callbacks run in the order they were registered, so anything
+        # committed within the block has been collected by the time this runs
+        transaction.on_commit(collector.flush)
@@ -0,0 +1,19 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from wagtail.models import Site
+
+from ons_alpha.utils.cache import get_cached_site_setting_models, invalidate_site_settings_cache
+
+
+def invalidate_site_settings_cache_on_change(**kwargs):  # pylint: disable=unused-argument
+    # Invalidate straight away, so the change is seen within the transaction, and again
+    # once it's committed, in case the old settings were cached again in the meantime
+    invalidate_site_settings_cache()
+    transaction.on_commit(invalidate_site_settings_cache)
+
+
+def register_signal_handlers():
+    for model in [Site, *get_cached_site_setting_models()]:
+        uid = f"site_settings_cache_{model._meta.label_lower}"
+        post_save.connect(invalidate_site_settings_cache_on_change, sender=model, dispatch_uid=f"{uid}_save")
+        post_delete.connect(invalidate_site_settings_cache_on_change, sender=model, dispatch_uid=f"{uid}_delete")
@@ -0,0 +1,41 @@
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+from wagtail.models import Site
+
+from ons_alpha.core.models import SocialMediaSettings, Tracking
+from ons_alpha.navigation.models import NavigationSettings
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class SiteSettingsCacheTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.site = Site.objects.get(is_default_site=True)
+
+    def get_request(self):
+        request = RequestFactory().get("/")
+        request._wagtail_site = self.site  # pylint: disable=protected-access
+        return request
+
+    def test_settings_are_loaded_together_and_cached(self):
+        Tracking.for_request(self.get_request())
+
+        with self.assertNumQueries(0):
+            request = self.get_request()
+            Tracking.for_request(request)
+            NavigationSettings.for_request(request)
+            self.assertIsNone(SocialMediaSettings.for_request(request).default_sharing_image)
+
+    def test_settings_are_invalidated_on_save(self):
+        tracking = Tracking.for_site(self.site)
+        tracking.google_tag_manager_id = "GTM-123456"
+        tracking.save()
+
+        self.assertEqual(Tracking.for_request(self.get_request()).google_tag_manager_id, "GTM-123456")
+
+    def test_each_request_gets_its_own_instance(self):
+        first = Tracking.for_request(self.get_request())
+        second = Tracking.for_request(self.get_request())
+
+        self.assertIsNot(first, second)
+        self.assertIsNot(first._request, second._request)  # pylint: disable=protected-access
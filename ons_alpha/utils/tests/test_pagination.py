@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+
+from django.test import TestCase
+from django.utils import timezone
+
+from ons_alpha.datasets.models import CatalogueDataset
+from ons_alpha.utils.pagination import InvalidCursor, KeysetPaginator
+
+
+class KeysetPaginatorTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # duplicate titles, so the primary key is needed to order the results
+        CatalogueDataset.objects.bulk_create(
+            [
+                CatalogueDataset(dataset_id=str(i), title=f"Dataset {i // 2}", last_synced=timezone.now())
+                for i in range(7)
+            ]
+        )
+        cls.ordered = list(CatalogueDataset.objects.order_by("-title", "-pk"))
+
+    def get_paginator(self, **kwargs):
+        return KeysetPaginator(CatalogueDataset.objects.all(), 3, ordering=["-title", "-pk"], **kwargs)
+
+    def test_pages_forwards_and_backwards(self):
+        paginator = self.get_paginator()
+
+        first = paginator.page()
+        second = paginator.page(first.next_cursor)
+        third = paginator.page(second.next_cursor)
+
+        self.assertEqual([*first, *second, *third], self.ordered)
+        self.assertFalse(first.has_previous())
+        self.assertFalse(third.has_next())
+
+        back = paginator.page(third.previous_cursor)
+        self.assertEqual(list(back), list(second))
+        self.assertEqual(list(paginator.page(back.previous_cursor)), list(first))
+        self.assertFalse(paginator.page(back.previous_cursor).has_previous())
+
+    def test_does_not_count(self):
+        paginator = self.get_paginator()
+        cursor = paginator.page().next_cursor
+
+        with self.assertNumQueries(1):
+            paginator.page(cursor)
+
+    def test_cached_count(self):
+        self.assertEqual(self.get_paginator(count_cache_key="datasets:count").count, 7)
+
+        CatalogueDataset.objects.all().delete()
+
+        self.assertEqual(self.get_paginator(count_cache_key="datasets:count").count, 7)
+        self.assertEqual(self.get_paginator().count, 0)
+
+    def test_invalid_cursor(self):
+        paginator = self.get_paginator()
+        tampered = paginator.page().next_cursor[:-1] + "x"
+
+        with self.assertRaises(InvalidCursor):
+            paginator.page(tampered)
+        self.assertEqual(list(paginator.get_page(tampered)), self.ordered[:3])
+
+    def test_cursors_keep_microseconds(self):
+        # all in the same millisecond, so they can only be told apart by their microseconds
+        start = datetime(2024, 1, 1, 9, 30, 0, 123000, tzinfo=dt_timezone.utc)
+        for i, dataset in enumerate(CatalogueDataset.objects.order_by("pk")):
+            dataset.last_synced = start + timedelta(microseconds=100 * (i % 4))
+            dataset.save(update_fields=["last_synced"])
+        ordered = list(CatalogueDataset.objects.order_by("-last_synced", "-pk"))
+        paginator = KeysetPaginator(CatalogueDataset.objects.all(), 2, ordering=["-last_synced", "-pk"])
+
+        results = []
+        page = paginator.page()
+        while True:
+            results.extend(page)
+            if not page.has_next():
+                break
+            page = paginator.page(page.next_cursor)
+
+        self.assertEqual(results, ordered)
@@ -0,0 +1,59 @@
+from unittest import mock
+
+from django.db import transaction
+from django.test import TestCase
+
+from ons_alpha.utils.side_effects import collect_publish_side_effects, defer_or_run, get_active_collector
+
+
+class PublishSideEffectsTestCase(TestCase):
+    def test_runs_immediately_without_collector(self):
+        handler = mock.Mock()
+        defer_or_run(handler, "a")
+        handler.assert_called_once_with(["a"])
+
+    def test_merges_and_deduplicates_after_commit(self):
+        handler = mock.Mock()
+        with self.captureOnCommitCallbacks(execute=True):
+            with collect_publish_side_effects():
+                self.assertIsNotNone(get_active_collector())
+                defer_or_run(handler, "a", key=1)
+                defer_or_run(handler, "b", key=2)
+                defer_or_run(handler, "a", key=1)
+            handler.assert_not_called()
+
+        self.assertIsNone(get_active_collector())
+        handler.assert_called_once_with(["a", "b"])
+
+    def test_nested_blocks_share_collector(self):
+        handler = mock.Mock()
+        with self.captureOnCommitCallbacks(execute=True), collect_publish_side_effects() as outer:
+            with collect_publish_side_effects() as inner:
+                defer_or_run(handler, "a")
+            self.assertIs(inner, outer)
+            defer_or_run(handler, "b")
+
+        handler.assert_called_once_with(["a", "b"])
+
+    def test_rolled_back_work_is_discarded(self):
+        handler = mock.Mock()
+        with self.captureOnCommitCallbacks(execute=True), collect_publish_side_effects():
+            defer_or_run(handler, "a")
+            with self.assertRaises(ValueError), transaction.atomic():
+                defer_or_run(handler, "b")
+                raise ValueError
+
+        handler.assert_called_once_with(["a"])
+
+    def test_failing_handler_does_not_block_others(self):
+        failing_handler = mock.Mock(side_effect=ValueError, __qualname__="failing_handler")
+        handler = mock.Mock()
+        with (
+            self.assertLogs("ons_alpha.utils.side_effects", "ERROR"),
+            self.captureOnCommitCallbacks(execute=True),
+            collect_publish_side_effects(),
+        ):
+            defer_or_run(failing_handler, "a")
+            defer_or_run(handler, "b")
+
+        handler.assert_called_once_with(["b"])
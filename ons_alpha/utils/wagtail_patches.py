@@ -0,0 +1,65 @@
+from collections import defaultdict
+
+from django.apps import apps
+
+from ons_alpha.utils.side_effects import defer_or_run, get_active_collector
+
+
+def purge_pages_from_cache(pages):
+    from wagtail.contrib.frontend_cache.utils import (  # pylint: disable=import-outside-toplevel
+        purge_pages_from_cache as wagtail_purge_pages_from_cache,
+    )
+
+    wagtail_purge_pages_from_cache(pages)
+
+
+def update_search_index(items):
+    from wagtail.search import index  # pylint: disable=import-outside-toplevel
+
+    pks_by_model = defaultdict(list)
+    for model, pk in items:
+        pks_by_model[model].append(pk)
+
+    # fetch fresh copies, so that only the committed state gets indexed
+    for model, pks in pks_by_model.items():
+        for instance in model.objects.filter(pk__in=pks):
+            index.insert_or_update_object(instance)
+
+
+def patch_frontend_cache_signal_handlers():
+    """
+    Patches the front-end cache app's page published/unpublished signal handlers,
+    so that purges triggered while publishing a set of pages together are sent as
+    a single batch once the changes have been committed.
+    """
+    if not apps.is_installed("wagtail.contrib.frontend_cache"):
+        return
+
+    from wagtail.contrib.frontend_cache import signal_handlers  # pylint: disable=import-outside-toplevel
+
+    def purge_page_from_cache(page, backend_settings=None, backends=None):
+        defer_or_run(purge_pages_from_cache, page, key=page.pk)
+
+    signal_handlers.purge_page_from_cache = purge_page_from_cache
+
+
+def patch_search_signal_handlers():
+    """
+    Patches Wagtail's search index `post_save` signal handler, so that index updates
+    triggered while publishing a set of pages together are deferred until the
+    changes have been committed. Must be applied before `wagtail.search` registers
+    its signal handlers.
+    """
+    from wagtail.search import signal_handlers  # pylint: disable=import-outside-toplevel
+
+    original_post_save_signal_handler = signal_handlers.post_save_signal_handler
+
+    def post_save_signal_handler(instance, update_fields=None, **kwargs):
+        if get_active_collector() is None:
+            original_post_save_signal_handler(instance, update_fields=update_fields, **kwargs)
+            return
+
+        key = (type(instance), instance.pk)
+        defer_or_run(update_search_index, key, key=key)
+
+    signal_handlers.post_save_signal_handler = post_save_signal_handler